@@ -2,47 +2,110 @@
 
 import math
 import random
-import turtle
+from ball_system import BallSystem, CONTACT_TOLERANCE, MIN_CLOSING_SPEED, MAX_PADDLE_STEPS
 from paddle import Paddle
 
+
+def _system_view(field: str):
+    """
+    A property reading and writing one of the BallSystem arrays at the ball's index,
+    lets the methods of Ball use the arrays as if they were plain attributes.
+    """
+    def getter(ball):
+        return getattr(ball._system, field).item(ball._index)
+
+    def setter(ball, value):
+        getattr(ball._system, field)[ball._index] = value
+
+    return property(getter, setter)
+
+
+# number of colors in a gradient's palette
+_PALETTE_SIZE = 64
+# kinetic energies mapped to the first and last color of the gradient
+_MIN_ENERGY = 8000
+_MAX_ENERGY = 1000000
+# palettes already computed, by gradient
+_PALETTES = {}
+# fastest a paddle hit sends a ball, as a multiple of its base speed
+MAX_SPEED_FACTOR = 4
+
+
+def _palette(color_gradient: list):
+    """
+    Returns the palette of a gradient: _PALETTE_SIZE colors going linearly from its
+    first color to its second one, computed once per gradient and shared by the balls.
+    """
+    key = (tuple(color_gradient[0]), tuple(color_gradient[1]))
+    palette = _PALETTES.get(key)
+    if palette is None:
+        start, end = key
+        palette = [tuple(int(start[c] + (end[c] - start[c]) * i / (_PALETTE_SIZE - 1))
+                         for c in range(3))
+                   for i in range(_PALETTE_SIZE)]
+        _PALETTES[key] = palette
+    return palette
+
+
 class Ball:
     """
     Represents a ball in the game with physics properties and collision detection.
 
+    The ball doesn't move on every event: it only stores its position at a reference
+    time along with its velocity, positions at any other time are computed on demand.
+    The reference is moved whenever the velocity changes.
+
+    The kinematic state itself (_t0, _x0, _y0, _vx, _vy, _size, _mass) lives in
+    the arrays of a BallSystem, the ball is a view on one index of them.
+
     Attributes:
         # _uid (int): Unique ID
+        # _system (BallSystem) <<GET>>: System storing the state of the ball
+        # _index (int) <<GET>>: Index of the ball in its system
         # _size (float) <<GET>>: Radius of the ball
         # _mass (float) <<GET>>: Mass of the ball
         # _count (int) <<GET>>: Event count
-        # _x (float) <<GET, SET>>: X position
-        # _y (float) <<GET, SET>>: Y position
-        # _vx (float) <<GET, SET>>: X velocity
-        # _vy (float) <<GET, <SET>>: Y velocity
-        # _color (tuple): RGB color
+        # _t0 (float) <<GET>>: Reference time the position below was taken at
+        # _x0 (float): X position at the reference time
+        # _y0 (float): Y position at the reference time
+        # _vx (float) <<GET>>: X velocity
+        # _vy (float) <<GET>>: Y velocity
+        # _color (tuple) <<GET>>: RGB color
         # _count (int): Collision counter
         # _size_range (list): Range of radius of the ball
         # _color_gradient (list): List of 2 colors of the gradient
                                 ex. [(255, 0, 255), (100, 255, 0)]
+        # _palette (list): Colors of the gradient, indexed by kinetic energy level
+        # _rng (Random): Random generator of the respawns, shared by the balls of a match
 
     Methods:
-        + draw(): Draw the ball at its current position and color
-        + move(dt): Update ball position based on velocity and time step
-        + bounce_off_horizontal_wall(): Handle collision with top/bottom walls
-        + bounce_off_ball(Ball): Handle collision with another ball
-        + bounce_off_paddle(Paddle): Handle collision with a paddle
-        + respawn(): Reset ball position, size and velocity
+        + pos_at(float): Position of the ball at a given time
+        + rebase(float): Move the reference time (and position) of the ball
+        + restore(float, float, float, float, float, float): Set the kinematic state of the ball
+        + bounce_off_horizontal_wall(float): Handle collision with top/bottom walls
+        + bounce_off_ball(Ball, float): Handle collision with another ball
+        + bounce_off_paddle(Paddle, float): Handle collision with a paddle, moving or not
+        + respawn(float): Reset ball position, size and velocity
         + update_color(): Update ball color based on kinetic energy
-        + time_to_hit_ball(Ball): Predict time until collision with another ball
-        + time_to_hit_horizontal_wall(): Predict time until wall collision
-        + time_to_hit_paddle_horizontal(Paddle): Predict time until paddle collision
-        + time_to_leave_border(): Predict time until leaving game border
-        - __rotate_xy_around_pivot(list, list, float): Helper for paddle collision calculations
+        + time_to_hit_ball(Ball, float): Predict time until collision with another ball
+        + time_to_hit_horizontal_wall(float, float): Predict time until wall collision
+        + time_to_leave_border(float, float): Predict time until leaving game border
+        + time_to_hit_paddle(Paddle, float, float): Predict time until hitting a moving paddle
+        - __limit_speed(float, float, float): Slow down to the speed limit, still leaving a paddle
+        - __kinematics(): Reference time, position, velocity and size read from the system at once
+        - __paddle_gap(Paddle, float, tuple, tuple): Gap to a paddle and a bound on its rate of change
+        - __paddle_contact(Paddle, float, tuple): Gap, contact normal and closing speed with a paddle
     """
 
+    __slots__ = ("_size_range", "_base_speed", "_count", "_uid",
+                 "_color_gradient", "_palette", "_color", "_system", "_index", "_rng")
+
     def __init__(self, size_range: list,
                  uid: int,
                  base_speed: float,
-                 color_gradient: list=None):
+                 color_gradient: list=None,
+                 system: BallSystem=None,
+                 rng: random.Random=None):
         """
         Initialize a ball with given parameters.
 
@@ -52,59 +115,65 @@ class Ball:
             base_speed (float): Initial speed
             border_size (list): [width, height] of game border
             color_gradient (list): List of RGB colors for gradient (2 colors)
+            system (BallSystem, optional): System to store the ball's state in.
+                                           Defaults to a new system of its own.
+            rng (Random, optional): Random generator of the respawns' angles and sizes.
+                                    Defaults to a new unseeded generator.
         """
         if color_gradient is None:
             color_gradient = [(200, 230, 255), (230, 20, 20)]
+        if system is None:
+            system = BallSystem(1)
+        if rng is None:
+            rng = random.Random()
+
+        self._system = system
+        self._index = system.register(self)
+        self._rng = rng
 
         self._size_range = size_range
         self._base_speed = base_speed
         self._count = 0
         self._uid = uid
         self._color_gradient = color_gradient
-        self._color = self._color_gradient[0]
+        self._palette = _palette(color_gradient)
+        self._color = self._palette[0]
 
-        self.respawn()
+        self.respawn(0.0)
 
-    @property
-    def x(self):
-        """X position getter"""
-        return self._x
+    _t0 = _system_view("t0")
+    _x0 = _system_view("x0")
+    _y0 = _system_view("y0")
+    _vx = _system_view("vx")
+    _vy = _system_view("vy")
+    _size = _system_view("size")
+    _mass = _system_view("mass")
 
-    @x.setter
-    def x(self, x):
-        """X position setter"""
-        self._x = x
+    @property
+    def system(self):
+        """Getter for the system storing the state of the ball"""
+        return self._system
 
     @property
-    def y(self):
-        """Y position getter"""
-        return self._y
+    def index(self):
+        """Getter for the index of the ball in its system"""
+        return self._index
 
-    @y.setter
-    def y(self, y):
-        """Y position setter"""
-        self._y = y
+    @property
+    def t0(self):
+        """Reference time getter"""
+        return self._t0
 
     @property
     def vx(self):
         """X signed velocity getter"""
         return self._vx
 
-    @vx.setter
-    def vx(self, vx):
-        """X signed velocity setter"""
-        self._vx = vx
-
     @property
     def vy(self):
         """Y signed velocity getter"""
         return self._vy
 
-    @vy.setter
-    def vy(self, vy):
-        """Y signed velocity setter"""
-        self._vy = vy
-
     @property
     def mass(self):
         """ Ball's mass getter"""
@@ -115,44 +184,84 @@ class Ball:
         """ Ball's size getter"""
         return self._size
 
+    @property
+    def color(self):
+        """ Ball's RGB color getter"""
+        return self._color
+
     @property
     def count(self):
         """ Ball's number of finished event getter"""
         return self._count
 
-    def draw(self):
-        """Draw the ball at its position and current color"""
-        turtle.penup()
-        turtle.pensize(0)
-        turtle.color(self._color)
-        turtle.fillcolor(self._color)
-        turtle.goto(self.x, self.y-self.size)
-        turtle.setheading(0)
-        turtle.pendown()
-        turtle.begin_fill()
-        turtle.circle(self.size)
-        turtle.end_fill()
-
-    def move(self, dt: float):
-        """Update the ball position based on its velocities."""
-        self.x += self.vx*dt
-        self.y += self.vy*dt
-
-    def bounce_off_horizontal_wall(self):
-        """Invert the y velocity, use when hitting the top or bottom of the border."""
-        self.vy = -self.vy
+    def pos_at(self, t: float):
+        """
+        Returns the position of the ball at a given time.
+
+        Args:
+            t (float): Simulation time
+
+        Returns:
+            tuple: (x, y) position
+        """
+        dt = t - self._t0
+        return self._x0 + self._vx*dt, self._y0 + self._vy*dt
+
+    def rebase(self, t: float):
+        """
+        Move the reference time of the ball to t, must be done before changing its velocity.
+
+        Args:
+            t (float): Simulation time
+        """
+        self._x0, self._y0 = self.pos_at(t)
+        self._t0 = t
+
+    def restore(self, t0: float, x0: float, y0: float, vx: float, vy: float, size: float):
+        """
+        Set the kinematic state of the ball, ex. from a replay, and its mass and color.
+
+        Args:
+            t0 (float): Reference time
+            x0 (float): X position at the reference time
+            y0 (float): Y position at the reference time
+            vx (float): X velocity
+            vy (float): Y velocity
+            size (float): Radius of the ball
+        """
+        self._t0 = t0
+        self._x0 = x0
+        self._y0 = y0
+        self._vx = vx
+        self._vy = vy
+        self._size = size
+        self._mass = math.pi * size**2
+        self.update_color()
+
+    def bounce_off_horizontal_wall(self, t: float):
+        """
+        Invert the y velocity, use when hitting the top or bottom of the border.
+
+        Args:
+            t (float): Simulation time of the collision
+        """
+        self.rebase(t)
+        self._vy = -self._vy
         self._count += 1
         self.update_color()
 
-    def bounce_off_ball(self, that):
+    def bounce_off_ball(self, that, t: float):
         """
         Handle collision physics between two balls.
 
         Args:
             that (Ball): The other ball involved in collision
+            t (float): Simulation time of the collision
         """
-        dx = that.x - self.x
-        dy = that.y - self.y
+        self.rebase(t)
+        that.rebase(t)
+        dx = that._x0 - self._x0
+        dy = that._y0 - self._y0
         dvx = that.vx - self.vx
         dvy = that.vy - self.vy
         dvdr = dx*dvx + dy*dvy  # dv dot dr
@@ -166,10 +275,10 @@ class Ball:
         fy = magnitude * dy / dist
 
         # update velocities according to normal force
-        self.vx += fx / self.mass
-        self.vy += fy / self.mass
-        that.vx -= fx / that.mass
-        that.vy -= fy / that.mass
+        self._vx += fx / self.mass
+        self._vy += fy / self.mass
+        that._vx -= fx / that.mass
+        that._vy -= fy / that.mass
 
         # update collision counts
         self._count += 1
@@ -177,48 +286,79 @@ class Ball:
         self.update_color()
         that.update_color()
 
-    def bounce_off_paddle(self, paddle: Paddle):
+    def bounce_off_paddle(self, paddle: Paddle, t: float):
         """
-        Handle the collision physics between the ball and a paddle.
+        Handle the collision physics between the ball and a paddle: the velocity,
+        relative to the moving surface of the paddle, is reflected about the normal
+        at the closest point of the paddle (on a side, an end, or a corner of it).
+        A ball the paddle turned into is first pushed back out onto its surface.
+        Every hit speeds the ball up, until MAX_SPEED_FACTOR times its base speed.
 
         Args:
             that (Paddle): The paddle involved in collision
-        """
-        magic_x, magic_y = self.__rotate_xy_around_pivot(
-            [self.x, self.y], [paddle.x, paddle.y], -paddle.angle_deg)
-        magic_vx, magic_vy = self.__rotate_xy_around_pivot(
-            [self.vx, self.vy], [0, 0], -paddle.angle_deg)
-
-        dx = abs(magic_x - paddle.x) - self.size - paddle.width/2
-        dy = abs(magic_y - paddle.y) - self.size - paddle.height/2
+            t (float): Simulation time of the collision
 
-        if dx > dy:
-            magic_vx = -magic_vx
-        else:
-            magic_vy = -magic_vy
-
-        # Convert velocity back to world coordinates
-        self.vx, self.vy = self.__rotate_xy_around_pivot(
-            [magic_vx, magic_vy], [0, 0], paddle.angle_deg)
-
-        # Add some randomization to make it more interesting
-        current_angle_rad = math.atan2(self.vy, self.vx)
-        self.vx += self._base_speed * math.cos(current_angle_rad) * 0.1
-        self.vy += self._base_speed * math.sin(current_angle_rad) * 0.1
+        Returns:
+            bool: True if the ball bounced, False if it wasn't closing in on the paddle
+                  (ex. a prediction that ran out of steps while they were in contact)
+        """
+        self.rebase(t)
         self._count += 1
+        gap, normal_x, normal_y, closing = self.__paddle_contact(paddle, t, self.__kinematics())
+        if gap < 0:
+            self._x0 -= gap*normal_x
+            self._y0 -= gap*normal_y
+        if closing >= -MIN_CLOSING_SPEED:
+            return False
+
+        # Add some randomization to make it more interesting, before the reflection
+        # so the ball always leaves the paddle
+        current_angle_rad = math.atan2(self._vy, self._vx)
+        self._vx += self._base_speed * math.cos(current_angle_rad) * 0.1
+        self._vy += self._base_speed * math.sin(current_angle_rad) * 0.1
+
+        _, normal_x, normal_y, closing = self.__paddle_contact(paddle, t, self.__kinematics())
+        if closing < 0:
+            self._vx -= 2*closing*normal_x
+            self._vy -= 2*closing*normal_y
+            self.__limit_speed(normal_x, normal_y, -closing)
 
         self.update_color()
+        return True
 
-    def time_to_hit_ball(self, that):
+    def __limit_speed(self, normal_x: float, normal_y: float, leaving: float):
+        """
+        Slow the ball down to MAX_SPEED_FACTOR times its base speed after a paddle hit,
+        but no further than it takes to keep leaving the paddle's surface, so a fast
+        paddle doesn't catch it again right away.
+        """
+        speed = math.hypot(self._vx, self._vy)
+        max_speed = self._base_speed * MAX_SPEED_FACTOR
+        if speed <= max_speed:
+            return
+        scale = max_speed / speed
+        normal_speed = self._vx*normal_x + self._vy*normal_y
+        if normal_speed > 0:
+            # the surface moves away at normal_speed - leaving, outrun it by a margin
+            surface_speed = normal_speed - leaving
+            margin = min(leaving, max_speed) / 2
+            scale = max(scale, (surface_speed + margin) / normal_speed)
+        self._vx *= scale
+        self._vy *= scale
+
+    def time_to_hit_ball(self, that, t: float):
         """ Returns the predicted time the ball will collide with another ball.
         
         Args:
             that (Ball): The other ball involved in collision
+            t (float): Simulation time the prediction is made at
         """
         if self is that:
             return math.inf
-        dx = that.x - self.x
-        dy = that.y - self.y
+        x, y = self.pos_at(t)
+        that_x, that_y = that.pos_at(t)
+        dx = that_x - x
+        dy = that_y - y
         dvx = that.vx - self.vx
         dvy = that.vy - self.vy
         dvdr = dx*dvx + dy*dvy
@@ -242,133 +382,201 @@ class Ball:
 
         return t
 
-    def time_to_leave_border(self, border_width):
+    def time_to_leave_border(self, border_width, t: float):
         """ Returns the predicted time the ball will leave the border (left/right)."""
+        x = self._x0 + self._vx*(t - self._t0)
         if self.vx > 0:
-            return (border_width - self.x + self.size) / self.vx
+            return (border_width - x + self.size) / self.vx
         elif self.vx < 0:
-            return (border_width + self.x + self.size) / (-self.vx)
+            return (border_width + x + self.size) / (-self.vx)
         else:
             return math.inf
 
-    def time_to_hit_horizontal_wall(self, border_height):
+    def time_to_hit_horizontal_wall(self, border_height, t: float):
         """ Returns the predicted time the ball will hit the border (top/bottom)."""
+        y = self._y0 + self._vy*(t - self._t0)
         if self.vy > 0:
-            return (border_height - self.y - self.size) / self.vy
+            return (border_height - y - self.size) / self.vy
         elif self.vy < 0:
-            return (border_height + self.y - self.size) / (-self.vy)
+            return (border_height + y - self.size) / (-self.vy)
         else:
             return math.inf
 
-    def __rotate_xy_around_pivot(self, xy: list, pivot: list, angle_add: float):
+    def __kinematics(self):
         """
-        Rotate the (x,y) coordinate around a pivot with a given amount of angle
-        
-        Args:
-            x (float): X coordinate before rotation
-            y (float): Y coordinate before rotation
-            pivot_x (float): X coordinate of the pivot
-            pivot_y (float): Y coordinate of the pivot
-            angle_add (float): Amount of angle to rotate (anti-clockwise, in degrees)
+        Returns the reference time, position, velocity and size of the ball as plain
+        floats, read from the arrays of its system at once, for the loops that use them
+        many times.
         """
-        x = xy[0]
-        y = xy[1]
-        pivot_x = pivot[0]
-        pivot_y = pivot[1]
-
-        angle_add = math.radians(angle_add)
-        angle_origin = math.atan2((y - pivot_y), (x - pivot_x))
-
-        radius = math.dist([x, y], [pivot_x, pivot_y])
-
-        final_y = radius * math.sin(angle_origin + angle_add) + pivot_y
-        final_x = radius * math.cos(angle_origin + angle_add) + pivot_x
-        return final_x, final_y
-
-    def time_to_hit_paddle_horizontal(self, paddle: Paddle):
-        """ Returns the predicted time the ball will hit the left or right side of the paddle"""
-        magic_x, magic_y = self.__rotate_xy_around_pivot(
-            [self.x, self.y], [paddle.x, paddle.y], -paddle.angle_deg)
-        magic_vx, magic_vy = self.__rotate_xy_around_pivot(
-            [self.vx, self.vy], [0, 0], -paddle.angle_deg)
-
-        if (magic_vx > 0) and ((magic_x + self.size) > (paddle.x - paddle.width/2)):
-            return math.inf
-        if (magic_vx < 0) and ((magic_x - self.size) < (paddle.x + paddle.width/2)):
-            return math.inf
-
-        dtx = (abs(paddle.x - magic_x) - self.size - paddle.width/2) / abs(magic_vx)
+        system = self._system
+        i = self._index
+        return (system.t0.item(i), system.x0.item(i), system.y0.item(i),
+                system.vx.item(i), system.vy.item(i), system.size.item(i))
 
-        paddle_bottom_edge = paddle.y - paddle.height/2
-        paddle_top_edge = paddle.y + paddle.height/2
-
-        if paddle_bottom_edge - self.size <= magic_y + (magic_vy*dtx) <= paddle_top_edge + self.size:
-            return dtx
+    def __paddle_gap(self, paddle: Paddle, t: float, kinematics: tuple, shape: tuple):
+        """
+        Returns the gap between the ball and a paddle at a given time (negative if they
+        overlap), using the distance to the paddle's rectangle so corners are rounded,
+        and a bound on how fast that gap can change from then on. The shape holds what
+        doesn't change along the search: the paddle's x position, half width, half
+        height and half diagonal, and the ball's speed.
+        """
+        t0, x0, y0, vx, vy, size = kinematics
+        paddle_x, half_width, half_height, half_diagonal, speed = shape
+        paddle_y, angle, paddle_vy, omega = paddle.motion_at(t)
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        dx = x0 + vx*(t - t0) - paddle_x
+        dy = y0 + vy*(t - t0) - paddle_y
+        # distance from the rectangle in the paddle's frame, where it stands upright
+        qx = abs(cos_a*dx + sin_a*dy) - half_width
+        qy = abs(cos_a*dy - sin_a*dx) - half_height
+        distance = math.hypot(max(qx, 0.0), max(qy, 0.0)) + min(max(qx, qy), 0.0)
+
+        bound = speed + abs(paddle_vy) + abs(omega)*half_diagonal
+        return distance - size, bound
+
+    def __paddle_contact(self, paddle: Paddle, t: float, kinematics: tuple):
+        """
+        Returns the gap between the ball and a paddle at a given time (negative if they
+        overlap), the normal at the closest point of the paddle's rectangle (on a side,
+        an end, or a corner of the paddle), and the speed at which the ball closes in
+        along it on the paddle's surface moving at that point (negative when closing in).
+        """
+        t0, x0, y0, vx, vy, size = kinematics
+        paddle_y, angle, paddle_vy, omega = paddle.motion_at(t)
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        dx = x0 + vx*(t - t0) - paddle.x
+        dy = float(y0 + vy*(t - t0) - paddle_y)
+        magic_x = cos_a*dx + sin_a*dy
+        magic_y = cos_a*dy - sin_a*dx
+
+        # closest point of the rectangle and normal there, in the paddle's frame
+        half_width = paddle.width/2
+        half_height = paddle.height/2
+        depth_x = half_width - abs(magic_x)
+        depth_y = half_height - abs(magic_y)
+        if depth_x >= 0 and depth_y >= 0:
+            # the center is inside, the closest point is on the nearest side or end
+            if depth_x < depth_y:
+                point_x, point_y = math.copysign(half_width, magic_x), magic_y
+                normal_x, normal_y = math.copysign(1.0, magic_x), 0.0
+            else:
+                point_x, point_y = magic_x, math.copysign(half_height, magic_y)
+                normal_x, normal_y = 0.0, math.copysign(1.0, magic_y)
+            distance = -min(depth_x, depth_y)
         else:
-            return math.inf
-
-    def time_to_hit_paddle_vertical(self, paddle: Paddle):
-        """ Returns the predicted time the ball will hit the top or bottom side of the paddle"""
-        magic_x, magic_y = self.__rotate_xy_around_pivot(
-            [self.x, self.y], [paddle.x, paddle.y], -paddle.angle_deg)
-        magic_vx, magic_vy = self.__rotate_xy_around_pivot(
-            [self.vx, self.vy], [0, 0], -paddle.angle_deg)
-
-        if (magic_vy > 0) and ((magic_y + self.size) > (paddle.y - paddle.height/2)):
-            return math.inf
-        if (magic_vy < 0) and ((magic_y - self.size) < (paddle.y + paddle.height/2)):
-            return math.inf
-
-        if magic_vy == 0:
-            return math.inf
-        dty = (abs(paddle.y - magic_y) - self.size - paddle.height/2) / abs(magic_vy)
-
-        paddle_left_edge = paddle.x - paddle.width/2
-        paddle_right_edge = paddle.x + paddle.width/2
+            point_x = max(-half_width, min(half_width, magic_x))
+            point_y = max(-half_height, min(half_height, magic_y))
+            distance = math.hypot(magic_x - point_x, magic_y - point_y)
+            normal_x = (magic_x - point_x) / distance
+            normal_y = (magic_y - point_y) / distance
+        normal_x, normal_y = cos_a*normal_x - sin_a*normal_y, sin_a*normal_x + cos_a*normal_y
+        point_x, point_y = cos_a*point_x - sin_a*point_y, sin_a*point_x + cos_a*point_y
+
+        # velocity of the paddle's surface at the closest point
+        surface_vx = -float(omega)*point_y
+        surface_vy = float(paddle_vy) + float(omega)*point_x
+        closing = (vx - surface_vx)*normal_x + (vy - surface_vy)*normal_y
+        return distance - size, normal_x, normal_y, closing
+
+    def time_to_hit_paddle(self, paddle: Paddle, t: float, horizon: float=math.inf):
+        """
+        Returns the predicted time the ball will hit the paddle, following the paddle
+        along its path (moving and tilting) rather than freezing it.
+
+        Conservative advancement: the gap between them can't shrink faster than the
+        ball's speed plus the fastest any point of the paddle moves, so the clock is
+        advanced by gap / bound until they touch. Only the window during which the ball
+        is close enough to the paddle in x is searched, up to the horizon. A touch only
+        counts if they are closing in, so a ball that just bounced isn't hit again, but
+        an overlap deeper than the tolerance always does. Running out of steps never
+        means they don't collide: the time reached is returned instead, so the engine
+        queues a paddle event there that bounces nothing and predicts again from it.
+        This takes a ball sliding along a paddle or grazing one that still turns, so
+        such a prediction doesn't last until either of them changes course.
 
-        if paddle_left_edge - self.size <= magic_x + (magic_vx*dty) <= paddle_right_edge + self.size:
-            return dty
+        Args:
+            paddle (Paddle): The paddle to predict against
+            t (float): Simulation time the prediction is made at
+            horizon (float, optional): Time from t after which the ball is predicted
+                                       again anyway, ex. at its next wall event.
+                                       Defaults to no horizon.
+        """
+        kinematics = self.__kinematics()
+        t0, x0, _, vx, vy, size = kinematics
+        x = x0 + vx*(t - t0)
+        half_diagonal = math.hypot(paddle.width/2, paddle.height/2)
+        reach = half_diagonal + size
+        if vx == 0:
+            if abs(x - paddle.x) > reach:
+                return math.inf
+            start, end = 0.0, math.inf
         else:
+            start, end = sorted(((paddle.x - reach - x) / vx, (paddle.x + reach - x) / vx))
+            start = max(start, 0.0)
+        end = min(end, horizon)
+        if end < start:
             return math.inf
 
-    def respawn(self):
-        """ Reset the position, size and velocity of the ball"""
-        angle_rad = math.radians(random.randint(0, 360))
-        self._x = 0
-        self._y = 0
+        shape = (paddle.x, paddle.width/2, paddle.height/2, half_diagonal, math.hypot(vx, vy))
+        dt = start
+        for _ in range(MAX_PADDLE_STEPS):
+            if dt > end:
+                return math.inf
+            gap, bound = self.__paddle_gap(paddle, t + dt, kinematics, shape)
+            if gap < -CONTACT_TOLERANCE:
+                # overlapping, ex. the paddle turned into the ball: hit now to push it out
+                return dt
+            if bound == 0:
+                return math.inf
+            if gap <= CONTACT_TOLERANCE:
+                if self.__paddle_contact(paddle, t + dt, kinematics)[3] < -MIN_CLOSING_SPEED:
+                    return dt
+                # touching but moving apart, step past the contact
+                dt += 2*CONTACT_TOLERANCE / bound
+            else:
+                dt += gap / bound
+        # still in reach after every step, ex. sliding along the paddle: stop there,
+        # the bounce finds out whether they close in and the search goes on from it
+        return dt if dt <= end else math.inf
+
+    def respawn(self, t: float):
+        """
+        Reset the position, size and velocity of the ball
+
+        Args:
+            t (float): Simulation time of the respawn
+        """
+        angle_rad = math.radians(self._rng.randint(0, 360))
+        self._t0 = t
+        self._x0 = 0
+        self._y0 = 0
         self._vx = self._base_speed * math.cos(angle_rad)
         self._vy = self._base_speed * math.sin(angle_rad)
-        self._size = random.randint(self._size_range[0], self._size_range[1])
+        self._size = self._rng.randint(self._size_range[0], self._size_range[1])
         self._mass = math.pi * self.size**2
         self._count += 1
         self.update_color()
 
     def update_color(self):
         """
-        Linearly change the color of the ball based on its kenetic energy
-        by using its gradient colors
+        Change the color of the ball based on its kenetic energy, picking it
+        from the palette of its gradient colors
         """
-        current_speed = math.dist([0, 0], [self.vx, self.vy])
-        current_energy = (1/2) * self.mass * current_speed**2
-        min_energy = 8000
-        max_energy = 1000000
-        gradient_multiplier = (current_energy - min_energy) / \
-            (max_energy - min_energy)
-
-        dr = self._color_gradient[1][0] - self._color_gradient[0][0]
-        dg = self._color_gradient[1][1] - self._color_gradient[0][1]
-        db = self._color_gradient[1][2] - self._color_gradient[0][2]
-
-        if gradient_multiplier > 1:
-            gradient_multiplier = 1
-        elif gradient_multiplier < 0:
-            gradient_multiplier = 0
+        vx = self._vx
+        vy = self._vy
+        current_energy = 0.5 * self._mass * (vx*vx + vy*vy)
+        level = int((current_energy - _MIN_ENERGY) * (_PALETTE_SIZE - 1)
+                    / (_MAX_ENERGY - _MIN_ENERGY) + 0.5)
 
-        red = int(self._color_gradient[0][0] + dr*gradient_multiplier)
-        green = int(self._color_gradient[0][1] + dg*gradient_multiplier)
-        blue = int(self._color_gradient[0][2] + db*gradient_multiplier)
+        if level >= _PALETTE_SIZE:
+            level = _PALETTE_SIZE - 1
+        elif level < 0:
+            level = 0
 
-        self._color = (red, green, blue)
+        self._color = self._palette[level]
 
     def __str__(self):
-        return f"ball id={self._uid} pos=({self.x:.2f}, {self.y:.2f}) v=({self.vx:.2f}, {self.vy:.2f}) count={self._count}"
+        return f"ball id={self._uid} pos=({self._x0:.2f}, {self._y0:.2f}) t0={self._t0:.2f} v=({self.vx:.2f}, {self.vy:.2f}) count={self._count}"
@@ -0,0 +1,345 @@
+""" Module providing BallSystem class, the state of every ball stored in NumPy arrays"""
+
+import math
+
+import numpy as np
+
+# gap under which a ball touches a paddle
+CONTACT_TOLERANCE = 1e-3
+# speed under which a ball and a paddle in contact aren't considered closing in
+MIN_CLOSING_SPEED = 1e-6
+# most conservative advancement steps taken to predict a ball-paddle collision
+MAX_PADDLE_STEPS = 100
+# fewest balls within reach of a paddle for which the vectorized search beats the
+# scalar one, a NumPy step costs about as much as a scalar one on a dozen balls
+MIN_VECTOR_PADDLE_BALLS = 12
+
+class BallSystem:
+    """
+    Stores the kinematic state of a set of balls as contiguous NumPy arrays
+    (structure of arrays) and predicts their collisions in vectorized form.
+
+    Each Ball is a thin view on one index of these arrays, so the scalar methods
+    of Ball and the vectorized ones here always see the same state. Positions
+    follow the same lazy scheme as Ball: x = x0 + vx * (t - t0).
+
+    Attributes:
+        # _capacity (int) <<GET>>: Maximum number of balls
+        # _balls (list) <<GET>>: Ball objects, in index order
+        + t0 (ndarray): Reference time of each ball
+        + x0 (ndarray): X position of each ball at its reference time
+        + y0 (ndarray): Y position of each ball at its reference time
+        + vx (ndarray): X velocity of each ball
+        + vy (ndarray): Y velocity of each ball
+        + size (ndarray): Radius of each ball
+        + mass (ndarray): Mass of each ball
+
+    Methods:
+        + register(Ball): Give a ball the next free index
+        + state(): Kinematic state of every ball as a single array
+        + load_state(ndarray): Set the kinematic state of every ball
+        + positions_at(float, ndarray): X and Y positions at a given time
+        + time_to_hit_balls(int, float, ndarray): Collision times of one ball against others
+        + time_to_hit_horizontal_wall(float, float): Wall collision times of every ball
+        + time_to_leave_border(float, float): Leaving times of every ball
+        + time_to_hit_paddle(Paddle, float, ndarray): Paddle collision times of every ball
+        - __paddle_gap(Paddle, ndarray, ndarray, ndarray): Gaps to a paddle and bounds on their rates
+        - __paddle_closing(Paddle, ndarray, ndarray): Speeds at which balls close in on a paddle
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity (int): Maximum number of balls
+        """
+        self._capacity = capacity
+        self._balls = []
+        self.t0 = np.zeros(capacity)
+        self.x0 = np.zeros(capacity)
+        self.y0 = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.mass = np.zeros(capacity)
+
+    @property
+    def capacity(self):
+        """Getter for the maximum number of balls"""
+        return self._capacity
+
+    @property
+    def balls(self):
+        """Getter for the balls, in index order"""
+        return self._balls
+
+    def __len__(self):
+        return len(self._balls)
+
+    def register(self, ball):
+        """
+        Give a ball the next free index in the arrays.
+
+        Args:
+            ball (Ball): The ball to register
+
+        Returns:
+            int: Index of the ball
+
+        Raises:
+            ValueError: If the system is already full
+        """
+        if len(self._balls) >= self._capacity:
+            raise ValueError(f"BallSystem is full ({self._capacity} balls)")
+        self._balls.append(ball)
+        return len(self._balls) - 1
+
+    def state(self):
+        """
+        Returns the kinematic state of every ball, ex. to save it.
+
+        Returns:
+            ndarray: One (t0, x0, y0, vx, vy, size) row per ball
+        """
+        n = len(self._balls)
+        return np.column_stack((self.t0[:n], self.x0[:n], self.y0[:n],
+                                self.vx[:n], self.vy[:n], self.size[:n]))
+
+    def load_state(self, state: np.ndarray):
+        """
+        Set the kinematic state of every ball, the masses follow from the sizes.
+
+        Args:
+            state (ndarray): One (t0, x0, y0, vx, vy, size) row per ball, as given by state()
+        """
+        n = len(self._balls)
+        self.t0[:n], self.x0[:n], self.y0[:n], self.vx[:n], self.vy[:n], self.size[:n] = \
+            np.asarray(state).T
+        self.mass[:n] = math.pi * self.size[:n]**2
+
+    def positions_at(self, t: float, indices: np.ndarray=None):
+        """
+        Returns the positions of the balls at a given time.
+
+        Args:
+            t (float): Simulation time
+            indices (ndarray, optional): Indices of the balls. Defaults to every ball.
+
+        Returns:
+            tuple: (x, y) arrays of positions
+        """
+        n = len(self._balls)
+        if indices is None:
+            indices = slice(0, n)
+        dt = t - self.t0[indices]
+        return self.x0[indices] + self.vx[indices]*dt, self.y0[indices] + self.vy[indices]*dt
+
+    def time_to_hit_balls(self, i: int, t: float, indices: np.ndarray=None):
+        """
+        Vectorized Ball.time_to_hit_ball: the predicted times ball i will collide
+        with each of the other balls, math.inf where it never does.
+
+        Args:
+            i (int): Index of the ball to predict for
+            t (float): Simulation time the prediction is made at
+            indices (ndarray, optional): Indices of the other balls. Defaults to every ball.
+
+        Returns:
+            ndarray: Time until each collision, in the order of indices
+        """
+        if indices is None:
+            indices = np.arange(len(self._balls))
+        x, y = self.positions_at(t, indices)
+        dt_i = t - self.t0[i]
+        dx = x - (self.x0[i] + self.vx[i]*dt_i)
+        dy = y - (self.y0[i] + self.vy[i]*dt_i)
+        dvx = self.vx[indices] - self.vx[i]
+        dvy = self.vy[indices] - self.vy[i]
+        dvdr = dx*dvx + dy*dvy
+        dvdv = dvx*dvx + dvy*dvy
+        drdr = dx*dx + dy*dy
+        sigma = self.size[indices] + self.size[i]
+        d = (dvdr*dvdr) - dvdv * (drdr - sigma*sigma)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dt = -(dvdr + np.sqrt(d)) / dvdv
+        never = (dvdr > 0) | (dvdv == 0) | (d < 0) | ~(dt > 0) | (indices == i)
+        dt[never] = np.inf
+        return dt
+
+    def time_to_hit_horizontal_wall(self, border_height: float, t: float):
+        """
+        Vectorized Ball.time_to_hit_horizontal_wall for every ball.
+
+        Args:
+            border_height (float): Half of the height of the border
+            t (float): Simulation time the prediction is made at
+
+        Returns:
+            ndarray: Time until each ball hits the top or bottom wall
+        """
+        n = len(self._balls)
+        _, y = self.positions_at(t)
+        vy = self.vy[:n]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dt = np.where(vy > 0,
+                          (border_height - y - self.size[:n]) / vy,
+                          (border_height + y - self.size[:n]) / -vy)
+        dt[vy == 0] = np.inf
+        return dt
+
+    def time_to_leave_border(self, border_width: float, t: float):
+        """
+        Vectorized Ball.time_to_leave_border for every ball.
+
+        Args:
+            border_width (float): Half of the width of the border
+            t (float): Simulation time the prediction is made at
+
+        Returns:
+            ndarray: Time until each ball leaves the left or right side of the border
+        """
+        n = len(self._balls)
+        x, _ = self.positions_at(t)
+        vx = self.vx[:n]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dt = np.where(vx > 0,
+                          (border_width - x + self.size[:n]) / vx,
+                          (border_width + x + self.size[:n]) / -vx)
+        dt[vx == 0] = np.inf
+        return dt
+
+    def __paddle_gap(self, paddle, indices, t, speed):
+        """
+        Vectorized Ball.__paddle_gap: gaps between some balls and a paddle at their
+        own times, and bounds on how fast the gaps can change from then on.
+        """
+        paddle_y, angle, paddle_vy, omega = paddle.motion_at(t)
+        cos_a = np.cos(angle)
+        sin_a = np.sin(angle)
+        dx = self.x0[indices] + self.vx[indices]*(t - self.t0[indices]) - paddle.x
+        dy = self.y0[indices] + self.vy[indices]*(t - self.t0[indices]) - paddle_y
+        qx = np.abs(cos_a*dx + sin_a*dy) - paddle.width/2
+        qy = np.abs(cos_a*dy - sin_a*dx) - paddle.height/2
+        distance = (np.hypot(np.maximum(qx, 0.0), np.maximum(qy, 0.0))
+                    + np.minimum(np.maximum(qx, qy), 0.0))
+
+        half_diagonal = math.hypot(paddle.width/2, paddle.height/2)
+        bound = speed + np.abs(paddle_vy) + np.abs(omega)*half_diagonal
+        return distance - self.size[indices], bound
+
+    def __paddle_closing(self, paddle, indices, t):
+        """
+        Vectorized Ball.__paddle_contact: the speeds at which some balls close in on a
+        paddle along the normals at the closest points of its rectangle, relative to
+        its surface moving at those points, at the balls' own times.
+        """
+        paddle_y, angle, paddle_vy, omega = paddle.motion_at(t)
+        cos_a = np.cos(angle)
+        sin_a = np.sin(angle)
+        vx = self.vx[indices]
+        vy = self.vy[indices]
+        dx = self.x0[indices] + vx*(t - self.t0[indices]) - paddle.x
+        dy = self.y0[indices] + vy*(t - self.t0[indices]) - paddle_y
+        magic_x = cos_a*dx + sin_a*dy
+        magic_y = cos_a*dy - sin_a*dx
+
+        # closest point of the rectangle and normal there, in the paddle's frame:
+        # on the nearest side or end for the centers inside it
+        half_width = paddle.width/2
+        half_height = paddle.height/2
+        depth_x = half_width - np.abs(magic_x)
+        depth_y = half_height - np.abs(magic_y)
+        inside = (depth_x >= 0) & (depth_y >= 0)
+        on_side = inside & (depth_x < depth_y)
+        on_end = inside & ~on_side
+        point_x = np.where(on_side, np.copysign(half_width, magic_x),
+                           np.clip(magic_x, -half_width, half_width))
+        point_y = np.where(on_end, np.copysign(half_height, magic_y),
+                           np.clip(magic_y, -half_height, half_height))
+        offset_x = magic_x - point_x
+        offset_y = magic_y - point_y
+        length = np.where(inside, 1.0, np.hypot(offset_x, offset_y))
+        normal_x = np.where(on_side, np.copysign(1.0, magic_x),
+                            np.where(on_end, 0.0, offset_x / length))
+        normal_y = np.where(on_end, np.copysign(1.0, magic_y),
+                            np.where(on_side, 0.0, offset_y / length))
+        normal_x, normal_y = cos_a*normal_x - sin_a*normal_y, sin_a*normal_x + cos_a*normal_y
+        point_x, point_y = cos_a*point_x - sin_a*point_y, sin_a*point_x + cos_a*point_y
+
+        # velocity of the paddle's surface at the closest points
+        surface_vx = -omega*point_y
+        surface_vy = paddle_vy + omega*point_x
+        return (vx - surface_vx)*normal_x + (vy - surface_vy)*normal_y
+
+    def time_to_hit_paddle(self, paddle, t: float, horizon: np.ndarray=None):
+        """
+        Vectorized Ball.time_to_hit_paddle for every ball: conservative advancement
+        against the paddle's path, run on all the balls within reach of the paddle
+        before their horizon at once, each ball leaving the loop as soon as it hits
+        or can't anymore. The balls still searching after the last step get a
+        false hit where they stopped, which bounces nothing and predicts them
+        again. With only a few balls within reach, the scalar search is run on each
+        of them instead.
+
+        Args:
+            paddle (Paddle): The paddle to predict against
+            t (float): Simulation time the prediction is made at
+            horizon (ndarray, optional): Time from t after which each ball is predicted
+                                         again anyway, ex. at its next wall event.
+                                         Defaults to no horizon.
+
+        Returns:
+            ndarray: Time until each ball hits the paddle, inf if it doesn't before
+                     its horizon
+        """
+        n = len(self._balls)
+        x, _ = self.positions_at(t)
+        vx = self.vx[:n]
+        reach = math.hypot(paddle.width/2, paddle.height/2) + self.size[:n]
+
+        # window during which each ball is close enough to the paddle in x
+        with np.errstate(divide="ignore", invalid="ignore"):
+            enter = (paddle.x - reach - x) / vx
+            leave = (paddle.x + reach - x) / vx
+        start = np.minimum(enter, leave)
+        end = np.maximum(enter, leave)
+        still = vx == 0
+        within = np.abs(x - paddle.x) <= reach
+        start[still] = np.where(within[still], 0.0, np.inf)
+        end[still] = np.where(within[still], np.inf, -np.inf)
+        if horizon is not None:
+            end = np.minimum(end, horizon)
+
+        dts = np.maximum(start, 0.0)
+        times = np.full(n, np.inf)
+        active = np.nonzero((end >= 0) & (dts <= end))[0]
+        if active.size < MIN_VECTOR_PADDLE_BALLS:
+            for i in active.tolist():
+                ball_horizon = math.inf if horizon is None else horizon.item(i)
+                times[i] = self._balls[i].time_to_hit_paddle(paddle, t, ball_horizon)
+            return times
+
+        speed = np.hypot(vx, self.vy[:n])
+
+        for _ in range(MAX_PADDLE_STEPS):
+            if active.size == 0:
+                break
+            dt = dts[active]
+            gap, bound = self.__paddle_gap(paddle, active, t + dt, speed[active])
+            # overlapping, ex. the paddle turned into the ball: hit now to push it out
+            hit = gap < -CONTACT_TOLERANCE
+            contact = ~hit & (gap <= CONTACT_TOLERANCE)
+            if contact.any():
+                closing = self.__paddle_closing(paddle, active, t + dt)
+                hit |= contact & (closing < -MIN_CLOSING_SPEED)
+            times[active[hit]] = dt[hit]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # touching but moving apart: step past the contact
+                dt = dt + np.where(contact, 2*CONTACT_TOLERANCE, gap) / bound
+            dts[active] = dt
+            active = active[~hit & (bound > 0) & (dt <= end[active])]
+
+        # still in reach after every step: stop there, the bounce goes on from it
+        times[active] = dts[active]
+        return times
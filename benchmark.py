@@ -0,0 +1,201 @@
+""" Benchmark suite for the headless PongPlus event loop
+
+Runs seeded headless matches over a grid of ball counts, paddle tilt activity
+and match lengths, and reports for each of them the events per second, the
+stale-event ratio, the peak heap size and the peak memory. Results are written
+to a JSON file which can be given back with --baseline to compare two commits:
+the run fails if the throughput of any case dropped by more than --threshold.
+
+    python benchmark.py --balls 2 10 100 --tilt 0 1 --output new.json --baseline old.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from pong_engine import PongEngine
+from scripted_input import ScriptedInput
+
+
+def run_match(num_balls: int,
+              tilt_activity: float,
+              winning_score: int,
+              max_events: int,
+              seed: int,
+              spatial_index: bool=False):
+    """
+    Run one seeded headless match and measure it.
+
+    Args:
+        num_balls (int): Number of balls in play
+        tilt_activity (float): Probability of the scripted players tilting, from 0 to 1
+        winning_score (int): Score needed to win, sets the length of the match
+        max_events (int): Stop after this many events even if nobody won
+        seed (int): Seed of the match
+        spatial_index (bool, optional): Use the spatial grid broad phase. Defaults to False.
+
+    Returns:
+        dict: events, simulated time, wall time, events per second, mean and
+              final stale ratio and peak heap size
+    """
+    engine = PongEngine(num_balls=num_balls,
+                        player_names=["P1", "P2"],
+                        player_colors=[(0, 0, 255), (255, 0, 0)],
+                        winning_score=winning_score,
+                        spatial_index=spatial_index,
+                        seed=seed)
+    drivers = [ScriptedInput(a_player, tilt_activity, seed=seed + a_player.uid)
+               for a_player in engine.player_list]
+
+    n_events = 0
+    peak_queue = 0
+    stale_sum = 0.0
+    start = time.perf_counter()
+    engine.start()
+    while n_events < max_events and engine.step():
+        n_events += 1
+        queue = engine.queue
+        peak_queue = max(peak_queue, queue.size)
+        stale_sum += queue.stale_ratio
+        for a_driver in drivers:
+            a_driver.update(engine.t)
+    wall_time = time.perf_counter() - start
+
+    return {"events": n_events,
+            "sim_time": engine.t,
+            "wall_time": wall_time,
+            "events_per_sec": n_events / wall_time if wall_time > 0 else 0.0,
+            "mean_stale_ratio": stale_sum / n_events if n_events else 0.0,
+            "final_stale_ratio": engine.queue.stale_ratio,
+            "peak_queue": peak_queue}
+
+
+def measure_peak_memory(**case):
+    """
+    Run a match again under tracemalloc and return its peak memory in KiB.
+    Done in a separate run since tracing slows the event loop down a lot.
+    """
+    tracemalloc.start()
+    run_match(**case)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def case_key(result: dict):
+    """ Returns the parameters identifying a benchmark case, used to match baselines."""
+    return (result["balls"], result["tilt_activity"], result["winning_score"],
+            result["max_events"], result["spatial_index"])
+
+
+def compare(results: list, baseline: list, threshold: float):
+    """
+    Compare the throughput of each case against a baseline.
+
+    Args:
+        results (list): Results of this run
+        baseline (list): Results of the baseline run
+        threshold (float): Allowed drop in throughput, ex. 0.2 for 20%
+
+    Returns:
+        list: Messages describing each case that regressed
+    """
+    baseline_by_key = {case_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = baseline_by_key.get(case_key(result))
+        if old is None or old["events_per_sec"] <= 0:
+            continue
+        ratio = result["events_per_sec"] / old["events_per_sec"]
+        if ratio < 1 - threshold:
+            regressions.append(
+                f"balls={result['balls']} tilt={result['tilt_activity']} "
+                f"score={result['winning_score']}: {old['events_per_sec']:.0f} -> "
+                f"{result['events_per_sec']:.0f} events/s ({ratio:.0%})")
+    return regressions
+
+
+def parse_args(argv: list):
+    """ Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--balls", type=int, nargs="+", default=[2, 10, 100, 1000],
+                        help="ball counts to run")
+    parser.add_argument("--tilt", type=float, nargs="+", default=[0.0, 0.5],
+                        help="paddle tilt activities to run, from 0 to 1")
+    parser.add_argument("--score", type=int, nargs="+", default=[10],
+                        help="winning scores to run, sets the length of the matches")
+    parser.add_argument("--max-events", type=int, default=20000,
+                        help="stop a match after this many events")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per case, the median throughput is kept")
+    parser.add_argument("--spatial-index", action="store_true",
+                        help="use the spatial grid broad phase")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc run of each case")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed drop in events per second against the baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv: list=None):
+    """ Run the benchmark suite, returns the exit code."""
+    args = parse_args(argv)
+    results = []
+
+    for balls in args.balls:
+        for tilt in args.tilt:
+            for score in args.score:
+                case = {"num_balls": balls,
+                        "tilt_activity": tilt,
+                        "winning_score": score,
+                        "max_events": args.max_events,
+                        "seed": args.seed,
+                        "spatial_index": args.spatial_index}
+                runs = sorted((run_match(**case) for _ in range(args.repeat)),
+                              key=lambda run: run["events_per_sec"])
+                result = {"balls": balls,
+                          "tilt_activity": tilt,
+                          "winning_score": score,
+                          "max_events": args.max_events,
+                          "seed": args.seed,
+                          "spatial_index": args.spatial_index}
+                result.update(runs[len(runs) // 2])
+                result["peak_memory_kib"] = None if args.no_memory \
+                    else measure_peak_memory(**case)
+                results.append(result)
+
+                memory = result["peak_memory_kib"]
+                print(f"balls={balls:<5} tilt={tilt:<4} score={score:<3} "
+                      f"{result['events']:>7} events  "
+                      f"{result['events_per_sec']:>9.0f} events/s  "
+                      f"stale={result['mean_stale_ratio']:.2f}  "
+                      f"peak queue={result['peak_queue']:>6}  "
+                      f"peak mem={'-' if memory is None else f'{memory:.0f} KiB'}")
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"python": platform.python_version(),
+                   "platform": platform.platform(),
+                   "results": results}, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Throughput regressions:")
+            for message in regressions:
+                print("  " + message)
+            return 1
+        print("No throughput regression against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
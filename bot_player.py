@@ -0,0 +1,202 @@
+""" Module providing BotPlayer class, a player driven by trajectory prediction instead of the keyboard"""
+
+import math
+import random
+
+from player import Player
+
+class BotPlayer(Player):
+    """
+    A player whose paddle is moved by a bot, for bot-versus-bot matches, load
+    generation and benchmarks.
+
+    Balls only change course at events, so where a ball crosses the paddle's x
+    position follows in closed form from its current state: time_to_leave_border
+    gives when it gets there, time_to_hit_horizontal_wall when it first bounces
+    off the top or bottom wall, and the bounces after that fold its y position
+    back between the walls. Each intercept is cached along with the ball's event
+    count and only computed again once the ball had another event, so a decision
+    costs one pass over the balls. The bot moves its target to the ball that
+    arrives first and tilts against steep balls to flatten their return.
+
+    Attributes:
+        # _border_width (float): Half of the width of the border
+        # _border_height (float): Half of the height of the border
+        # _reaction_time (float): Least simulation time between two decisions
+        # _last_decision (float): Simulation time of the last decision
+        # _intercepts (dict): (event count, time, y) where each ball crosses the
+                              paddle's x position, time None if it doesn't
+        # _aim_error (float): Standard deviation of the aim, as a fraction of the paddle's height
+        # _rng (Random): Random generator of the aim
+        # _aim (tuple): (ball index, y position, offset) of the current aim
+
+    Methods:
+        + get_input(Screen): Nothing to bind, the bot doesn't use the keyboard
+        + decide(float, list): Pick the paddle's target position and tilt
+        + intercept(Ball, float): Time and y position a ball crosses the paddle's x position
+        - __fold_y(Ball, float, float): Y position of a ball later on, bouncing off the walls
+        - __move_to(float): Set the target y position
+        - __tilt_to(float): Set the target angle
+    """
+
+    __slots__ = ("_border_width", "_border_height", "_reaction_time", "_last_decision",
+                 "_intercepts", "_aim_error", "_rng", "_aim")
+
+    def __init__(self, name: str,
+                 uid: int,
+                 color: tuple,
+                 size: list,
+                 pos: list,
+                 border_height: float,
+                 border_width: float,
+                 smoothing_rate: float=3.0,
+                 clearance: float=0.0,
+                 reaction_time: float=1.0,
+                 aim_error: float=0.35,
+                 rng: random.Random=None):
+        """
+        Args:
+            name (str): Player name
+            uid (int): Player identifier (1 or 2)
+            color (tuple): RGB color for paddle
+            size (list): [width, height] of paddle
+            pos (list): [x, y] initial position
+            border_height (float): Half of the height of the border
+            border_width (float): Half of the width of the border
+            smoothing_rate (float, optional): Rate of the exponential easing towards
+                                              the target, per unit of time. Defaults to 3.
+            clearance (float, optional): Room kept between the paddle and the top and
+                                         bottom walls. Defaults to 0.
+            reaction_time (float, optional): Least simulation time between two
+                                             decisions, 0 to decide after every event.
+                                             Defaults to 1, as every change of course
+                                             costs a prediction of every ball.
+            aim_error (float, optional): Standard deviation of where the bot aims on the
+                                         paddle, as a fraction of its height. Defaults to 0.35.
+            rng (Random, optional): Random generator of the aim. Defaults to a new
+                                    unseeded generator.
+        """
+        if rng is None:
+            rng = random.Random()
+
+        super().__init__(name, uid, color, size, pos, border_height, smoothing_rate, clearance)
+        self._border_width = border_width
+        self._border_height = border_height
+        self._reaction_time = reaction_time
+        self._last_decision = -math.inf
+        self._intercepts = {}
+        self._aim_error = aim_error
+        self._rng = rng
+        self._aim = (None, 0.0, 0.0)
+
+    def get_input(self, my_screen):
+        """ The bot doesn't listen to the keyboard, nothing to bind."""
+
+    def intercept(self, a_ball, t: float):
+        """
+        Returns when and where a ball crosses the paddle's x position, at the
+        distance where it would touch the paddle, if it keeps its course.
+
+        Args:
+            a_ball (Ball): The ball to predict
+            t (float): Simulation time the prediction is made at
+
+        Returns:
+            tuple: (simulation time, y position), time None if the ball isn't
+                   heading for this paddle or already went past it
+        """
+        cached = self._intercepts.get(a_ball.index)
+        if cached is not None and cached[0] == a_ball.count:
+            return cached[1:]
+
+        vx = a_ball.vx
+        if vx == 0 or (vx > 0) != (self._x > 0):
+            hit = (None, 0.0)
+        else:
+            # the ball leaves the border on this side, it crosses the paddle just before
+            size = a_ball.size
+            dt_leave = a_ball.time_to_leave_border(self._border_width, t)
+            x_leave = math.copysign(self._border_width + size, vx)
+            x_contact = self._x - math.copysign(self._width/2 + size, vx)
+            dt = dt_leave - (x_leave - x_contact) / vx
+            if dt < 0:
+                hit = (None, 0.0)
+            else:
+                hit = (t + dt, self.__fold_y(a_ball, t, dt))
+
+        self._intercepts[a_ball.index] = (a_ball.count,) + hit
+        return hit
+
+    def __fold_y(self, a_ball, t: float, dt: float):
+        """
+        Y position of a ball dt from t, bouncing between the top and bottom walls.
+        """
+        vy = a_ball.vy
+        dt_wall = a_ball.time_to_hit_horizontal_wall(self._border_height, t)
+        if dt <= dt_wall:
+            return a_ball.pos_at(t)[1] + vy*dt
+
+        # from the first wall it hits, the ball goes back and forth between the walls
+        reach = self._border_height - a_ball.size
+        y_wall = math.copysign(reach, vy)
+        travelled = abs(vy) * (dt - dt_wall) % (4*reach)
+        if travelled > 2*reach:
+            travelled = 4*reach - travelled
+        return y_wall - math.copysign(travelled, vy)
+
+    def decide(self, t: float, balls: list):
+        """
+        Move the paddle's target to where the first incoming ball crosses it, give or
+        take the aim error, and tilt against it if it comes in steep. Called by the
+        engine after every event, decides at most once per reaction time.
+
+        Args:
+            t (float): Simulation time
+            balls (list): Balls in play
+        """
+        # the clock going back means a new match
+        if self._last_decision <= t < self._last_decision + self._reaction_time:
+            return
+        self._last_decision = t
+
+        first_time = math.inf
+        first_ball = None
+        first_y = 0.0
+        for a_ball in balls:
+            time, y = self.intercept(a_ball, t)
+            if time is not None and t <= time < first_time:
+                first_time, first_ball, first_y = time, a_ball, y
+
+        if first_ball is None:
+            self.__tilt_to(0)
+            return
+        # wall bounces leave the crossing in place, only aim again when it moves
+        aim_index, aim_y, _ = self._aim
+        if aim_index != first_ball.index or abs(first_y - aim_y) > self._height/4:
+            offset = self._rng.gauss(0.0, self._aim_error*self._height)
+            self._aim = (first_ball.index, first_y, offset)
+        self.__move_to(max(-self._max_y, min(self._max_y, first_y + self._aim[2])))
+
+        vx, vy = first_ball.vx, first_ball.vy
+        if abs(vy) <= abs(vx):
+            self.__tilt_to(0)
+        elif (vy > 0) == (self._x < 0):
+            self.__tilt_to(-self._max_tilt_angle_deg)
+        else:
+            self.__tilt_to(self._max_tilt_angle_deg)
+
+    def __move_to(self, y: float):
+        """
+        Set the target y position, unless the ball would still land on the paddle
+        from the current target. Every change of course makes the engine predict
+        the paddle's collisions again.
+        """
+        if abs(y - self._target_y) > self._height/4:
+            self.rebase(self._clock)
+            self._target_y = y
+
+    def __tilt_to(self, angle: float):
+        """ Set the target angle if it changed."""
+        if angle != self._target_angle_deg:
+            self.rebase(self._clock)
+            self._target_angle_deg = angle
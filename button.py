@@ -1,7 +1,6 @@
 """ Module providing the Button class for handling clickable buttons"""
 
 
-import turtle
 from text import Text
 
 
@@ -16,9 +15,8 @@ class Button(Text):
         # _extra_size (float): Additional size for hit detection area
 
     Methods:
-        + active(): Update button state based on cursor position and redraw
+        + hover(float, float): Update button state for a cursor position, without drawing
         + is_hovered(float, float): Check if given coordinates are within button bounds
-        - __get_cursor_pos(): Get current cursor position relative to game window
     """
 
     def __init__(self, text: str,
@@ -45,24 +43,6 @@ class Button(Text):
         self._idle_color = idle_color
         self._color = self._idle_color
 
-    def __get_cursor_pos(self):
-        """
-        Get the current cursor position relative to the game window.
-
-        Returns:
-            tuple: (x, y) coordinates of cursor position
-        """
-        screen = turtle.Screen()
-        # Get cursor position relative to window
-        cursor_x = screen.getcanvas().winfo_pointerx() - screen.getcanvas().winfo_rootx()
-        cursor_y = screen.getcanvas().winfo_pointery() - screen.getcanvas().winfo_rooty()
-
-        # Convert to turtle coordinates (centered at origin)
-        cursor_x = cursor_x - screen.window_width() // 2
-        cursor_y = screen.window_height() // 2 - cursor_y
-
-        return cursor_x, cursor_y
-
     def is_hovered(self, x: float, y: float):
         """
         Check if given coordinates are within button's bounds.
@@ -75,6 +55,7 @@ class Button(Text):
             bool: True if coordinates are within button bounds, False otherwise
         """
         # Calculate button boundaries using first and last characters
+        self._update_layout()
         bottom_right = [self._char_list[0].grid_points[8][0],
                        self._char_list[0].grid_points[8][1]]
         top_left = [self._char_list[-1].grid_points[0][0],
@@ -82,17 +63,19 @@ class Button(Text):
 
         return bottom_right[0] <= x <= top_left[0] and bottom_right[1] <= y <= top_left[1]
 
-    def active(self):
-        """
-        Update button state based on cursor position and redraw.
-        Changes color when hovered over.
+    def hover(self, x: float, y: float):
         """
-        cursor_x, cursor_y = self.__get_cursor_pos()
+        Update button state for a cursor position, changing color when hovered over.
 
-        # Update color based on hover state
-        if self.is_hovered(cursor_x, cursor_y):
-            self._color = self._hover_color
-        else:
-            self._color = self._idle_color
+        Args:
+            x (float): X coordinate of the cursor
+            y (float): Y coordinate of the cursor
 
-        self.draw()
+        Returns:
+            bool: True if the hover state changed and the button needs a redraw
+        """
+        color = self._hover_color if self.is_hovered(x, y) else self._idle_color
+        if color == self._color:
+            return False
+        self.color = color
+        return True
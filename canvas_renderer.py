@@ -0,0 +1,223 @@
+""" Module providing a retained-mode Tk canvas renderer for PongPlus"""
+
+import functools
+import turtle
+
+from renderer import Renderer
+from turtle_renderer import player_labels, setup_screen
+
+
+@functools.lru_cache(maxsize=None)
+def tk_color(rgb: tuple):
+    """
+    Convert an RGB color (0-255) into a Tk color string, strings are left as they are.
+    Cached, the balls only take their colors from small palettes.
+
+    Args:
+        rgb (tuple): (red, green, blue) color, or a Tk color name
+
+    Returns:
+        str: Tk color string, ex. "#ff0000"
+    """
+    if isinstance(rgb, str):
+        return rgb
+    return f"#{int(rgb[0]):02x}{int(rgb[1]):02x}{int(rgb[2]):02x}"
+
+
+class CanvasRenderer(Renderer):
+    """
+    Draws a PongPlus match on the canvas of the turtle window in retained mode.
+
+    Instead of clearing and redrawing everything with turtle on each frame, the
+    canvas items (a polygon per paddle, an oval per ball, lines for the border and
+    the glyphs of the labels) are created once and then only their coordinates and
+    colors are updated. Canvas coordinates are turtle coordinates with y flipped.
+
+    The items are tagged by layer: the static layer (border and names) is never
+    touched once created, a frame only updates the dynamic layer (paddles, balls
+    and scores).
+
+    Attributes:
+        # _border_width (float): Half of the width of the border
+        # _border_height (float): Half of the height of the border
+        # _ui_score_list (list): List of Text objects showing the scores
+        # _ui_name_list (list): List of Text objects showing the player names
+        # _canvas (Canvas): The Tk canvas of the turtle window
+        # _items (dict): Canvas item ids of the border, paddles, balls and labels,
+                         None until the first frame of a match
+        # _ball_colors (list): Last color given to each ball's oval
+        # _score_texts (list): Text currently shown by each score label
+
+    Methods:
+        + border_size (list) <<GET>>: [half width, half height] of the border
+        + screen (Screen) <<GET>>: The turtle screen, used for input bindings
+        + setup(PongEngine): Create the score and name labels
+        + draw(PongEngine): Update the canvas items
+        + clear(): Delete every canvas item of the match
+        + close(): Close the turtle window
+        - __create_items(PongEngine): Create the canvas items of a match
+        - __create_label(Text, str): Create the lines of a label on a layer
+        - __paddle_coords(Paddle): Corners of a paddle in canvas coordinates
+    """
+
+    def __init__(self):
+        """Setup the turtle screen and get its canvas."""
+        self._border_width, self._border_height = setup_screen()
+        self._ui_score_list = []
+        self._ui_name_list = []
+        self._canvas = turtle.Screen().getcanvas()
+        self._items = None
+        self._ball_colors = []
+        self._score_texts = []
+
+    # canvas tags of the layers
+    STATIC = "static"
+    DYNAMIC = "dynamic"
+
+    @property
+    def border_size(self):
+        """Getter for [half width, half height] of the border"""
+        return [self._border_width, self._border_height]
+
+    @property
+    def screen(self):
+        """Getter for the turtle screen"""
+        return turtle.Screen()
+
+    def setup(self, engine):
+        """
+        Create the score and name labels of both players.
+
+        Args:
+            engine (PongEngine): The simulation that will be drawn
+        """
+        self._ui_score_list, self._ui_name_list = player_labels(engine.player_list)
+
+    def __create_label(self, text, layer: str):
+        """
+        Create one canvas line per character of a label.
+
+        Args:
+            text (Text): The label to create
+            layer (str): Tag of the layer the label is on
+
+        Returns:
+            list: Canvas item ids of the lines
+        """
+        color = tk_color(text.color)
+        items = []
+        for line in text.strokes():
+            coords = []
+            for x, y in line:
+                coords += [x, -y]
+            if len(coords) == 2:
+                coords += coords
+            items.append(self._canvas.create_line(*coords, fill=color,
+                                                  width=text.thickness,
+                                                  capstyle="round",
+                                                  joinstyle="round",
+                                                  tags=layer))
+        return items
+
+    def __create_items(self, engine):
+        """
+        Create every canvas item of a match.
+
+        Args:
+            engine (PongEngine): The simulation that will be drawn
+        """
+        canvas = self._canvas
+        width = self._border_width
+        height = self._border_height
+        player_list = engine.player_list
+        n_interval = 15
+        dash = 2*height/n_interval
+
+        border = [canvas.create_line(-width, height, width, height,
+                                     fill="black", width=10, tags=self.STATIC),
+                  canvas.create_line(-width, -height, width, -height,
+                                     fill="black", width=10, tags=self.STATIC)]
+        # dashed left/right border, drawn from the bottom up
+        for i in range(0, n_interval, 2):
+            y_start = -height + i*dash
+            for x, a_player in [(-width, player_list[0]), (width, player_list[1])]:
+                border.append(canvas.create_line(x, -y_start, x, -(y_start + dash),
+                                                 fill=tk_color(a_player.color), width=10,
+                                                 tags=self.STATIC))
+
+        paddles = []
+        for a_player in player_list:
+            color = tk_color(a_player.color)
+            paddles.append(canvas.create_polygon(*self.__paddle_coords(a_player),
+                                                 fill=color, outline=color,
+                                                 width=a_player.thickness,
+                                                 tags=self.DYNAMIC))
+
+        balls = []
+        self._ball_colors = []
+        for a_ball in engine.ball_list:
+            color = tk_color(a_ball.color)
+            balls.append(canvas.create_oval(0, 0, 0, 0, fill=color, outline="",
+                                            tags=self.DYNAMIC))
+            self._ball_colors.append(color)
+
+        self._items = {"border": border,
+                       "paddles": paddles,
+                       "balls": balls,
+                       "names": [self.__create_label(ui_name, self.STATIC)
+                                 for ui_name in self._ui_name_list],
+                       "scores": [self.__create_label(ui_score, self.DYNAMIC)
+                                  for ui_score in self._ui_score_list]}
+        self._score_texts = [ui_score.text for ui_score in self._ui_score_list]
+
+    def __paddle_coords(self, paddle):
+        """ Returns the 4 corners of a paddle, flattened, in canvas coordinates."""
+        coords = []
+        for x, y in paddle.corners():
+            coords += [x, -y]
+        return coords
+
+    def draw(self, engine):
+        """
+        Move the canvas items to the current state of the match.
+
+        Args:
+            engine (PongEngine): The simulation to draw
+        """
+        if self._items is None:
+            self.__create_items(engine)
+        canvas = self._canvas
+
+        for item, a_player in zip(self._items["paddles"], engine.player_list):
+            canvas.coords(item, *self.__paddle_coords(a_player))
+
+        # labels only change when a score does
+        for i, a_player in enumerate(engine.player_list):
+            score_text = str(a_player.score)
+            if score_text != self._score_texts[i]:
+                canvas.delete(*self._items["scores"][i])
+                self._ui_score_list[i].text = score_text
+                self._items["scores"][i] = self.__create_label(self._ui_score_list[i],
+                                                               self.DYNAMIC)
+                self._score_texts[i] = score_text
+
+        t = engine.t
+        for i, (item, a_ball) in enumerate(zip(self._items["balls"], engine.ball_list)):
+            x, y = a_ball.pos_at(t)
+            size = a_ball.size
+            canvas.coords(item, x - size, -(y + size), x + size, -(y - size))
+            color = tk_color(a_ball.color)
+            if color != self._ball_colors[i]:
+                canvas.itemconfigure(item, fill=color)
+                self._ball_colors[i] = color
+
+        canvas.update()
+
+    def clear(self):
+        """Delete every canvas item of the match, they are created again on the next frame."""
+        self._canvas.delete(self.STATIC, self.DYNAMIC)
+        self._items = None
+
+    def close(self):
+        """Close the turtle window."""
+        turtle.bye()
@@ -1,6 +1,54 @@
 """ Module providing a Char class for handling sigular alphanumeric character"""
 
-import turtle
+# position of each point of the 3x3 grid, in units of the character's width and height
+# from its center
+_UNIT_GRID = [(-0.5, 0.5), (0.0, 0.5), (0.5, 0.5),
+              (-0.5, 0.0), (0.0, 0.0), (0.5, 0.0),
+              (-0.5, -0.5), (0.0, -0.5), (0.5, -0.5)]
+
+# the grid points each character's line goes through
+_DRAW_SEQ = {"0": [6, 0, 2, 8, 6],
+             "1": [3, 1, 7],
+             "2": [3, 0, 2, 5, 6, 8],
+             "3": [0, 2, 4, 5, 8, 6],
+             "4": [1, 3, 5, 2, 8],
+             "5": [2, 0, 3, 5, 8, 6],
+             "6": [2, 0, 6, 8, 5, 3],
+             "7": [0, 2, 7],
+             "8": [6, 0, 2, 8, 6, 3, 5],
+             "9": [5, 3, 0, 2, 8, 6],
+             "A": [6, 3, 1, 5, 8, 5, 3],
+             "B": [0, 6, 8, 5, 4, 2, 0],
+             "C": [2, 0, 6, 8],
+             "D": [0, 6, 7, 5, 1, 0],
+             "E": [2, 0, 3, 5, 3, 6, 8],
+             "F": [2, 0, 3, 4, 3, 6],
+             "G": [2, 0, 6, 8, 5, 4],
+             "H": [0, 6, 3, 5, 8, 2],
+             "I": [0, 2, 1, 7, 6, 8],
+             "J": [0, 2, 1, 7, 6, 3],
+             "K": [0, 6, 3, 2, 3, 8],
+             "L": [0, 6, 8],
+             "M": [6, 0, 4, 2, 8],
+             "N": [6, 0, 8, 2],
+             "O": [0, 2, 8, 6, 0],
+             "P": [6, 0, 2, 5, 3],
+             "Q": [8, 4, 5, 2, 0, 6, 7, 5],
+             "R": [6, 0, 2, 5, 3, 4, 8],
+             "S": [2, 1, 3, 5, 8, 6],
+             "T": [0, 2, 1, 7],
+             "U": [0, 6, 8, 2],
+             "V": [0, 7, 2],
+             "W": [0, 6, 4, 8, 2],
+             "X": [0, 8, 4, 2, 6],
+             "Y": [0, 4, 2, 4, 7],
+             "Z": [0, 2, 6, 8],
+             " ": [],
+             "_": [6, 8]}
+
+# every character's line, computed once in unit coordinates and shared by all Char objects
+GLYPHS = {char: tuple(_UNIT_GRID[i] for i in sequence)
+          for char, sequence in _DRAW_SEQ.items()}
 
 class Char:
     """
@@ -14,20 +62,27 @@ class Char:
     3   4   5
     6   7   8
 
+    The lines themselves live in the module's GLYPHS table in unit coordinates, a
+    Char only holds its position, size and style and scales a glyph into a polyline,
+    which Text draws or hands to the renderers as a whole.
+
     Attributes:
         + pos (list) <<GET, SET>>: [x, y] position in the form of list
-        # _color (tuple): RGB color of the character
+        # _color (tuple) <<GET, SET>>: RGB color of the character
         # _thickness (int): Line thickness for drawing
         # _width (float) <<GET, SET>>: Width of the character
         # _height (float) <<GET, SET>>: Height of the character
         # _x (float): X position of character center
         # _y (float): Y position of character center
-        # _grid_points (list) <<GET>>: a list containing position of each point of the grid
+        + grid_points (list) <<GET>>: a list containing position of each point of the grid
 
     Methods:
-        + draw(str): Draw the specified character using turtle graphics.
+        + polyline(str): Points of the line drawing the specified character
         - __str__(): String representation
     """
+
+    __slots__ = ("_color", "_thickness", "_width", "_height", "_x", "_y")
+
     def __init__(self, pos: list,
                  size: list,
                  color: tuple,
@@ -45,45 +100,8 @@ class Char:
         self._thickness = thickness
         self._width = size[0]
         self._height = size[1]
-        self.pos = pos
-        self.__draw_seq = {"0": [6, 0, 2, 8, 6],
-                           "1": [3, 1, 7],
-                           "2": [3, 0, 2, 5, 6, 8],
-                           "3": [0, 2, 4, 5, 8, 6],
-                           "4": [1, 3, 5, 2, 8],
-                           "5": [2, 0, 3, 5, 8, 6],
-                           "6": [2, 0, 6, 8, 5, 3],
-                           "7": [0, 2, 7],
-                           "8": [6, 0, 2, 8, 6, 3, 5],
-                           "9": [5, 3, 0, 2, 8, 6],
-                           "A": [6, 3, 1, 5, 8, 5, 3],
-                           "B": [0, 6, 8, 5, 4, 2, 0],
-                           "C": [2, 0, 6, 8],
-                           "D": [0, 6, 7, 5, 1, 0],
-                           "E": [2, 0, 3, 5, 3, 6, 8],
-                           "F": [2, 0, 3, 4, 3, 6],
-                           "G": [2, 0, 6, 8, 5, 4],
-                           "H": [0, 6, 3, 5, 8, 2],
-                           "I": [0, 2, 1, 7, 6, 8],
-                           "J": [0, 2, 1, 7, 6, 3],
-                           "K": [0, 6, 3, 2, 3, 8],
-                           "L": [0, 6, 8],
-                           "M": [6, 0, 4, 2, 8],
-                           "N": [6, 0, 8, 2],
-                           "O": [0, 2, 8, 6, 0],
-                           "P": [6, 0, 2, 5, 3],
-                           "Q": [8, 4, 5, 2, 0, 6, 7, 5],
-                           "R": [6, 0, 2, 5, 3, 4, 8],
-                           "S": [2, 1, 3, 5, 8, 6],
-                           "T": [0, 2, 1, 7],
-                           "U": [0, 6, 8, 2],
-                           "V": [0, 7, 2],
-                           "W": [0, 6, 4, 8, 2],
-                           "X": [0, 8, 4, 2, 6],
-                           "Y": [0, 4, 2, 4, 7],
-                           "Z": [0, 2, 6, 8],
-                           " ": [],
-                           "_": [6, 8]}
+        self._x = pos[0]
+        self._y = pos[1]
 
     @property
     def pos(self):
@@ -98,21 +116,23 @@ class Char:
     @pos.setter
     def pos(self, pos: list):
         """
-        Set the position of the character and update grid points.
+        Set the position of the character.
 
         Args:
             pos (list): [x, y] new position
         """
-        x = self._x = pos[0]
-        y = self._y = pos[1]
+        self._x = pos[0]
+        self._y = pos[1]
 
-        dx = self._width/2
-        dy = self._height/2
+    @property
+    def color(self):
+        """Getter for character's color"""
+        return self._color
 
-        # Calculate 3x3 grid points relative to character center with the given width and height
-        self._grid_points = [[x-dx, y+dy], [x, y+dy], [x+dx, y+dy],
-                             [x-dx, y], [x, y], [x+dx, y],
-                             [x-dx, y-dy], [x, y-dy], [x+dx, y-dy]]
+    @color.setter
+    def color(self, color):
+        """Setter for character's color"""
+        self._color = color
 
     @property
     def width(self):
@@ -132,7 +152,7 @@ class Char:
     @height.setter
     def height(self, height):
         """Setter for character's height"""
-        self._width = height
+        self._height = height
 
     @property
     def grid_points(self):
@@ -141,35 +161,23 @@ class Char:
         
         Return:
             list: a list containg 9 positions of all the point of the grid"""
-        return self._grid_points
+        return [[self._x + ux*self._width, self._y + uy*self._height]
+                for ux, uy in _UNIT_GRID]
 
-    def draw(self, char: str):
+    def polyline(self, char: str):
         """
-        Draw the specified character using turtle graphics.
+        Returns the points of the line drawing the specified character, its glyph
+        scaled to the character's size and moved to its position.
 
         Args:
             char (str): Single character to draw
+
+        Returns:
+            list: (x, y) points, empty for characters without a line (ex. space)
         """
-        turtle.penup()
-        turtle.color(self._color)
-        turtle.pensize(self._thickness)
-        turtle.goto(self._x, self._y)
-        turtle.setheading(0)
-
-
-        sequence = self.__draw_seq[char]
-
-        if not sequence == []:
-            # Move to first point without drawing
-            turtle.goto(self._grid_points[sequence[0]][0],
-                        self._grid_points[sequence[0]][1])
-            turtle.pendown()
-            # Connect remaining points with lines
-            for i in range(1, len(sequence)):
-                turtle.goto(
-                    self._grid_points[sequence[i]][0],
-                    self._grid_points[sequence[i]][1])
-            turtle.penup()
+        x, y = self._x, self._y
+        width, height = self._width, self._height
+        return [(x + ux*width, y + uy*height) for ux, uy in GLYPHS[char]]
 
     def __str__(self) -> str:
         return f"digit pos=({self._x:.2f}, {self._y:.2f})"
@@ -0,0 +1,198 @@
+""" Module providing DisplayList class, recording drawing primitives and flushing them to a Tk canvas"""
+
+from canvas_renderer import tk_color
+
+class DisplayList:
+    """
+    Records the primitives of a frame (polylines, filled polygons and circles) with
+    their style, then sends them to a Tk canvas in as few calls as possible.
+
+    A polyline that starts where the previous one ended and has the same style is
+    merged into it, so connected segments (ex. a shape recorded edge by edge) become a
+    single create_line with all the coordinates. Flushing reuses the canvas items of the previous flush:
+    their coordinates are moved, their style only configured when it changed, new
+    items are only created when a frame has more primitives than any frame before,
+    and the spare ones are hidden. The items are kept in the order the primitives
+    were recorded, so later ones are drawn over earlier ones: an item of the wrong
+    kind is replaced, and the items after a replaced one are raised back over it.
+    Points are in turtle coordinates, the canvas has y flipped.
+
+    Attributes:
+        # _commands (list): Recorded (kind, style, coords) primitives of the frame
+        # _tag (str): Canvas tag given to the items
+        # _pool (list): Canvas items in stacking order, with the kind and style they have
+        # _n_calls (int) <<GET>>: Number of canvas calls made by the last flush
+
+    Methods:
+        + polyline(list, tuple, float): Record a line through points
+        + polygon(list, tuple, float): Record a filled polygon
+        + circle(float, float, float, tuple): Record a filled circle
+        + clear(): Forget the recorded primitives
+        + flush(Canvas): Draw the recorded primitives on a canvas
+        + delete(Canvas): Delete every canvas item made by the display list
+        - __flip(list): Flatten points into canvas coordinates
+    """
+
+    LINE = "line"
+    POLYGON = "polygon"
+    OVAL = "oval"
+
+    def __init__(self, tag: str="display_list"):
+        """
+        Args:
+            tag (str, optional): Canvas tag given to the items, ex. to tell layers apart.
+                                 Defaults to "display_list".
+        """
+        self._commands = []
+        self._tag = tag
+        self._pool = []
+        self._n_calls = 0
+
+    @property
+    def n_calls(self):
+        """Getter for the number of canvas calls made by the last flush"""
+        return self._n_calls
+
+    def __len__(self):
+        return len(self._commands)
+
+    @staticmethod
+    def __flip(points):
+        """ Flatten (x, y) points into a list of canvas coordinates."""
+        coords = []
+        for x, y in points:
+            coords.append(x)
+            coords.append(-y)
+        return coords
+
+    def polyline(self, points: list, color: tuple, width: float):
+        """
+        Record a line through points, merged into the previous line if it
+        has the same style and ended where this one starts.
+
+        Args:
+            points (list): (x, y) points of the line
+            color (tuple): RGB color of the line
+            width (float): Width of the line
+        """
+        if not points:
+            return
+        coords = self.__flip(points)
+        if len(coords) == 2:
+            # a single point is drawn as a dot
+            coords += coords
+        style = (tk_color(color), width)
+
+        if self._commands:
+            kind, last_style, last_coords = self._commands[-1]
+            if (kind == self.LINE and last_style == style
+                    and last_coords[-2] == coords[0] and last_coords[-1] == coords[1]):
+                last_coords.extend(coords[2:])
+                return
+        self._commands.append((self.LINE, style, coords))
+
+    def polygon(self, points: list, color: tuple, width: float=1):
+        """
+        Record a polygon filled and outlined with a color.
+
+        Args:
+            points (list): (x, y) corners of the polygon
+            color (tuple): RGB color of the polygon
+            width (float, optional): Width of the outline. Defaults to 1.
+        """
+        self._commands.append((self.POLYGON, (tk_color(color), width), self.__flip(points)))
+
+    def circle(self, x: float, y: float, radius: float, color: tuple):
+        """
+        Record a filled circle.
+
+        Args:
+            x (float): X position of the center
+            y (float): Y position of the center
+            radius (float): Radius of the circle
+            color (tuple): RGB color of the circle
+        """
+        self._commands.append((self.OVAL, tk_color(color),
+                               [x - radius, -(y + radius), x + radius, -(y - radius)]))
+
+    def clear(self):
+        """Forget the recorded primitives, the canvas items stay until the next flush."""
+        self._commands.clear()
+
+    def __create(self, canvas, kind: str, style, coords: list):
+        """ Create a canvas item for a primitive."""
+        if kind == self.LINE:
+            color, width = style
+            return canvas.create_line(*coords, fill=color, width=width,
+                                      capstyle="round", joinstyle="round",
+                                      tags=self._tag)
+        if kind == self.POLYGON:
+            color, width = style
+            return canvas.create_polygon(*coords, fill=color, outline=color, width=width,
+                                         tags=self._tag)
+        return canvas.create_oval(*coords, fill=style, outline="", tags=self._tag)
+
+    def __configure(self, canvas, kind: str, item: int, style):
+        """ Give a reused canvas item the style of its new primitive."""
+        if kind == self.LINE:
+            color, width = style
+            canvas.itemconfigure(item, fill=color, width=width, state="normal")
+        elif kind == self.POLYGON:
+            color, width = style
+            canvas.itemconfigure(item, fill=color, outline=color, width=width,
+                                 state="normal")
+        else:
+            canvas.itemconfigure(item, fill=style, state="normal")
+
+    def flush(self, canvas):
+        """
+        Draw the recorded primitives on a canvas, reusing the items of the last flush.
+
+        Args:
+            canvas (Canvas): The Tk canvas to draw on
+        """
+        n_calls = 0
+        raise_rest = False
+        pool = self._pool
+
+        for i, (kind, style, coords) in enumerate(self._commands):
+            if i == len(pool):
+                pool.append([self.__create(canvas, kind, style, coords), kind, style])
+                n_calls += 1
+                continue
+            entry = pool[i]
+            if entry[1] != kind:
+                # replaced on top of the stack, the items after it have to follow
+                canvas.delete(entry[0])
+                entry[:] = [self.__create(canvas, kind, style, coords), kind, style]
+                n_calls += 2
+                raise_rest = True
+                continue
+            canvas.coords(entry[0], *coords)
+            n_calls += 1
+            if entry[2] != style:
+                self.__configure(canvas, kind, entry[0], style)
+                entry[2] = style
+                n_calls += 1
+            if raise_rest:
+                canvas.tag_raise(entry[0])
+                n_calls += 1
+
+        # hide the items this frame didn't need
+        for entry in pool[len(self._commands):]:
+            if entry[2] is not None:
+                canvas.itemconfigure(entry[0], state="hidden")
+                entry[2] = None
+                n_calls += 1
+
+        self._n_calls = n_calls
+
+    def delete(self, canvas):
+        """
+        Delete every canvas item made by the display list.
+
+        Args:
+            canvas (Canvas): The Tk canvas drawn on
+        """
+        canvas.delete(self._tag)
+        self._pool.clear()
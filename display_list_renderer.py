@@ -0,0 +1,140 @@
+""" Module providing a renderer for PongPlus drawing through display lists"""
+
+import turtle
+
+from display_list import DisplayList
+from renderer import Renderer
+from turtle_renderer import player_labels, setup_screen
+
+
+class DisplayListRenderer(Renderer):
+    """
+    Draws a PongPlus match on the canvas of the turtle window through display lists.
+
+    Each frame the primitives of the dynamic layer (a polygon per paddle, a circle per
+    ball and the lines of the scores) are recorded into a DisplayList and flushed to
+    the canvas in batched calls, the static layer (border and names) is recorded and
+    flushed once per match into a display list of its own.
+
+    Attributes:
+        # _border_width (float): Half of the width of the border
+        # _border_height (float): Half of the height of the border
+        # _ui_score_list (list): List of Text objects showing the scores
+        # _ui_name_list (list): List of Text objects showing the player names
+        # _canvas (Canvas): The Tk canvas of the turtle window
+        # _static (DisplayList): Display list of the border and names
+        # _static_drawn (bool): Whether the static layer of the match is flushed
+        # _dynamic (DisplayList): Display list of the paddles, balls and scores
+
+    Methods:
+        + border_size (list) <<GET>>: [half width, half height] of the border
+        + screen (Screen) <<GET>>: The turtle screen, used for input bindings
+        + setup(PongEngine): Create the score and name labels
+        + draw(PongEngine): Record and flush a frame
+        + clear(): Delete every canvas item of the match
+        + close(): Close the turtle window
+        - __record_static(PongEngine): Record the border and names
+        - __record_label(DisplayList, Text): Record the lines of a label
+    """
+
+    def __init__(self):
+        """Setup the turtle screen and get its canvas."""
+        self._border_width, self._border_height = setup_screen()
+        self._ui_score_list = []
+        self._ui_name_list = []
+        self._canvas = turtle.Screen().getcanvas()
+        self._static = DisplayList("static")
+        self._static_drawn = False
+        self._dynamic = DisplayList("dynamic")
+
+    @property
+    def border_size(self):
+        """Getter for [half width, half height] of the border"""
+        return [self._border_width, self._border_height]
+
+    @property
+    def screen(self):
+        """Getter for the turtle screen"""
+        return turtle.Screen()
+
+    def setup(self, engine):
+        """
+        Create the score and name labels of both players.
+
+        Args:
+            engine (PongEngine): The simulation that will be drawn
+        """
+        self._ui_score_list, self._ui_name_list = player_labels(engine.player_list)
+
+    @staticmethod
+    def __record_label(display_list, text):
+        """
+        Record the lines of a label.
+
+        Args:
+            display_list (DisplayList): Display list to record into
+            text (Text): The label to record
+        """
+        for line in text.strokes():
+            display_list.polyline(line, text.color, text.thickness)
+
+    def __record_static(self, engine):
+        """
+        Record and flush the static layer of a match: the border and the player names.
+
+        Args:
+            engine (PongEngine): The simulation to draw
+        """
+        width = self._border_width
+        height = self._border_height
+        player_list = engine.player_list
+        n_interval = 15
+        dash = 2*height/n_interval
+
+        self._static.clear()
+        self._static.polyline([(-width, height), (width, height)], "black", 10)
+        self._static.polyline([(-width, -height), (width, -height)], "black", 10)
+        # dashed left/right border, drawn from the bottom up
+        for x, a_player in [(-width, player_list[0]), (width, player_list[1])]:
+            for i in range(0, n_interval, 2):
+                y_start = -height + i*dash
+                self._static.polyline([(x, y_start), (x, y_start + dash)], a_player.color, 10)
+        for ui_name in self._ui_name_list:
+            self.__record_label(self._static, ui_name)
+        self._static.flush(self._canvas)
+        self._static_drawn = True
+
+    def draw(self, engine):
+        """
+        Record the paddles, balls and scores and flush them to the canvas.
+
+        Args:
+            engine (PongEngine): The simulation to draw
+        """
+        if not self._static_drawn:
+            self.__record_static(engine)
+
+        dynamic = self._dynamic
+        dynamic.clear()
+        for i, a_player in enumerate(engine.player_list):
+            dynamic.polygon(a_player.corners(), a_player.color, a_player.thickness)
+            self._ui_score_list[i].text = str(a_player.score)
+            self.__record_label(dynamic, self._ui_score_list[i])
+
+        t = engine.t
+        for a_ball in engine.ball_list:
+            x, y = a_ball.pos_at(t)
+            dynamic.circle(x, y, a_ball.size, a_ball.color)
+
+        dynamic.flush(self._canvas)
+        self._canvas.update()
+
+    def clear(self):
+        """Delete every canvas item of the match, the static layer is recorded again on the next frame."""
+        self._static.delete(self._canvas)
+        self._dynamic.delete(self._canvas)
+        self._static_drawn = False
+
+    def close(self):
+        """Close the turtle window."""
+        turtle.bye()
@@ -0,0 +1,206 @@
+""" Module providing EventQueue class, a managed priority queue of events"""
+
+import heapq
+import itertools
+import math
+
+from my_event import Event
+
+class EventQueue:
+    """
+    A priority queue of events that keeps track of which of its entries are stale.
+
+    Events that would never happen (infinite time) are refused. Every event is
+    registered under the balls and paddle it involves, invalidating one of them
+    marks all of its queued events as stale, and once the stale entries pass a
+    set fraction of the heap it is compacted.
+
+    The heap holds (time, seq, event) tuples rather than the events themselves,
+    so comparisons are done on floats and ints in C instead of calling
+    Event.__lt__. The sequence number breaks ties in the order events were pushed.
+
+    Attributes:
+        # _heap (list): Heap of (time, seq, event) entries ordered by time
+        # _seq (count): Sequence numbers for the entries
+        # _owners (dict): Queued events of each ball and paddle
+        # _stale (int) <<GET>>: Number of stale entries in the heap
+        # _stale_threshold (float): Fraction of stale entries that triggers a compaction
+        # _min_compact_size (int): Heap size under which it is never compacted
+        # _n_compactions (int) <<GET>>: Number of compactions done so far
+
+    Methods:
+        + push(Event): Add an event, refusing it if it never happens
+        + pop(): Remove and return the next live event
+        + peek(): The next live event, without removing it
+        + invalidate(object): Mark every queued event of an owner as stale
+        + compact(): Rebuild the heap without its stale entries
+        + clear(): Remove every event
+        + size (int) <<GET>>: Number of entries in the heap
+        + live (int) <<GET>>: Number of live entries in the heap
+        + stale_ratio (float) <<GET>>: Fraction of the heap that is stale
+        - __len__(): Number of entries in the heap
+    """
+
+    def __init__(self, stale_threshold: float=0.5, min_compact_size: int=64):
+        """
+        Args:
+            stale_threshold (float, optional): Fraction of stale entries that triggers
+                                               a compaction. Defaults to 0.5.
+            min_compact_size (int, optional): Heap size under which it is never
+                                              compacted. Defaults to 64.
+        """
+        self._heap = []
+        self._seq = itertools.count()
+        self._owners = {}
+        self._stale = 0
+        self._stale_threshold = stale_threshold
+        self._min_compact_size = min_compact_size
+        self._n_compactions = 0
+
+    @property
+    def size(self):
+        """Getter for the number of entries in the heap"""
+        return len(self._heap)
+
+    @property
+    def live(self):
+        """Getter for the number of live entries in the heap"""
+        return len(self._heap) - self._stale
+
+    @property
+    def stale(self):
+        """Getter for the number of stale entries in the heap"""
+        return self._stale
+
+    @property
+    def stale_ratio(self):
+        """Getter for the fraction of the heap that is stale"""
+        if not self._heap:
+            return 0.0
+        return self._stale / len(self._heap)
+
+    @property
+    def n_compactions(self):
+        """Getter for the number of compactions done so far"""
+        return self._n_compactions
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __owners_of(self, event: Event):
+        """ Returns the objects whose changes make the event stale."""
+        return [owner for owner in (event.ball_a, event.ball_b, event.paddle)
+                if owner is not None]
+
+    def __register(self, owner, event: Event):
+        """
+        Register an event under one of its owners. The list of an owner that is
+        rarely invalidated (a paddle standing still) is pruned whenever its length
+        reaches a power of two, so that it doesn't keep processed events forever.
+        """
+        events = self._owners.setdefault(owner, [])
+        events.append(event)
+        n_events = len(events)
+        if n_events >= self._min_compact_size and n_events & (n_events - 1) == 0:
+            events[:] = [an_event for an_event in events if not an_event.stale]
+
+    def push(self, event: Event):
+        """
+        Add an event to the queue.
+
+        Args:
+            event (Event): The event to add
+
+        Returns:
+            bool: False if the event was refused because it never happens
+        """
+        time = event.time
+        if not math.isfinite(time):
+            return False
+
+        heapq.heappush(self._heap, (time, next(self._seq), event))
+        for owner in self.__owners_of(event):
+            self.__register(owner, event)
+        return True
+
+    def pop(self):
+        """
+        Remove and return the next live event, dropping stale ones on the way.
+
+        Returns:
+            Event: The next live event
+
+        Raises:
+            IndexError: If there is no live event left
+        """
+        while self._heap:
+            event = heapq.heappop(self._heap)[2]
+            if event.stale:
+                self._stale -= 1
+                continue
+            # a processed event can't become stale again
+            event.stale = True
+            if event.is_valid():
+                return event
+        raise IndexError("pop from an empty EventQueue")
+
+    def peek(self):
+        """
+        Returns the next live event without removing it, dropping the stale
+        and invalid entries on top of the heap on the way.
+
+        Returns:
+            Event: The next live event, or None if there is none
+        """
+        heap = self._heap
+        while heap:
+            event = heap[0][2]
+            if event.stale:
+                heapq.heappop(heap)
+                self._stale -= 1
+            elif not event.is_valid():
+                # an invalid event can't become valid again
+                heapq.heappop(heap)
+                event.stale = True
+            else:
+                return event
+        return None
+
+    def invalidate(self, owner):
+        """
+        Mark every queued event of an owner as stale, compacting the heap
+        if there are too many stale entries.
+
+        Args:
+            owner (object): The ball or paddle that changed
+        """
+        for event in self._owners.pop(owner, ()):
+            if not event.stale:
+                event.stale = True
+                self._stale += 1
+
+        if (len(self._heap) >= self._min_compact_size
+                and self._stale > self._stale_threshold * len(self._heap)):
+            self.compact()
+
+    def compact(self):
+        """Rebuild the heap and the owner registry without the stale entries."""
+        self._heap = [entry for entry in self._heap if not entry[2].stale]
+        heapq.heapify(self._heap)
+        self._stale = 0
+        self._n_compactions += 1
+
+        self._owners = {}
+        for _, _, event in self._heap:
+            for owner in self.__owners_of(event):
+                self.__register(owner, event)
+
+    def clear(self):
+        """
+        Remove every event, emptying the heap and the owner registry in place
+        so that a new match reuses them instead of allocating new ones.
+        """
+        self._heap.clear()
+        self._owners.clear()
+        self._stale = 0
+        self._seq = itertools.count()
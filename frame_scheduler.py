@@ -0,0 +1,166 @@
+""" Module providing FrameScheduler class, pacing redraws against the wall clock"""
+
+import time
+from collections import deque
+
+class FrameScheduler:
+    """
+    Paces the simulation against a monotonic wall clock and adapts the frame rate
+    to what redrawing really costs on the host.
+
+    Simulation time advances at time_scale units per wall-clock second whatever the
+    speed of the host. Each frame the scheduler waits until the wall clock catches
+    up with the simulation, measures how long the frame took (simulation work plus
+    drawing), and lowers or raises the frame rate to keep that under the target
+    frame time. When the host falls behind by more than a frame, the late frames
+    are counted as dropped and the clock is re-anchored instead of trying to catch up.
+
+    Attributes:
+        # _target_frame_time (float): Wall-clock seconds per frame aimed for
+        # _time_scale (float) <<GET>>: Simulation time units per wall-clock second
+        # _min_fps (float): Lowest frame rate allowed
+        # _max_fps (float): Highest frame rate allowed
+        # _fps (float) <<GET>>: Current frame rate
+        # _cost (float): Moving average of the cost of a frame, in seconds
+        # _frame_times (deque): Cost of the most recent frames, in seconds
+        # _frames (int): Number of frames drawn
+        # _dropped (int) <<GET>>: Number of frames dropped
+        # _anchor_wall (float): Wall-clock time matching _anchor_sim
+        # _anchor_sim (float): Simulation time matching _anchor_wall
+        # _busy_since (float): Wall-clock time the last frame finished drawing
+        # _clock (callable): Reads the wall clock, in seconds
+        # _sleep (callable): Waits for a number of wall-clock seconds
+
+    Methods:
+        + start(float): Anchor the wall clock to a simulation time
+        + frame(float, callable): Pace, draw and measure one frame
+        + stats(): Frame statistics
+        - __adapt(): Adjust the frame rate to the cost of the frames
+    """
+
+    def __init__(self, target_frame_time: float=1/60,
+                 time_scale: float=15.0,
+                 min_fps: float=10.0,
+                 history: int=600,
+                 clock=time.monotonic,
+                 sleep=time.sleep):
+        """
+        Args:
+            target_frame_time (float, optional): Wall-clock seconds per frame aimed for.
+                                                 Defaults to 1/60.
+            time_scale (float, optional): Simulation time units per wall-clock second,
+                                          sets the speed of the game. Defaults to 15.
+            min_fps (float, optional): Lowest frame rate allowed. Defaults to 10.
+            history (int, optional): Number of recent frames kept for percentiles.
+                                     Defaults to 600.
+            clock (callable, optional): Reads the wall clock, in seconds, ex. a fake
+                                        clock in tests. Defaults to time.monotonic.
+            sleep (callable, optional): Waits for a number of seconds on that clock.
+                                        Defaults to time.sleep.
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self._target_frame_time = target_frame_time
+        self._time_scale = time_scale
+        self._min_fps = min_fps
+        self._max_fps = 1 / target_frame_time
+        self._fps = self._max_fps
+        self._cost = 0.0
+        self._frame_times = deque(maxlen=history)
+        self._frames = 0
+        self._dropped = 0
+        self._anchor_wall = clock()
+        self._anchor_sim = 0.0
+        self._busy_since = self._anchor_wall
+
+    @property
+    def fps(self):
+        """Getter for the current frame rate"""
+        return self._fps
+
+    @property
+    def time_scale(self):
+        """Getter for the simulation time units per wall-clock second"""
+        return self._time_scale
+
+    @property
+    def dropped(self):
+        """Getter for the number of dropped frames"""
+        return self._dropped
+
+    def start(self, sim_t: float):
+        """
+        Anchor the wall clock to a simulation time, at the start of a match.
+
+        Args:
+            sim_t (float): Current simulation time
+        """
+        self._anchor_wall = self._clock()
+        self._anchor_sim = sim_t
+        self._busy_since = self._anchor_wall
+
+    def frame(self, sim_t: float, draw):
+        """
+        Wait for the wall clock to reach sim_t, draw one frame and measure it.
+
+        Args:
+            sim_t (float): Simulation time of the frame
+            draw (callable): Draws the frame
+
+        Returns:
+            float: Simulation time until the next frame
+        """
+        now = self._clock()
+        # time spent simulating since the last frame was drawn
+        frame_time = now - self._busy_since
+        due = self._anchor_wall + (sim_t - self._anchor_sim) / self._time_scale
+        frame_period = 1 / self._fps
+        if now < due:
+            self._sleep(due - now)
+        elif now - due > frame_period:
+            # too late, give up on the missed frames rather than rushing through them
+            self._dropped += int((now - due) / frame_period)
+            self._anchor_wall = now
+            self._anchor_sim = sim_t
+
+        start = self._clock()
+        draw()
+        self._busy_since = self._clock()
+        frame_time += self._busy_since - start
+        self._frames += 1
+        self._frame_times.append(frame_time)
+        self._cost = frame_time if self._frames == 1 else 0.9*self._cost + 0.1*frame_time
+        self.__adapt()
+
+        return self._time_scale / self._fps
+
+    def __adapt(self):
+        """
+        Set the frame rate so that a frame, at its average cost plus some headroom,
+        fits in the frame period, never above the target rate.
+        """
+        period = max(self._target_frame_time, self._cost * 1.25)
+        self._fps = min(self._max_fps, max(self._min_fps, 1 / period))
+
+    def stats(self):
+        """
+        Returns the frame statistics.
+
+        Returns:
+            dict: frames drawn, frames dropped, current fps and the 50th, 95th and
+                  99th percentiles of the recent frame times in milliseconds
+        """
+        frame_times = sorted(self._frame_times)
+        percentiles = {}
+        for percentile in (50, 95, 99):
+            if frame_times:
+                index = min(len(frame_times) - 1, int(len(frame_times) * percentile / 100))
+                percentiles[f"p{percentile}_ms"] = frame_times[index] * 1000
+            else:
+                percentiles[f"p{percentile}_ms"] = 0.0
+
+        stats = {"frames": self._frames,
+                 "dropped": self._dropped,
+                 "fps": self._fps}
+        stats.update(percentiles)
+        return stats
@@ -0,0 +1,330 @@
+""" Monte Carlo match runner for balancing PongPlus
+
+Runs many seeded headless matches for every point of a parameter grid (ball
+speed, number of balls, paddle height and winning score) across a process pool,
+played by scripted players pressing their controls at random, or by bots.
+Results stream back match by match and are aggregated as they arrive into the
+rally length (paddle hits of a ball before it scores) and match duration of each
+grid point. The same seeds are used at every grid point, so the points are
+compared on the same matches.
+
+    python monte_carlo.py --speed 6 8 12 --balls 2 10 --paddle-height 100 150 --matches 200
+"""
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import math
+import os
+import sys
+import time
+
+from pong_engine import PongEngine
+from scripted_input import ScriptedInput
+
+# the parameters of a grid point, in the order they are printed
+GRID_KEYS = ("ball_speed", "num_balls", "paddle_height", "winning_score")
+
+
+class RunningStats:
+    """
+    Count, mean, variance, minimum and maximum of a stream of values, kept
+    without storing the values (Welford's algorithm). Two of them can be merged,
+    so each match summarises its own values and the summaries are combined.
+
+    Attributes:
+        # _n (int) <<GET>>: Number of values
+        # _mean (float) <<GET>>: Mean of the values
+        # _m2 (float): Sum of the squared differences from the mean
+        # _min (float) <<GET>>: Smallest value
+        # _max (float) <<GET>>: Largest value
+
+    Methods:
+        + add(float): Add a value
+        + merge(RunningStats): Add the values summarised by other stats
+        + to_dict(): Summary of the values
+    """
+
+    __slots__ = ("_n", "_mean", "_m2", "_min", "_max")
+
+    def __init__(self, values: list=()):
+        """
+        Args:
+            values (list, optional): Values to start with. Defaults to none.
+        """
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        for value in values:
+            self.add(value)
+
+    @property
+    def n(self):
+        """Getter for the number of values"""
+        return self._n
+
+    @property
+    def mean(self):
+        """Getter for the mean of the values, nan if there are none"""
+        return self._mean if self._n else math.nan
+
+    @property
+    def std(self):
+        """Getter for the sample standard deviation of the values, nan under 2 values"""
+        return math.sqrt(self._m2 / (self._n - 1)) if self._n > 1 else math.nan
+
+    @property
+    def min(self):
+        """Getter for the smallest value"""
+        return self._min
+
+    @property
+    def max(self):
+        """Getter for the largest value"""
+        return self._max
+
+    def add(self, value: float):
+        """
+        Add a value.
+
+        Args:
+            value (float): The value to add
+        """
+        self._n += 1
+        delta = value - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (value - self._mean)
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def merge(self, other):
+        """
+        Add the values summarised by other stats, as if they were added one by one.
+
+        Args:
+            other (RunningStats): The stats to merge in
+        """
+        if other.n == 0:
+            return
+        n = self._n + other.n
+        delta = other.mean - self._mean
+        self._mean += delta * other.n / n
+        self._m2 += other._m2 + delta * delta * self._n * other.n / n
+        self._n = n
+        self._min = min(self._min, other.min)
+        self._max = max(self._max, other.max)
+
+    def to_dict(self):
+        """ Returns the summary of the values, JSON friendly."""
+        if self._n == 0:
+            return {"n": 0}
+        return {"n": self._n, "mean": self.mean, "std": self.std,
+                "min": self._min, "max": self._max}
+
+
+def param_grid(grid: dict):
+    """
+    Every combination of the values of a parameter grid.
+
+    Args:
+        grid (dict): Values of each parameter, ex. {"ball_speed": [6, 8], "num_balls": [2]}
+
+    Returns:
+        list: One dict of parameters per grid point
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def run_match(params: dict, seed: int, tilt_activity: float, max_events: int, bots: bool):
+    """
+    Run one seeded headless match, in a worker process.
+
+    Args:
+        params (dict): Grid point of the match, see GRID_KEYS
+        seed (int): Seed of the match and of its scripted players
+        tilt_activity (float): Probability of the scripted players tilting, from 0 to 1
+        max_events (int): Stop after this many events even if nobody won
+        bots (bool): Bots play the match instead of scripted players
+
+    Returns:
+        dict: The grid point, seed, events, duration, whether it finished, winner
+              and the summary of its rally lengths
+    """
+    engine = PongEngine(num_balls=params["num_balls"],
+                        player_names=["P1", "P2"],
+                        player_colors=[(0, 0, 255), (255, 0, 0)],
+                        winning_score=params["winning_score"],
+                        ball_speed=params["ball_speed"],
+                        paddle_size=[10, params["paddle_height"]],
+                        seed=seed,
+                        bots=[bots, bots])
+    drivers = []
+    if not bots:
+        drivers = [ScriptedInput(a_player, tilt_activity, seed=seed + a_player.uid)
+                   for a_player in engine.player_list]
+
+    n_events = 0
+    engine.start()
+    while n_events < max_events and engine.step():
+        n_events += 1
+        for a_driver in drivers:
+            a_driver.update(engine.t)
+
+    winner = engine.winner
+    return {"params": params,
+            "seed": seed,
+            "events": n_events,
+            "duration": engine.t,
+            "finished": winner is not None,
+            "winner": 0 if winner is None else winner.uid,
+            "rallies": RunningStats(engine.rally_lengths)}
+
+
+def run_grid(grid: dict,
+             matches: int,
+             workers: int=None,
+             tilt_activity: float=0.5,
+             max_events: int=200000,
+             seed: int=0,
+             bots: bool=False,
+             on_result=None):
+    """
+    Run seeded matches for every grid point across a process pool, aggregating
+    the results as they come back in whatever order the matches finish.
+
+    Args:
+        grid (dict): Values of each parameter, see GRID_KEYS
+        matches (int): Matches per grid point, seeded seed, seed + 1, ...
+        workers (int, optional): Worker processes. Defaults to the number of cores.
+        tilt_activity (float, optional): Probability of the scripted players tilting.
+                                         Defaults to 0.5.
+        max_events (int, optional): Stop a match after this many events. Defaults to 200000.
+        seed (int, optional): Seed of the first match of each grid point. Defaults to 0.
+        bots (bool, optional): Bots play the matches instead of scripted players.
+                               Defaults to False.
+        on_result (callable, optional): Called with each match result and the
+                                        aggregate of its grid point as they arrive.
+
+    Returns:
+        dict: Aggregate of each grid point, by the tuple of its parameter values
+    """
+    points = param_grid(grid)
+    aggregates = {}
+    for params in points:
+        aggregates[tuple(params[key] for key in GRID_KEYS)] = {
+            "params": params,
+            "matches": 0,
+            "unfinished": 0,
+            "wins": {1: 0, 2: 0},
+            "duration": RunningStats(),
+            "events": RunningStats(),
+            "rallies": RunningStats()}
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_match, params, seed + i, tilt_activity, max_events, bots)
+                   for i in range(matches) for params in points]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            params = result["params"]
+            aggregate = aggregates[tuple(params[key] for key in GRID_KEYS)]
+            aggregate["matches"] += 1
+            if result["finished"]:
+                aggregate["wins"][result["winner"]] += 1
+                aggregate["duration"].add(result["duration"])
+            else:
+                aggregate["unfinished"] += 1
+            aggregate["events"].add(result["events"])
+            aggregate["rallies"].merge(result["rallies"])
+            if on_result is not None:
+                on_result(result, aggregate)
+    return aggregates
+
+
+def parse_args(argv: list):
+    """ Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--speed", type=float, nargs="+", default=[8.0],
+                        help="initial ball speeds to run")
+    parser.add_argument("--balls", type=int, nargs="+", default=[2, 10],
+                        help="ball counts to run")
+    parser.add_argument("--paddle-height", type=float, nargs="+", default=[150.0],
+                        help="paddle heights to run")
+    parser.add_argument("--score", type=int, nargs="+", default=[10],
+                        help="winning scores to run")
+    parser.add_argument("--matches", type=int, default=100,
+                        help="matches per grid point")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes, defaults to the number of cores")
+    parser.add_argument("--bots", action="store_true",
+                        help="bots play the matches instead of scripted players")
+    parser.add_argument("--tilt", type=float, default=0.5,
+                        help="tilt activity of the scripted players, from 0 to 1")
+    parser.add_argument("--max-events", type=int, default=200000,
+                        help="stop a match after this many events")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="monte_carlo_results.json")
+    return parser.parse_args(argv)
+
+
+def main(argv: list=None):
+    """ Run the grid and report each grid point, returns the exit code."""
+    args = parse_args(argv)
+    grid = {"ball_speed": args.speed,
+            "num_balls": args.balls,
+            "paddle_height": args.paddle_height,
+            "winning_score": args.score}
+    total = args.matches * len(param_grid(grid))
+    done = 0
+
+    def progress(_result, _aggregate):
+        nonlocal done
+        done += 1
+        print(f"\r{done}/{total} matches", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    aggregates = run_grid(grid, args.matches,
+                          workers=args.workers,
+                          tilt_activity=args.tilt,
+                          max_events=args.max_events,
+                          seed=args.seed,
+                          bots=args.bots,
+                          on_result=progress)
+    wall_time = time.perf_counter() - start
+    print(file=sys.stderr)
+
+    results = []
+    for aggregate in aggregates.values():
+        params = aggregate["params"]
+        rallies = aggregate["rallies"]
+        duration = aggregate["duration"]
+        print(f"speed={params['ball_speed']:<5} balls={params['num_balls']:<5} "
+              f"paddle={params['paddle_height']:<6} score={params['winning_score']:<3} "
+              f"rally={rallies.mean:6.2f} (max {rallies.max:g})  "
+              f"duration={duration.mean:8.1f} ± {duration.std:6.1f}  "
+              f"wins={aggregate['wins'][1]}/{aggregate['wins'][2]}  "
+              f"unfinished={aggregate['unfinished']}")
+        results.append({"params": params,
+                        "matches": aggregate["matches"],
+                        "unfinished": aggregate["unfinished"],
+                        "wins": aggregate["wins"],
+                        "rally_length": rallies.to_dict(),
+                        "duration": duration.to_dict(),
+                        "events": aggregate["events"].to_dict()})
+    print(f"{total} matches in {wall_time:.1f} s on {args.workers or os.cpu_count()} workers")
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"matches_per_point": args.matches,
+                   "seed": args.seed,
+                   "tilt_activity": args.tilt,
+                   "bots": args.bots,
+                   "results": results}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,8 +12,11 @@ class Event:
         # _ball_a (Ball) <<GET>>: First ball involved in the event (or None)
         # _ball_b (Ball) <<GET>>: Second ball involved in the event (or None)
         # _paddle (Paddle) <<GET>>: Paddle involved in the event (or None)
+        # _cell (tuple) <<GET>>: Grid cell ball_a is entering, for cell-crossing events (or None)
         # _count_a (int): Collision count of ball_a at event creation
         # _count_b (int): Collision count of ball_b at event creation
+        # _version_p (int): Version of the paddle at event creation
+        # _stale (bool) <<GET, SET>>: Whether the event was invalidated or already processed
     
     Methods:
         + is_valid(): Check if the event is still valid.
@@ -21,10 +24,15 @@ class Event:
         - __lt__(self, Event): Compare Events based on time
     """
 
+    # thousands of events are created per second, slots keep them small
+    __slots__ = ("_time", "_ball_a", "_ball_b", "_paddle", "_cell",
+                 "_count_a", "_count_b", "_version_p", "_stale")
+
     def __init__(self, time: float,
                  ball_a: Ball,
                  ball_b: Ball,
-                 paddle: Paddle):
+                 paddle: Paddle,
+                 cell: tuple=None):
         """
         Initialize an event with given parameters.
 
@@ -33,11 +41,14 @@ class Event:
             ball_a (Ball): First ball involved (or None)
             ball_b (Ball): Second ball involved (or None)
             paddle (Paddle): Paddle involved (or None)
+            cell (tuple, optional): (column, row) of the grid cell ball_a is entering.
+                                    Only set for cell-crossing events. Defaults to None.
         """
         self._time = time
         self._ball_a = ball_a
         self._ball_b = ball_b
         self._paddle = paddle
+        self._cell = cell
 
         # Store collision counts at event creation for validity checking
         if ball_a is not None:
@@ -48,6 +59,11 @@ class Event:
             self._count_b = ball_b.count
         else:
             self._count_b = -1
+        if paddle is not None:
+            self._version_p = paddle.version
+        else:
+            self._version_p = -1
+        self._stale = False
 
     @property
     def time(self):
@@ -69,12 +85,27 @@ class Event:
         """Getter for paddle"""
         return self._paddle
 
+    @property
+    def cell(self):
+        """Getter for cell"""
+        return self._cell
+
+    @property
+    def stale(self):
+        """Getter for whether the event was invalidated or already processed"""
+        return self._stale
+
+    @stale.setter
+    def stale(self, stale):
+        """Setter for whether the event was invalidated or already processed"""
+        self._stale = stale
+
     def is_valid(self):
         """
         Check if the event is still valid.
         
         An event becomes invalid if either ball has experienced the predicted
-        event since the event was created.
+        event, or if the paddle has moved or tilted, since the event was created.
 
         Returns:
             bool: True if event is still valid, False otherwise
@@ -83,6 +114,8 @@ class Event:
             return False
         if (self._ball_b is not None) and (self._ball_b.count != self._count_b):
             return False
+        if (self._paddle is not None) and (self._paddle.version != self._version_p):
+            return False
         return True
 
     def __str__(self) -> str:
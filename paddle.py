@@ -1,14 +1,14 @@
 """ Module providing paddle class"""
 
-import turtle
-
+import math
 
 class Paddle:
     """
     Represents a paddle in the game that can be positioned and rotated.
     
-    This class handles the basic paddle functionality including drawing
-    and positioning. It serves as the base class for the Player class.
+    This class handles the basic paddle functionality including its
+    position and rotation. It serves as the base class for the Player class.
+    Drawing is left to the Renderer.
 
     Attributes:
         + pos (list) <<GET, SET>>: [x, y] position in the form of list
@@ -18,13 +18,19 @@ class Paddle:
         # _y (float) <<GET, SET>>: Y position of paddle center
         # _angle_deg (float) <<GET, SET>>: Rotation angle in degrees
         # _color (tuple) <<GET>>: RGB color of the paddle
-        # _thickness (int): Line thickness for drawing
+        # _thickness (int) <<GET>>: Line thickness for drawing
+        # _version (int) <<GET>>: Counter increased every time the paddle moves or tilts
 
     Methods:
-        + draw(): Draw the paddle
+        + corners(): The 4 corners of the paddle in world coordinates
+        + motion_at(float): Position, angle and their rates of change at a given time
+        # _set_pose(float, float): Move and rotate without changing the version
         - __str__(): String representation
     """
 
+    __slots__ = ("_width", "_height", "_angle_deg", "_color", "_thickness", "_version",
+                 "_x", "_y")
+
     def __init__(self, color: tuple,
                  size: list,
                  thickness: float=10,
@@ -46,8 +52,9 @@ class Paddle:
         self._angle_deg = 0
         self._color = color
         self._thickness = thickness
-        turtle.penup()
-        turtle.setheading(0)
+        self._version = 0
+        self._x = None
+        self._y = None
         self.pos = pos
 
 
@@ -64,9 +71,11 @@ class Paddle:
         Args:
             pos (list): [x, y] new position
         """
+        if pos[0] == self._x and pos[1] == self._y:
+            return
         self._x = pos[0]
         self._y = pos[1]
-        turtle.goto(self._x, self._y)
+        self._version += 1
 
     @property
     def x(self):
@@ -76,7 +85,9 @@ class Paddle:
     @x.setter
     def x(self, x):
         """X position setter"""
-        self._x = x
+        if x != self._x:
+            self._x = x
+            self._version += 1
 
     @property
     def y(self):
@@ -86,7 +97,9 @@ class Paddle:
     @y.setter
     def y(self, y):
         """Y position setter"""
-        self._y = y
+        if y != self._y:
+            self._y = y
+            self._version += 1
 
     @property
     def angle_deg(self):
@@ -96,7 +109,54 @@ class Paddle:
     @angle_deg.setter
     def angle_deg(self, angle):
         """Paddle's angle setter, in degrees."""
-        self._angle_deg = angle
+        if angle != self._angle_deg:
+            self._angle_deg = angle
+            self._version += 1
+
+    def motion_at(self, t):
+        """
+        Returns where the paddle is and how fast it moves at a given time, for the
+        swept collision checks. A plain paddle stays where it is, Player overrides
+        this with its easing. Works on floats and NumPy arrays of times.
+
+        Args:
+            t (float): Simulation time, unused here since a plain paddle doesn't move
+
+        Returns:
+            tuple: (y, angle in radians, y velocity, angular velocity in radians)
+        """
+        return self._y, math.radians(self._angle_deg), 0.0, 0.0
+
+    def _set_pose(self, y: float, angle_deg: float):
+        """
+        Move and rotate the paddle along a path that is already known to the
+        collision predictions, so without changing its version.
+
+        Args:
+            y (float): Y position of the paddle center
+            angle_deg (float): Angle in degrees
+        """
+        self._y = y
+        self._angle_deg = angle_deg
+
+    def corners(self):
+        """
+        Returns the 4 corners of the paddle, rotated with it, in world coordinates.
+
+        Returns:
+            list: (x, y) of each corner, going around the paddle
+        """
+        angle = math.radians(self._angle_deg)
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        half_width = self._width/2
+        half_height = self._height/2
+        corners = []
+        for corner_x, corner_y in [(half_width, half_height), (-half_width, half_height),
+                                   (-half_width, -half_height), (half_width, -half_height)]:
+            corners.append((self._x + cos_a*corner_x - sin_a*corner_y,
+                            self._y + sin_a*corner_x + cos_a*corner_y))
+        return corners
 
     @property
     def width(self):
@@ -113,35 +173,18 @@ class Paddle:
         """ Getter for color"""
         return self._color
 
-    def draw(self):
+    @property
+    def thickness(self):
+        """ Getter for line thickness"""
+        return self._thickness
+
+    @property
+    def version(self):
         """
-        Draw the paddle using turtle graphics.
-        
-        Draws a rectangular paddle centered at its position with the current
-        rotation angle. The paddle is filled with its color.
+        Getter for the version counter, which changes every time the paddle
+        moves or tilts so that predictions made against it can be invalidated.
         """
-        turtle.color(self._color)
-        turtle.pensize(self._thickness)
-        turtle.goto(self._x, self._y)
-        turtle.setheading(self._angle_deg)
-
-        # Move to starting position
-        turtle.forward(self._width/2)
-        turtle.pendown()
-        turtle.begin_fill()
-
-        # Draw rectangle
-        turtle.left(90)
-        for _ in range(2):
-            turtle.forward(self._height/2)
-            turtle.left(90)
-            turtle.forward(self._width)
-            turtle.left(90)
-            turtle.forward(self._height/2)
-
-        turtle.end_fill()
-        turtle.penup()
-        turtle.goto(self._x, self._y)
+        return self._version
 
     def __str__(self):
         return f"paddle ({self._x:.2f}, {self._y:.2f}) a: {self._angle_deg}*"
@@ -1,5 +1,9 @@
 """ Module providing player class"""
 
+import math
+
+import numpy as np
+
 from paddle import Paddle
 
 class Player(Paddle):
@@ -10,6 +14,14 @@ class Player(Paddle):
     This class adds player-specific functionality including keyboard input handling,
     movement, scoring, and paddle tilting mechanics.
 
+    The paddle eases towards its target position and angle exponentially over time:
+    from the pose it had when the target last changed, at time _motion_t0, the rest of
+    the way shrinks by a factor exp(-_smoothing_rate * dt). Its path is therefore known
+    in closed form (y_at, angle_at) until the next input, whatever the number of events.
+    Following that path doesn't change the paddle's version, only an input does, so
+    predictions made against the path stay valid until the player changes course,
+    unless their search ran out of steps (see Ball.time_to_hit_paddle).
+
     Attributes:
         # _name (str) <<GET>>: Player name
         # _uid (int) <<GET>>: Unique player identifier (1 or 2)
@@ -17,8 +29,14 @@ class Player(Paddle):
         # _max_tilt_angle_deg (float): Maximum tilt angle in degrees (unsigned)
         # _target_angle_deg (float): Target angle for smooth rotation (signed)
         # _target_y (float): Target Y position for smooth movement
+        # _smoothing_rate (float) <<GET>>: Rate of the exponential easing, per unit of time
+        # _motion_t0 (float): Time the current easing started at
+        # _motion_y0 (float): Y position when the current easing started
+        # _motion_angle0 (float): Angle when the current easing started
+        # _clock (float): Time of the last update, inputs start a new easing from it
+        # _max_y (float): Furthest the paddle's center goes from the middle, so that the
+                          paddle stays a clearance away from the top and bottom walls
         - __dist_per_move (float): Distance to move per key press
-        - __border_height (float): Height of game border
         - __input_set (Dict): A dict containing cotrols for both players
 
     Methods:
@@ -28,17 +46,28 @@ class Player(Paddle):
         # _tilt_cw(): Set target angle for clockwise rotation
         # _tilt_ccw(): Set target angle for counter-clockwise rotation
         # _tilt_reset(): Reset target angle to zero
-        + update_angle(): Update paddle angle with smooth rotation
-        + update_position(): Update paddle position with smooth movement
+        + y_at(float): Y position at a given time
+        + angle_at(float): Angle at a given time
+        + motion_at(float): Position, angle and their rates of change at a given time
+        + update(float): Move and rotate the paddle to where it is at a given time
+        + rebase(float): Start the current easing again from a given time
+        + restore_motion(float, float, float, float, float): Set the current easing
+        + decide(float, list): Let a bot pick its moves, keyboard players have nothing to do
         - __initailize_input_set(): Initialize keyboard controls based on player ID
     """
 
+    __slots__ = ("_name", "_uid", "_score", "_max_y", "__input_set",
+                 "_max_tilt_angle_deg", "_target_angle_deg", "__dist_per_move", "_target_y",
+                 "_smoothing_rate", "_motion_t0", "_motion_y0", "_motion_angle0", "_clock")
+
     def __init__(self, name: str,
                  uid: int,
                  color: tuple,
                  size: float,
                  pos: list,
-                 border_height: float):
+                 border_height: float,
+                 smoothing_rate: float=3.0,
+                 clearance: float=0.0):
         """
         Initialize player with given parameters.
 
@@ -48,21 +77,31 @@ class Player(Paddle):
             color (tuple): RGB color for paddle
             size (list): [width, height] of paddle
             pos (list): [x, y] initial position
-            border_height (float): Height of game border
+            border_height (float): Half of the height of the border
+            smoothing_rate (float, optional): Rate of the exponential easing towards
+                                              the target, per unit of time. Defaults to 3.
+            clearance (float, optional): Room kept between the paddle, whatever its tilt,
+                                         and the top and bottom walls, ex. for the largest
+                                         ball to fit so it isn't pinched. Defaults to 0.
         """
         super().__init__(color, size)
         self._name = name
         self._uid = uid
         self._score = 0
-        self.__border_height = border_height
+        self._max_y = border_height - math.hypot(self._width/2, self._height/2) - clearance
         self.__initailize_input_set()
 
-        self._x = pos[0]
-        self._y = pos[1]
+        self.pos = pos
         self._max_tilt_angle_deg = 40
         self._target_angle_deg = 0
         self.__dist_per_move = self._height*0.8
         self._target_y = self._y
+        self._smoothing_rate = smoothing_rate
+        self._clock = 0.0
+        self._motion_t0 = 0.0
+        self._motion_y0 = self._y
+        self._motion_angle0 = self._angle_deg
+        self._version += 1
 
     @property
     def name(self) -> str:
@@ -84,6 +123,23 @@ class Player(Paddle):
         """ PLayer's score Setter"""
         self._score = value
 
+    @property
+    def smoothing_rate(self) -> float:
+        """ Rate of the exponential easing Getter"""
+        return self._smoothing_rate
+
+    @property
+    def motion(self) -> tuple:
+        """
+        Getter for the current easing, everything needed to follow the paddle's path
+        until the next input.
+
+        Returns:
+            tuple: (start time, start y, start angle, target y, target angle)
+        """
+        return (self._motion_t0, self._motion_y0, self._motion_angle0,
+                self._target_y, self._target_angle_deg)
+
     def __initailize_input_set(self):
         """
         Initialize keyboard controls based on player ID.
@@ -121,41 +177,156 @@ class Player(Paddle):
         Move paddle upward if within border limits.
         Updates target Y position for smooth movement.
         """
-        if self._target_y < self.__border_height/2:
-            self._target_y += self.__dist_per_move
+        if self._target_y < self._max_y:
+            self.rebase(self._clock)
+            self._target_y = min(self._target_y + self.__dist_per_move, self._max_y)
 
     def _move_down(self):
         """
         Move paddle downward if within border limits.
         Updates target Y position for smooth movement.
         """
-        if self._target_y > -self.__border_height/2:
-            self._target_y -= self.__dist_per_move
+        if self._target_y > -self._max_y:
+            self.rebase(self._clock)
+            self._target_y = max(self._target_y - self.__dist_per_move, -self._max_y)
 
     def _tilt_cw(self):
         """Set target angle for clockwise rotation."""
+        self.rebase(self._clock)
         self._target_angle_deg = -self._max_tilt_angle_deg
 
     def _tilt_ccw(self):
         """Set target angle for counter-clockwise rotation."""
+        self.rebase(self._clock)
         self._target_angle_deg = self._max_tilt_angle_deg
 
     def _tilt_reset(self):
         """Reset target angle to zero (vertical position)."""
+        self.rebase(self._clock)
         self._target_angle_deg = 0
 
-    def update_position(self):
+    def decide(self, t: float, balls: list):
+        """
+        Called by the engine after every event, for bots to pick their moves.
+        A keyboard player's moves come from get_input, so there is nothing to do.
+
+        Args:
+            t (float): Simulation time
+            balls (list): Balls in play
+        """
+
+    def __ease(self, start: float, target: float, t: float):
+        """
+        Value at time t of an easing from start towards target that began at _motion_t0,
+        snapped to the target once within 0.01 of it.
+        """
+        remaining = (start - target) * math.exp(-self._smoothing_rate * (t - self._motion_t0))
+        if abs(remaining) < 0.01:
+            return target
+        return target + remaining
+
+    def y_at(self, t: float):
+        """
+        Y position of the paddle at a given time, until the next input.
+
+        Args:
+            t (float): Simulation time
+
+        Returns:
+            float: Y position of the paddle center
         """
-        Update paddle position with smooth movement towards target position.
-        Uses interpolation for smooth motion.
+        return self.__ease(self._motion_y0, self._target_y, t)
+
+    def angle_at(self, t: float):
+        """
+        Angle of the paddle at a given time, until the next input.
+
+        Args:
+            t (float): Simulation time
+
+        Returns:
+            float: Angle in degrees
+        """
+        return self.__ease(self._motion_angle0, self._target_angle_deg, t)
+
+    def motion_at(self, t):
+        """
+        Returns where the paddle is and how fast it moves at a given time, from the
+        closed form of its easing, snapped to the target like y_at and angle_at so
+        predicting and stepping agree once the paddle comes to rest. Works on floats
+        and NumPy arrays of times.
+
+        Args:
+            t (float): Simulation time
+
+        Returns:
+            tuple: (y, angle in radians, y velocity, angular velocity in radians)
         """
-        dy = self._target_y - self._y
-        self.pos = [self._x, self._y + 0.3 * dy]
+        if isinstance(t, np.ndarray):
+            decay = np.exp(-self._smoothing_rate * (t - self._motion_t0))
+            remaining_y = (self._motion_y0 - self._target_y) * decay
+            remaining_angle = (self._motion_angle0 - self._target_angle_deg) * decay
+            remaining_y = np.where(np.abs(remaining_y) < 0.01, 0.0, remaining_y)
+            remaining_angle = np.radians(np.where(np.abs(remaining_angle) < 0.01,
+                                                  0.0, remaining_angle))
+        else:
+            decay = math.exp(-self._smoothing_rate * (t - self._motion_t0))
+            remaining_y = (self._motion_y0 - self._target_y) * decay
+            remaining_angle = (self._motion_angle0 - self._target_angle_deg) * decay
+            if abs(remaining_y) < 0.01:
+                remaining_y = 0.0
+            remaining_angle = 0.0 if abs(remaining_angle) < 0.01 else math.radians(remaining_angle)
+        return (self._target_y + remaining_y,
+                math.radians(self._target_angle_deg) + remaining_angle,
+                -self._smoothing_rate * remaining_y,
+                -self._smoothing_rate * remaining_angle)
 
-    def update_angle(self):
+    def update(self, t: float):
         """
-        Update paddle angle with smooth rotation towards target angle.
-        Uses interpolation for smooth rotation.
+        Move and rotate the paddle to where its easing puts it at a given time.
+
+        Args:
+            t (float): Simulation time
+        """
+        self._clock = t
+        self._set_pose(self.y_at(t), self.angle_at(t))
+
+    def rebase(self, t: float):
+        """
+        Start the easing again from the pose the paddle has at a given time, done
+        before the target changes, or when the clock is reset for a new match.
+        The paddle changes course so its version changes.
+
+        Args:
+            t (float): Simulation time
+        """
+        if t >= self._clock:
+            self.update(t)
+        else:
+            # the clock was reset, keep the pose the paddle is in
+            self._clock = t
+        self._motion_t0 = t
+        self._motion_y0 = self._y
+        self._motion_angle0 = self._angle_deg
+        self._version += 1
+
+    def restore_motion(self, t0: float, y0: float, angle0: float,
+                       target_y: float, target_angle: float):
+        """
+        Set the current easing, ex. from a replay, and move the paddle to its start.
+
+        Args:
+            t0 (float): Time the easing started at
+            y0 (float): Y position when the easing started
+            angle0 (float): Angle when the easing started, in degrees
+            target_y (float): Target Y position
+            target_angle (float): Target angle, in degrees
         """
-        d_angle = self._target_angle_deg - self._angle_deg
-        self._angle_deg = self._angle_deg + d_angle * 0.3
+        self._motion_t0 = t0
+        self._motion_y0 = y0
+        self._motion_angle0 = angle0
+        self._target_y = target_y
+        self._target_angle_deg = target_angle
+        self._clock = t0
+        self._set_pose(y0, angle0)
+        self._version += 1
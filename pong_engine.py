@@ -0,0 +1,560 @@
+""" Module providing the headless simulation core of PongPlus"""
+
+import math
+import random
+
+import numpy as np
+
+from ball import Ball
+from ball_system import BallSystem
+from bot_player import BotPlayer
+from event_queue import EventQueue
+from frame_scheduler import FrameScheduler
+from my_event import Event
+from player import Player
+from renderer import NullRenderer, Renderer
+from replay import ReplayRecorder
+from spatial_grid import SpatialGrid
+
+class PongEngine:
+    """
+    The simulation of a PongPlus match: balls, players, the event queue and scoring.
+
+    Nothing in here depends on turtle or tkinter, drawing is delegated to a
+    Renderer. Rendering is separate from the event queue: the match is advanced
+    from frame to frame with advance_to(), and the renderer samples the balls'
+    positions analytically at the frame's time, so the cost of the physics doesn't
+    depend on the frame rate.
+
+    Attributes:
+        # _num_balls (int): Number of balls in play
+        # _ball_list (list) <<GET>>: List of Ball objects
+        # _ball_system (BallSystem) <<GET>>: Arrays holding the state of every ball
+        # _player_list (list) <<GET>>: List of Player objects
+        # _t (float) <<GET>>: Current simulation time
+        # _queue (EventQueue) <<GET>>: Priority queue for event handling
+        # _hz (float) <<GET, SET>>: Frames per unit of simulation time, 0 to run without drawing
+        # _winning_score (int) <<GET>>: Score needed to win
+        # _base_ball_speed (float): Initial ball speed
+        # _border_width (float) <<GET>>: Half of the width of the border
+        # _border_height (float) <<GET>>: Half of the height of the border
+        # _renderer (Renderer): Renderer called on every frame
+        # _scheduler (FrameScheduler): Paces the frames against the wall clock, None to use _hz
+        # _paddle_versions (dict): Version of each paddle when its events were last predicted
+        # _grid (SpatialGrid): Broad phase for ball-ball predictions, None to check all pairs
+        # _seed (int) <<GET>>: Seed of the match's random generator, None if unseeded
+        # _rng (Random): Random generator of the match, shared by its balls
+        # _recorder (ReplayRecorder): Records the events and inputs of the match, or None
+        # _paddle_size (list): [width, height] of the paddles
+        # _rally_hits (list): Paddle hits of each ball since it spawned
+        # _rally_lengths (list) <<GET>>: Paddle hits of every ball that scored, in order
+
+    Methods:
+        + start(): Fill the event queue with the initial predictions
+        + step(): Process the next event
+        + advance_to(float): Process the events up to a time and move the clock there
+        + run(float): Process events and draw frames until a player wins or a time limit
+        + reset(int, ReplayRecorder): Reset the scores, balls and clock for a new match
+        + winner (Player) <<GET>>: The player who won, or None
+        - __create_objects(list, list, list): Create the balls and players
+        - __ball_predict(ball): Predict future collisions for a ball
+        - __ball_pair_predict(Ball, list): Predict collisions between a ball and other balls
+        - __wall_predict(Ball, float, float): Queue the wall events of a ball
+        - __cross_predict(Ball): Predict when a ball crosses into another grid cell
+        - __cross_cell(Event): Move a ball into the cell it crossed into
+        - __paddle_predict(Ball, Player): Predict collisions between a ball and a paddle
+        - __predict_paddle_collisions(list): Predict paddle collisions after an event
+        - __draw(): Hand the current state to the renderer
+    """
+
+    def __init__(self, num_balls: int,
+                 player_names: list,
+                 player_colors: list,
+                 winning_score: int,
+                 ball_speed: float=8,
+                 border_size: list=None,
+                 renderer: Renderer=None,
+                 spatial_index: bool=False,
+                 scheduler: FrameScheduler=None,
+                 seed: int=None,
+                 recorder: ReplayRecorder=None,
+                 paddle_size: list=None,
+                 bots: list=None):
+        """
+        Args:
+            num_balls (int): Number of balls in play
+            player_names (list): List of player names, ex. [name1, name2]
+            player_colors (list): List of RGB colors for players, ex. [(0,0,255), (0,255,0)]
+            winning_score (int): Score needed to win
+            ball_speed (float, optional): Initial ball speed. Defaults to 8.
+            border_size (list, optional): [half width, half height] of the border.
+                                          Defaults to [500, 300].
+            renderer (Renderer, optional): Renderer to draw with. Defaults to NullRenderer.
+            spatial_index (bool, optional): Only predict ball-ball collisions between
+                                            balls in neighbouring grid cells instead
+                                            of all pairs. Defaults to False.
+            scheduler (FrameScheduler, optional): Paces the frames against the wall
+                                                  clock and picks the time between them,
+                                                  instead of the fixed _hz. Defaults to None.
+            seed (int, optional): Seed of the match's random generator, the same seed
+                                  and the same inputs give the same events.
+                                  Defaults to None, an unseeded generator.
+            recorder (ReplayRecorder, optional): Records the events and inputs of the
+                                                 match into a replay file. Defaults to None.
+            paddle_size (list, optional): [width, height] of the paddles. Defaults to [10, 150].
+            bots (list, optional): Whether each player is a BotPlayer, ex. [False, True].
+                                   Defaults to two keyboard players.
+        """
+        if border_size is None:
+            border_size = [500, 300]
+        if renderer is None:
+            renderer = NullRenderer()
+        if paddle_size is None:
+            paddle_size = [10, 150]
+        if bots is None:
+            bots = [False, False]
+
+        self._num_balls = num_balls
+        self._ball_list = []
+        self._ball_system = BallSystem(num_balls)
+        self._player_list = []
+        self._t = 0.0
+        self._queue = EventQueue()
+        self._hz = 0
+        self._winning_score = winning_score
+        self._base_ball_speed = ball_speed
+        self._ball_size_range = [20, 40]
+        self._border_width = border_size[0]
+        self._border_height = border_size[1]
+        self._renderer = renderer
+        self._scheduler = scheduler
+        self._paddle_versions = {}
+        self._grid = None
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._recorder = recorder
+        self._paddle_size = paddle_size
+        self._rally_hits = [0] * num_balls
+        self._rally_lengths = []
+
+        self.__create_objects(player_names, player_colors, bots)
+
+        if spatial_index:
+            self._grid = SpatialGrid(self._border_width,
+                                     self._border_height,
+                                     cell_size=2*self._ball_size_range[1])
+
+    @property
+    def ball_list(self):
+        """Getter for the list of balls"""
+        return self._ball_list
+
+    @property
+    def ball_system(self):
+        """Getter for the arrays holding the state of every ball"""
+        return self._ball_system
+
+    @property
+    def player_list(self):
+        """Getter for the list of players"""
+        return self._player_list
+
+    @property
+    def t(self):
+        """Getter for the current simulation time"""
+        return self._t
+
+    @property
+    def queue(self):
+        """Getter for the event queue, exposing its size and stale ratio"""
+        return self._queue
+
+    @property
+    def hz(self):
+        """Getter for the frames per unit of simulation time"""
+        return self._hz
+
+    @hz.setter
+    def hz(self, hz):
+        """Setter for the frames per unit of simulation time"""
+        self._hz = hz
+
+    @property
+    def scheduler(self):
+        """Getter for the frame scheduler, None if frames are at a fixed frequency"""
+        return self._scheduler
+
+    @property
+    def seed(self):
+        """Getter for the seed of the match's random generator"""
+        return self._seed
+
+    @property
+    def rally_lengths(self):
+        """Getter for the paddle hits of every ball that scored, in the order they scored"""
+        return self._rally_lengths
+
+    @property
+    def winning_score(self):
+        """Getter for the winning score"""
+        return self._winning_score
+
+    @property
+    def border_width(self):
+        """Getter for half of the border width"""
+        return self._border_width
+
+    @property
+    def border_height(self):
+        """Getter for half of the border height"""
+        return self._border_height
+
+    @property
+    def winner(self):
+        """The player who reached the winning score, or None if the match is still going"""
+        for a_player in self._player_list:
+            if a_player.score >= self._winning_score:
+                return a_player
+        return None
+
+    def __create_objects(self, player_names: list, player_colors: list, bots: list):
+        """Create the balls and the players' paddles, bots where asked."""
+        for i in range(self._num_balls):
+            self._ball_list.append(Ball(
+                size_range=self._ball_size_range,
+                uid=i,
+                base_speed=self._base_ball_speed,
+                system=self._ball_system,
+                rng=self._rng
+                ))
+
+        # the largest ball fits between a paddle and a wall, or it would be pinched
+        clearance = 2*self._ball_size_range[1]
+        self._player_list = []
+        for i, x in enumerate((-420, 420)):
+            if bots[i]:
+                a_player = BotPlayer(uid=i + 1,
+                                     name=player_names[i],
+                                     color=player_colors[i],
+                                     size=self._paddle_size,
+                                     pos=[x, 0],
+                                     border_height=self._border_height,
+                                     border_width=self._border_width,
+                                     clearance=clearance,
+                                     rng=self._rng)
+            else:
+                a_player = Player(uid=i + 1,
+                                  name=player_names[i],
+                                  color=player_colors[i],
+                                  size=self._paddle_size,
+                                  pos=[x, 0],
+                                  border_height=self._border_height,
+                                  clearance=clearance)
+            self._player_list.append(a_player)
+
+    def __ball_predict(self, a_ball: Ball):
+        """
+        Predict future collisions for a given ball.
+
+        Args:
+            a_ball (Ball): Ball object to predict collisions for
+        """
+        if a_ball is None:
+            return
+
+        # particle-particle collisions
+        if self._grid is None:
+            self.__ball_pair_predict(a_ball)
+        else:
+            self.__ball_pair_predict(a_ball, self._grid.neighbours(a_ball))
+            self.__cross_predict(a_ball)
+
+        # particle-wall collisions
+        self.__wall_predict(a_ball,
+                            a_ball.time_to_leave_border(self._border_width, self._t),
+                            a_ball.time_to_hit_horizontal_wall(self._border_height, self._t))
+
+    def __ball_pair_predict(self, a_ball: Ball, other_balls: list=None):
+        """
+        Predict the collisions between a ball and other balls, all at once
+        with the vectorized kernel of the BallSystem.
+
+        Args:
+            a_ball (Ball): Ball object to predict collisions for
+            other_balls (list, optional): Balls it may collide with. Defaults to every ball.
+        """
+        if other_balls is None:
+            other_balls = self._ball_list
+            indices = None
+        elif not other_balls:
+            return
+        else:
+            indices = np.fromiter((other_ball.index for other_ball in other_balls),
+                                  dtype=int, count=len(other_balls))
+
+        dts = self._ball_system.time_to_hit_balls(a_ball.index, self._t, indices)
+        for other_ball, dt in zip(other_balls, dts.tolist()):
+            # only the collisions that happen go into pq
+            if dt != math.inf:
+                self._queue.push(Event(
+                    self._t + dt, a_ball, other_ball, None))
+
+    def __wall_predict(self, a_ball: Ball, dt_x: float, dt_y: float):
+        """
+        Queue the events of a ball leaving the border and hitting the top/bottom wall.
+
+        Args:
+            a_ball (Ball): Ball object the events are for
+            dt_x (float): Time until the ball leaves the border
+            dt_y (float): Time until the ball hits the top or bottom wall
+        """
+        self._queue.push(Event(self._t + dt_x, a_ball, None, None))
+        self._queue.push(Event(self._t + dt_y, None, a_ball, None))
+
+    def __cross_predict(self, a_ball: Ball):
+        """ Predict when a ball leaves its grid cell."""
+        dt, next_cell = self._grid.time_to_cross(a_ball, self._t)
+        self._queue.push(Event(self._t + dt, a_ball, None, None, cell=next_cell))
+
+    def __cross_cell(self, current_event: Event):
+        """
+        Move a ball into the cell it just crossed into, then predict its
+        collisions with the balls that became its neighbours and its next crossing.
+        The ball's velocity didn't change so none of its other events are stale.
+        """
+        a_ball = current_event.ball_a
+        old_cell = self._grid.cell_of(a_ball)
+        self._grid.move(a_ball, current_event.cell)
+        self.__ball_pair_predict(
+            a_ball, self._grid.new_neighbours(old_cell, current_event.cell))
+        self.__cross_predict(a_ball)
+
+    def __paddle_predict(self, a_ball: Ball, a_player: Player):
+        """
+        predict the collision between a ball and a paddle
+        both vertically and horizontally, up to the ball's next wall event
+        where it is predicted again.
+        """
+        horizon = min(a_ball.time_to_leave_border(self._border_width, self._t),
+                      a_ball.time_to_hit_horizontal_wall(self._border_height, self._t))
+        dt_p = a_ball.time_to_hit_paddle(a_player, self._t, horizon)
+        self._queue.push(Event(
+            self._t + dt_p, a_ball, None, a_player))
+
+    def __predict_paddle_collisions(self, changed_balls: list):
+        """
+        Re-predict only the paddle collisions that may have changed: every ball
+        against a paddle that moved or tilted since its last prediction, and the
+        balls that just had an event against the other paddles.
+
+        Args:
+            changed_balls (list): Balls whose velocity changed in the last event
+        """
+        moved_players = []
+        horizons = None
+        for a_player in self._player_list:
+            if a_player.version != self._paddle_versions.get(a_player):
+                moved_players.append(a_player)
+                self._paddle_versions[a_player] = a_player.version
+                self._queue.invalidate(a_player)
+                if self._recorder is not None:
+                    self._recorder.record_input(self, a_player)
+                # every ball against this paddle in a single pass, up to its next
+                # wall event where it is predicted again
+                if horizons is None:
+                    horizons = np.minimum(
+                        self._ball_system.time_to_leave_border(self._border_width, self._t),
+                        self._ball_system.time_to_hit_horizontal_wall(self._border_height,
+                                                                      self._t))
+                dts = self._ball_system.time_to_hit_paddle(a_player, self._t, horizons)
+                for a_ball, dt in zip(self._ball_list, dts.tolist()):
+                    if dt != math.inf:
+                        self._queue.push(Event(
+                            self._t + dt, a_ball, None, a_player))
+
+        for a_ball in changed_balls:
+            for a_player in self._player_list:
+                if a_player not in moved_players:
+                    self.__paddle_predict(a_ball, a_player)
+
+    def start(self):
+        """Initialize the event queue with the collision events."""
+        if self._recorder is not None:
+            self._recorder.start(self)
+        if self._grid is not None:
+            self._grid.clear()
+            for a_ball in self._ball_list:
+                self._grid.place(a_ball, self._t)
+        # the wall events of every ball are predicted in a single pass
+        dts_x = self._ball_system.time_to_leave_border(self._border_width, self._t)
+        dts_y = self._ball_system.time_to_hit_horizontal_wall(self._border_height, self._t)
+        for a_ball, dt_x, dt_y in zip(self._ball_list, dts_x.tolist(), dts_y.tolist()):
+            if self._grid is None:
+                self.__ball_pair_predict(a_ball)
+            else:
+                self.__ball_pair_predict(a_ball, self._grid.neighbours(a_ball))
+                self.__cross_predict(a_ball)
+            self.__wall_predict(a_ball, dt_x, dt_y)
+        for a_player in self._player_list:
+            a_player.decide(self._t, self._ball_list)
+        self._paddle_versions.clear()
+        self.__predict_paddle_collisions([])
+        if self._scheduler is not None:
+            self._scheduler.start(self._t)
+
+    def step(self):
+        """
+        Process the next live event in the queue.
+
+        Returns:
+            bool: False once a player has reached the winning score, True otherwise
+        """
+        # inputs since the last event changed the paddles' course, their collisions
+        # have to be predicted again before the next one is taken from the queue
+        self.__predict_paddle_collisions([])
+        current_event = self._queue.pop()
+
+        ball_a = current_event.ball_a
+        ball_b = current_event.ball_b
+        paddle_a = current_event.paddle
+        player_1 = self._player_list[0]
+        player_2 = self._player_list[1]
+        # balls are moved lazily, only the paddles and the simulation clock are updated
+        self._t = current_event.time
+        for a_player in self._player_list:
+            a_player.update(self._t)
+
+        if current_event.cell is not None:
+            self.__cross_cell(current_event)
+            self.__predict_paddle_collisions([])
+            return True
+
+        if (ball_a is not None) and (ball_b is not None) and (paddle_a is None):
+            ball_a.bounce_off_ball(ball_b, self._t)
+        elif (ball_a is not None) and (ball_b is None) and (paddle_a is None):
+            # Detecting which side gain the score
+            x, _ = ball_a.pos_at(self._t)
+            if x < 0:
+                player_2.score += 1
+            elif x > 0:
+                player_1.score += 1
+            self._rally_lengths.append(self._rally_hits[ball_a.index])
+            self._rally_hits[ball_a.index] = 0
+            # stop here if a player wins
+            if self.winner is not None:
+                if self._recorder is not None:
+                    self._recorder.record_event(self, current_event)
+                return False
+            ball_a.respawn(self._t)
+            if self._grid is not None:
+                self._grid.place(ball_a, self._t)
+        elif (ball_a is None) and (ball_b is not None) and (paddle_a is None):
+            ball_b.bounce_off_horizontal_wall(self._t)
+        elif (ball_a is not None) and (ball_b is None) and (paddle_a is not None):
+            if ball_a.bounce_off_paddle(paddle_a, self._t):
+                self._rally_hits[ball_a.index] += 1
+
+        # the events already queued for these balls are now stale
+        changed_balls = [a_ball for a_ball in (ball_a, ball_b) if a_ball is not None]
+        for a_ball in changed_balls:
+            self._queue.invalidate(a_ball)
+        if self._recorder is not None:
+            self._recorder.record_event(self, current_event)
+
+        # preedict the next collisions of the objects
+        self.__ball_predict(ball_a)
+        self.__ball_predict(ball_b)
+        # bots pick their moves before the paddle collisions are predicted
+        for a_player in self._player_list:
+            a_player.decide(self._t, self._ball_list)
+        self.__predict_paddle_collisions(changed_balls)
+        return True
+
+    def advance_to(self, t: float):
+        """
+        Process every event up to a time, then move the clock to it. Balls are
+        moved lazily, so nothing else needs updating for them to be drawn at t.
+
+        Args:
+            t (float): Simulation time to advance to
+
+        Returns:
+            bool: False once a player has reached the winning score, True otherwise
+        """
+        # inputs since the last call changed the paddles' course, their collisions
+        # have to be predicted again before looking at the next event, from then on
+        # step() keeps them up to date
+        self.__predict_paddle_collisions([])
+        while True:
+            next_event = self._queue.peek()
+            if next_event is None or next_event.time > t:
+                break
+            if not self.step():
+                return False
+
+        self._t = max(self._t, t)
+        for a_player in self._player_list:
+            a_player.update(self._t)
+        return True
+
+    def __draw(self):
+        """Hand the current state to the renderer."""
+        self._renderer.draw(self)
+
+    def run(self, max_time: float=math.inf):
+        """
+        Process events until a player reaches the winning score, drawing a frame
+        whenever the clock reaches the next one: paced by the scheduler if there is
+        one, at _hz frames per unit of simulation time otherwise, or never if _hz is 0.
+
+        Args:
+            max_time (float, optional): Stop once the clock reaches this simulation time
+                                        (without frames, at the first event past it) even
+                                        if nobody won, ex. for bot-versus-bot matches.
+                                        Defaults to no limit.
+
+        Returns:
+            bool: True if a player won, False if the match was stopped at max_time
+        """
+        if self._scheduler is not None:
+            dt = 0.0
+            while self._t < max_time:
+                if not self.advance_to(min(self._t + dt, max_time)):
+                    return True
+                dt = self._scheduler.frame(self._t, self.__draw)
+        elif self._hz > 0:
+            while self._t < max_time:
+                if not self.advance_to(min(self._t + 1.0/self._hz, max_time)):
+                    return True
+                self.__draw()
+        else:
+            while self._t < max_time:
+                if not self.step():
+                    return True
+        return False
+
+    def reset(self, seed: int=None, recorder: ReplayRecorder=None):
+        """
+        Reset the clock, the event queue, the balls and the scores for a new match.
+
+        Args:
+            seed (int, optional): Seed the random generator again, ex. to replay a match.
+                                  Defaults to None, the generator carries on.
+            recorder (ReplayRecorder, optional): Records the new match. A recorder only
+                                                 records a single match, so the previous
+                                                 one is let go either way. Defaults to
+                                                 None, the new match isn't recorded.
+        """
+        if seed is not None:
+            self._seed = seed
+            self._rng.seed(seed)
+        self._recorder = recorder
+        self._queue.clear()
+        self._t = 0
+        self._rally_hits = [0] * self._num_balls
+        self._rally_lengths.clear()
+        for a_ball in self._ball_list:
+            a_ball.respawn(self._t)
+        for a_player in self._player_list:
+            a_player.score = 0
+            a_player.rebase(self._t)
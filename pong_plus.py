@@ -1,48 +1,69 @@
 """ Module providing the central class for PongPlus game"""
 
-import heapq
+import enum
+import tkinter
 import turtle
 
-# from turtle import Turtle, Screen
-from ball import Ball
-from my_event import Event
-from player import Player
+from canvas_renderer import CanvasRenderer
+from frame_scheduler import FrameScheduler
+from pong_engine import PongEngine
+from renderer import Renderer
 from text import Text
 from button import Button
 
+
+class GameState(enum.Enum):
+    """ The phases of a PongPlus session."""
+    SETUP = enum.auto()
+    PLAYING = enum.auto()
+    WON = enum.auto()
+    REMATCH = enum.auto()
+    CLOSED = enum.auto()
+
+
 class PongPlus:
     """
-    Main game class that handles the Pong game logic and rendering.
-    
+    Main game class that runs PongPlus matches in a turtle window.
+
+    The simulation itself lives in PongEngine, this class connects it to a
+    renderer drawing in the turtle window, the keyboard and the winning screen.
+    A session goes through the states SETUP -> PLAYING -> WON -> REMATCH -> SETUP ...
+    in a single loop, until the window is closed on the winning screen. The engine,
+    the labels and the button are created once and reused by every match.
+
     Attributes:
-        # _num_balls (int): Number of balls in play
-        # _ball_list (list): List of Ball objects
-        # _player_list (list): List of Player objects
-        # _player_names (list): List of player names
-        # _player_colors (list): List of RGB colors for players
-        # _t (float): Current simulation time
-        # _pq (list): Priority queue for event handling
-        # _hz (float): Update frequency
-        # _winning_score (int): Score needed to win
-        # _base_ball_speed (float): Initial ball speed
+        # _renderer (Renderer): Renderer drawing the match in the turtle window
+        # _engine (PongEngine): The simulation of the match
+        # _scheduler (FrameScheduler) <<GET>>: Paces the redraws against the wall clock
+        # _state (GameState) <<GET>>: Current phase of the session
+        # _ui_winning_text (Text): Label of the winning screen
+        # _ui_retry (Button): Rematch button of the winning screen
+        # _rematch (BooleanVar): Set when the winning screen ends, True for a rematch
+        # _cursor (tuple): Latest cursor position on the winning screen, or None
 
     Methods:
-        + play(): Setup and run the game
-        - __create_objects(): Create game objects including balls, players, and UI
-        - __adjust_hz(): Adjust update frequency based on player names length
-        - __ball_predict(ball): Predict future collisions for a ball
-        - __draw_border(): Draw the game border with specified style
-        - __redraw(): Redraw all game objects
-        - __paddle_predict(): Predict collisions between balls and paddles
+        + play(): Run matches until the window is closed
+        - __step(): Run the current state and move to the next one
         - __winning_screen(): Display and handle the winning screen
-        - __playing_loop(): Main game loop handling object interactions
+        - __draw_winning_screen(): Redraw the winning screen
+        - __on_motion(Event): Record the cursor position
+        - __on_tick(): Redraw the winning screen if the button's hover state changed
+        - __on_click(float, float): Ask for a rematch if the button was clicked
+        - __on_destroy(Event): Stop waiting if the window is closed
     """
 
+    # period of the ending screen's redraw timer, in milliseconds
+    UI_TICK_MS = 33
+
     def __init__(self, num_balls: int,
                  player_names: list,
                  player_colors: list,
                  winning_score: int,
-                 ball_speed: float=8):
+                 ball_speed: float=8,
+                 renderer: Renderer=None,
+                 scheduler: FrameScheduler=None,
+                 seed: int=None,
+                 bots: list=None):
         """
         Args:
             num_balls (int): Number of balls in play
@@ -50,337 +71,157 @@ class PongPlus:
             player_colors (list): List of RGB colors for players, ex. [(0,0,255), (0,255,0)]
             winning_score (int): Score needed to win
             ball_speed (float, optional): Initial ball speed. Defaults to 8.
+            renderer (Renderer, optional): Renderer drawing in the turtle window, with
+                                           its border_size and screen. Defaults to a
+                                           CanvasRenderer.
+            scheduler (FrameScheduler, optional): Paces the redraws against the wall clock.
+                                                  Defaults to a FrameScheduler at 60 fps.
+            seed (int, optional): Seed of the balls' spawns, the same seed and the same
+                                  inputs replay the same match. Defaults to None.
+            bots (list, optional): Whether each player is played by a bot, ex. [False, True].
+                                   Defaults to two keyboard players.
         """
-        # Screen setup
-        turtle.colormode(255)
-        turtle.speed(0)
-        turtle.hideturtle()
-        turtle.tracer(0)
-        turtle.delay(0)
-
-        # Initialize other attributes
-        self._num_balls = num_balls
-        self._ball_list = []
-        self._player_list = []
-        self._player_names = player_names
-        self._player_colors = player_colors
-        self._t = 0.0
-        self._pq = []
-        self._hz = 4
-        self._winning_score = winning_score
-        self._base_ball_speed = ball_speed
+        if renderer is None:
+            renderer = CanvasRenderer()
+        if scheduler is None:
+            scheduler = FrameScheduler()
+
+        self._renderer = renderer
+        self._scheduler = scheduler
+        self._engine = PongEngine(num_balls=num_balls,
+                                  player_names=player_names,
+                                  player_colors=player_colors,
+                                  winning_score=winning_score,
+                                  ball_speed=ball_speed,
+                                  border_size=self._renderer.border_size,
+                                  renderer=self._renderer,
+                                  scheduler=self._scheduler,
+                                  seed=seed,
+                                  bots=bots)
+        self._renderer.setup(self._engine)
+        self._state = GameState.SETUP
+
+        # the ui(s) of the winning screen, the text is set to the winner of each match
+        self._ui_winning_text = Text(text=" WON",
+                                     pos=[0, 40],
+                                     char_size=[40, 90],
+                                     color=(0, 0, 0),
+                                     thickness=20,
+                                     spacing=30
+                                     )
+        self._ui_retry = Button(text="REMATCH",
+                                pos=[0, -70],
+                                char_size=[30, 40],
+                                idle_color=(100, 100, 100),
+                                hover_color=(50, 200, 50),
+                                thickness=15,
+                                spacing=20
+                                )
+        self._rematch = tkinter.BooleanVar(master=self._renderer.screen.getcanvas(),
+                                           value=False)
+        self._cursor = None
 
-        # Setup screen dimensions
-        turtle.setup(width=1920, height=1080, startx=0, starty=0)
-        self._border_width = turtle.screensize()[0] + 100
-        self._border_height = turtle.screensize()[1]
-        self._rematch = False
-
-        self.__create_objects()
-
-    def __create_objects(self):
-        """Create game objects including balls, players, and UI elements."""
-        # initialize balls
-        for i in range(self._num_balls):
-            self._ball_list.append(Ball(
-                size_range=[20, 40],
-                uid=i,
-                base_speed=self._base_ball_speed
-                ))
+        # listen to keyboard events and make player moves
+        for a_player in self._engine.player_list:
+            a_player.get_input(self._renderer.screen)
 
-        # initialize player's paddles
-        player1 = Player(
-            uid=1,
-            name=self._player_names[0],
-            color=self._player_colors[0],
-            size=[10, 150],
-            pos=[-420, 0],
-            border_height=self._border_height
-            )
-        player2 = Player(
-            uid=2,
-            name=self._player_names[1],
-            color=self._player_colors[1],
-            size=[10, 150],
-            pos=[420, 0],
-            border_height=self._border_height
-            )
-        self._player_list = [player1, player2]
+    @property
+    def scheduler(self):
+        """Getter for the frame scheduler, exposing the frame statistics"""
+        return self._scheduler
 
-        # initailize player's score ui
-        ui_score1 = Text(
-            text=str(player1.score),
-            pos=[-600, 0],
-            char_size=[30, 70],
-            color=self._player_colors[0],
-            thickness=20,
-            spacing=30
-            )
-        ui_score2 = Text(
-            text=str(player2.score),
-            pos=[600, 0],
-            char_size=[30, 70],
-            color=self._player_colors[1],
-            thickness=20,
-            spacing=30
-            )
-        self.ui_score_list = [ui_score1, ui_score2]
+    @property
+    def state(self):
+        """Getter for the current phase of the session"""
+        return self._state
 
-        # initialize player's name ui
-        ui_name1 = Text(
-            text=player1.name,
-            pos=[-600, -65],
-            char_size=[10, 15],
-            color=self._player_colors[0],
-            thickness=4,
-            spacing=5
-            )
-        ui_name2 = Text(
-            text=player2.name,
-            pos=[600, -65],
-            char_size=[10, 15],
-            color=self._player_colors[1],
-            thickness=4,
-            spacing=5
-            )
-        self.ui_name_list = [ui_name1, ui_name2]
+    def __draw_winning_screen(self):
+        """ Redraw the ending screen."""
+        turtle.clear()
+        self._ui_retry.draw()
+        self._ui_winning_text.draw()
+        turtle.update()
 
-    def __ball_predict(self, a_ball: Ball):
-        """
-        Predict future collisions for a given ball.
+    def __on_motion(self, event):
+        """ Remember where the cursor is, in turtle coordinates."""
+        canvas = self._renderer.screen.getcanvas()
+        self._cursor = (canvas.canvasx(event.x), -canvas.canvasy(event.y))
 
-        Args:
-            a_ball (Ball): Ball object to predict collisions for
-        """
-        if a_ball is None:
+    def __on_tick(self):
+        """ Redraw at a fixed rate, only if the button's hover state changed."""
+        if self._state is not GameState.WON:
             return
+        if self._cursor is not None and self._ui_retry.hover(*self._cursor):
+            self.__draw_winning_screen()
+        self._cursor = None
+        self._renderer.screen.ontimer(self.__on_tick, self.UI_TICK_MS)
 
-        # particle-particle collisions
-        for i in range(len(self._ball_list)):
-            dt = a_ball.time_to_hit_ball(self._ball_list[i])
-            # insert this event into pq
-            heapq.heappush(self._pq, Event(
-                self._t + dt, a_ball, self._ball_list[i], None))
-
-        # particle-wall collisions
-        dt_x = a_ball.time_to_leave_border(self._border_width)
-        dt_y = a_ball.time_to_hit_horizontal_wall(self._border_height)
-        heapq.heappush(self._pq, Event(self._t + dt_x, a_ball, None, None))
-        heapq.heappush(self._pq, Event(self._t + dt_y, None, a_ball, None))
-
-    def __draw_border(self, line_thickness: float,
-                      color_normal: tuple,
-                      color_left: tuple,
-                      color_right: tuple,
-                      n_interval: int):
+    def __on_click(self, x, y):
         """
-        Draw the game border.
-
-        Args:
-            line_thickness (float): Border line thickness
-            color_normal (tuple): RGB color for horizontal borders
-            color_left (tuple): RGB color for left border
-            color_right (tuple): RGB color for right border
-            n_interval (int): Number of dashed line intervals
+        a function for turtle to redirect to when the mouse is clicked.
+        if the cursor overlap with the button when clicked then it ends the ending screen.
         """
-        turtle.penup()
-        turtle.goto(-self._border_width, -self._border_height)
-        turtle.pensize(line_thickness)
-        turtle.setheading(0)
-
-        # write the top/bottom border
-        for color_i in [color_right, color_left]:
-            turtle.pendown()
-            turtle.color(color_normal)
-            turtle.forward(2*self._border_width)
-            turtle.left(90)
-            turtle.color(color_i)
-
-            # write the left/right border with dashed line
-            for i in range(1, n_interval+1):
-                if i % 2 == 1:
-                    turtle.pendown()
-                    turtle.forward(2*self._border_height/n_interval)
-                    turtle.penup()
-                else:
-                    turtle.forward(2*self._border_height/n_interval)
-
-            turtle.left(90)
-        turtle.penup()
-
-    def __redraw(self):
-        """ Redraw everything"""
-        turtle.clear()
-
-        self.__draw_border(line_thickness=10,
-                           color_normal="black",
-                           color_left=self._player_colors[0],
-                           color_right=self._player_colors[1],
-                           n_interval=15)
-
-        # draw players and also their name and score
-        for i in range(len(self._player_list)):
-            self._player_list[i].draw()
-            self.ui_score_list[i].text = str(self._player_list[i].score)
-            self.ui_score_list[i].draw()
-            self.ui_name_list[i].draw()
+        if self._ui_retry.is_hovered(x, y):
+            self._rematch.set(True)
 
-        # draw the balls
-        for a_ball in self._ball_list:
-            a_ball.draw()
-
-        turtle.update()
-        heapq.heappush(self._pq, Event(
-            self._t + 1.0/self._hz, None, None, None))
-
-    def __paddle_predict(self):
-        """
-        predict the collision between the balls and paddles
-        both vertically and horizontally.
-        """
-        for a_player in self._player_list:
-            for a_ball in self._ball_list:
-                dt_px = a_ball.time_to_hit_paddle_vertical(a_player)
-                dt_py = a_ball.time_to_hit_paddle_horizontal(a_player)
-                heapq.heappush(self._pq, Event(
-                    self._t + dt_px, a_ball, None, a_player))
-                heapq.heappush(self._pq, Event(
-                    self._t + dt_py, a_ball, None, a_player))
+    def __on_destroy(self, _event):
+        """ Stop waiting if the window is closed."""
+        self._rematch.set(False)
 
     def __winning_screen(self):
-        """Display and run the ending screen"""
-        # set the display colors and name to the winning player
-        if self._player_list[0].score > self._player_list[1].score:
-            color = self._player_list[0].color
-            name = self._player_list[0].name
-        else:
-            color = self._player_list[1].color
-            name = self._player_list[1].name
-
-        # initialize the ui(s)
-        ui_winning_text = Text(text=str(name+" WON"),
-                               pos=[0, 40],
-                               char_size=[40, 90],
-                               color=color,
-                               thickness=20,
-                               spacing=30
-                               )
-
-        ui_retry = Button(text="REMATCH",
-                          pos=[0, -70],
-                          char_size=[30, 40],
-                          idle_color=(100, 100, 100),
-                          hover_color=(50, 200, 50),
-                          thickness=15,
-                          spacing=20
-                          )
-
-        self._rematch = False
-
-        # reset the values and re-run the game if the "REMATCH" button is pressed
-        def on_click(x, y):
-            """ 
-            a function for turtle to redirect to when the mouse is clicked.
-            if the cursor overlap with the button when clicked then it restarts the game.
-            """
-            if ui_retry.is_hovered(x, y):
-                self._rematch = True
-                self._pq.clear()
-                self._t = 0
-                for a_ball in self._ball_list:
-                    a_ball.respawn()
-                for a_player in self._player_list:
-                    a_player.score = 0
-                self.play()
-
-        # go to the function above if the mouse is clicked
-        turtle.onscreenclick(on_click)
-
-        # keep drawing the ui if the rematch button hasn't been pressed
-        while self._rematch is False:
-            turtle.clear()
-            ui_retry.active()
-            ui_winning_text.draw()
-            turtle.update()
-
-    def __adjust_hz(self):
         """
-        Adjust the HZ based on the amount of character (mostly from player names) 
-        on the screen to account for the lag it will cause.
-        """
-        total_char = 0
-
-        for a_player in self._player_list:
-            total_char += len(a_player.name)
+        Display and run the ending screen until the rematch button is clicked.
 
-        self._hz = 5 + total_char * (-0.1)
+        Nothing runs while the screen is idle: the cursor motion is only recorded,
+        a timer at a fixed rate redraws when the button's hover state changes, and
+        the wait itself happens inside the Tk event loop.
 
-    def __playing_loop(self):
+        Returns:
+            bool: True if the rematch button was clicked, False if the window was closed
         """
-        Main loop of the game, run all the interaction between objects.
-        """
-        while True:
-            current_event = heapq.heappop(self._pq)
-            if not current_event.is_valid():
-                continue
-
-            ball_a = current_event.ball_a
-            ball_b = current_event.ball_b
-            paddle_a = current_event.paddle
-            player_1 = self._player_list[0]
-            player_2 = self._player_list[1]
-            # update positions, and then simulation clock
-            for ball in self._ball_list:
-                ball.move(current_event.time - self._t)
-
-            for a_player in self._player_list:
-                a_player.update_position()
-                a_player.update_angle()
-
-            self._t = current_event.time
-
-            if (ball_a is not None) and (ball_b is not None) and (paddle_a is None):
-                ball_a.bounce_off_ball(ball_b)
-            elif (ball_a is not None) and (ball_b is None) and (paddle_a is None):
-                # Detecting which side gain the score
-                if ball_a.x < 0:
-                    player_2.score += 1
-                elif ball_a.x > 0:
-                    player_1.score += 1
-                # break and go to the winning screen if a player wins
-                if player_1.score >= self._winning_score or player_2.score >= self._winning_score:
-                    break
-                ball_a.respawn()
-            elif (ball_a is None) and (ball_b is not None) and (paddle_a is None):
-                ball_b.bounce_off_horizontal_wall()
-            elif (ball_a is None) and (ball_b is None) and (paddle_a is None):
-                self.__redraw()
-            elif (ball_a is not None) and (ball_b is None) and (paddle_a is not None):
-                ball_a.bounce_off_paddle(paddle_a)
+        self._renderer.clear()
+        screen = self._renderer.screen
+        canvas = screen.getcanvas()
 
-            # preedict the next collisions of the objects
-            self.__ball_predict(ball_a)
-            self.__ball_predict(ball_b)
-            self.__paddle_predict()
+        # set the display colors and name to the winning player
+        winner = self._engine.winner
+        self._ui_winning_text.text = str(winner.name+" WON")
+        self._ui_winning_text.color = winner.color
+        self._cursor = None
+        self.__draw_winning_screen()
+
+        turtle.onscreenclick(self.__on_click)
+        canvas.bind("<Motion>", self.__on_motion)
+        canvas.bind("<Destroy>", self.__on_destroy)
+        screen.ontimer(self.__on_tick, self.UI_TICK_MS)
+
+        # sleep in the Tk event loop until the button is clicked or the window closed
+        canvas.wait_variable(self._rematch)
+        if not self._rematch.get():
+            return False
+
+        self._rematch.set(False)
+        turtle.onscreenclick(None)
+        canvas.unbind("<Motion>")
+        canvas.unbind("<Destroy>")
+        self._renderer.clear()
+        return True
+
+    def __step(self):
+        """ Run the current state of the session and move on to the next one."""
+        if self._state is GameState.SETUP:
+            self._engine.start()
+            self._state = GameState.PLAYING
+        elif self._state is GameState.PLAYING:
+            self._engine.run()
+            self._state = GameState.WON
+        elif self._state is GameState.WON:
+            self._state = GameState.REMATCH if self.__winning_screen() else GameState.CLOSED
+        elif self._state is GameState.REMATCH:
+            self._engine.reset()
+            self._state = GameState.SETUP
 
     def play(self):
-        """ Play PongPlus, setup and run the game"""
-        self.__adjust_hz()
-        # initialize pq with collision events and redraw event
-        for i in range(len(self._ball_list)):
-            self.__ball_predict(self._ball_list[i])
-        heapq.heappush(self._pq, Event(0, None, None, None))
-
-        # listen to keyboard events and make player moves
-        for a_player in self._player_list:
-            a_player.get_input(turtle.Screen())
-
-        # different phase of the game
-        self.__playing_loop()
-        self.__winning_screen()
-        turtle.bye()
-
-        # hold the window; close it by clicking the window close 'x' mark
-        turtle.done()
-
-# num_balls = int(input("Number of balls to simulate: "))
+        """ Play PongPlus, run matches until the window is closed on the winning screen"""
+        while self._state is not GameState.CLOSED:
+            self.__step()
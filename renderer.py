@@ -0,0 +1,60 @@
+""" Module providing the Renderer interface and a no-op renderer for PongPlus"""
+
+
+class Renderer:
+    """
+    Interface between the PongPlus simulation and whatever displays it.
+
+    The simulation (PongEngine) never draws anything itself, it only hands
+    itself to a renderer on every frame, between the events of its queue.
+
+    Methods:
+        + setup(PongEngine): Prepare everything needed to draw a match
+        + draw(PongEngine): Draw the current state of the match
+        + clear(): Remove the match from the display
+        + close(): Release the display
+    """
+
+    def setup(self, engine):
+        """
+        Prepare everything needed to draw a match.
+
+        Args:
+            engine (PongEngine): The simulation that will be drawn
+        """
+        raise NotImplementedError
+
+    def draw(self, engine):
+        """
+        Draw the current state of the match.
+
+        Args:
+            engine (PongEngine): The simulation to draw
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove the match from the display, ex. before the winning screen."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release the display."""
+        raise NotImplementedError
+
+
+class NullRenderer(Renderer):
+    """
+    A renderer that draws nothing, used to run the simulation headlessly.
+    """
+
+    def setup(self, engine):
+        """Nothing to prepare."""
+
+    def draw(self, engine):
+        """Nothing to draw."""
+
+    def clear(self):
+        """Nothing to remove."""
+
+    def close(self):
+        """Nothing to release."""
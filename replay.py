@@ -0,0 +1,481 @@
+""" Module providing ReplayRecorder and ReplayPlayer classes, recording a match to a binary log and seeking through it"""
+
+import math
+import mmap
+import struct
+
+import numpy as np
+
+from ball import Ball
+from ball_system import BallSystem
+from player import Player
+
+MAGIC = b"PPRP"
+INDEX_MAGIC = b"PPRI"
+VERSION = 1
+
+# kinds of the recorded events
+BALL_BALL = 0
+SCORE = 1
+WALL = 2
+PADDLE = 3
+
+# every record starts with its tag and its time
+_EVENT_TAG = b"E"
+_INPUT_TAG = b"I"
+_KEYFRAME_TAG = b"K"
+_RECORD = struct.Struct("<cd")
+
+# magic, version, keyframe interval, balls, border half width and half height, players
+_HEADER = struct.Struct("<4sHIIddB")
+# uid, color, paddle width and height, x position, smoothing rate, length of the name
+_PLAYER_INFO = struct.Struct("<B3BddddH")
+# tag, time, kind, ball a, ball b (-1 if none), paddle uid (0 if none), scores, balls that follow
+_EVENT = struct.Struct("<cdBiiBHHB")
+# index, t0, x0, y0, vx, vy, size of a ball after an event
+_BALL_STATE = struct.Struct("<Idddddd")
+# tag, time, uid, then the easing: start time, start y, start angle, target y, target angle
+_INPUT = struct.Struct("<cdBddddd")
+# tag, time, balls, then a (t0, x0, y0, vx, vy, size) row per ball and a player state per player
+_KEYFRAME = struct.Struct("<cdI")
+# score, then the easing: start time, start y, start angle, target y, target angle
+_PLAYER_STATE = struct.Struct("<Hddddd")
+# offset of the keyframe index, keyframes, time of the last record, magic
+_TRAILER = struct.Struct("<QId4s")
+
+
+class ReplayRecorder:
+    """
+    Records a match into a compact binary log, as the engine processes it.
+
+    The file starts with a header describing the match (balls, border, players),
+    followed by struct-packed records in time order: one per processed event, with
+    the state of the balls it changed and the scores, and one per player input, with
+    the paddle's new easing. Every keyframe_interval events the full state of the
+    balls and players is written as a keyframe. Closing the recorder appends the
+    index of the keyframes (their times and offsets) and a trailer pointing to it.
+
+    A recorder records a single match: pass it to a PongEngine, which calls start()
+    when the match starts and the record methods as it goes, then close it. To record
+    a rematch, hand a new recorder to PongEngine.reset.
+
+    Attributes:
+        # _file (BufferedWriter): The replay file
+        # _keyframe_interval (int) <<GET>>: Events between two keyframes
+        # _since_keyframe (int): Events recorded since the last keyframe
+        # _keyframe_times (list): Time of each keyframe
+        # _keyframe_offsets (list): Offset of each keyframe in the file
+        # _end_time (float): Time of the last record
+        # _n_events (int) <<GET>>: Number of events recorded
+        # _started (bool): Whether the header was written
+
+    Methods:
+        + start(PongEngine): Write the header and the first keyframe
+        + keyframe(PongEngine): Write the full state of the match
+        + record_event(PongEngine, Event): Write a processed event
+        + record_input(PongEngine, Player): Write a player's new easing
+        + close(): Write the keyframe index and close the file
+    """
+
+    def __init__(self, path: str, keyframe_interval: int=256):
+        """
+        Args:
+            path (str): Path of the replay file, overwritten if it exists
+            keyframe_interval (int, optional): Events between two keyframes, seeking
+                                               replays at most this many. Defaults to 256.
+        """
+        self._file = open(path, "wb")
+        self._keyframe_interval = keyframe_interval
+        self._since_keyframe = 0
+        self._keyframe_times = []
+        self._keyframe_offsets = []
+        self._end_time = 0.0
+        self._n_events = 0
+        self._started = False
+
+    @property
+    def keyframe_interval(self):
+        """Getter for the number of events between two keyframes"""
+        return self._keyframe_interval
+
+    @property
+    def n_events(self):
+        """Getter for the number of events recorded"""
+        return self._n_events
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self, engine):
+        """
+        Write the header describing the match, then its first keyframe.
+
+        Args:
+            engine (PongEngine): The match being recorded
+
+        Raises:
+            ValueError: If the recorder already recorded a match
+        """
+        if self._started:
+            raise ValueError("a ReplayRecorder records a single match")
+        self._started = True
+
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self._keyframe_interval,
+                                      len(engine.ball_list), engine.border_width,
+                                      engine.border_height, len(engine.player_list)))
+        for a_player in engine.player_list:
+            name = a_player.name.encode("utf-8")
+            self._file.write(_PLAYER_INFO.pack(a_player.uid, *a_player.color,
+                                               a_player.width, a_player.height,
+                                               a_player.x, a_player.smoothing_rate,
+                                               len(name)))
+            self._file.write(name)
+        self.keyframe(engine)
+
+    def keyframe(self, engine):
+        """
+        Write the full state of the balls and players, seeking starts from these.
+
+        Args:
+            engine (PongEngine): The match being recorded
+        """
+        self._keyframe_times.append(engine.t)
+        self._keyframe_offsets.append(self._file.tell())
+        self._end_time = engine.t
+        self._since_keyframe = 0
+
+        state = engine.ball_system.state()
+        self._file.write(_KEYFRAME.pack(_KEYFRAME_TAG, engine.t, len(state)))
+        self._file.write(state.astype("<f8").tobytes())
+        for a_player in engine.player_list:
+            self._file.write(_PLAYER_STATE.pack(a_player.score, *a_player.motion))
+
+    def record_event(self, engine, event):
+        """
+        Write an event the engine just processed, along with the state of the balls
+        it changed and the scores. Grid cell crossings change nothing and are skipped.
+
+        Args:
+            engine (PongEngine): The match being recorded
+            event (Event): The processed event
+        """
+        if event.cell is not None:
+            return
+        ball_a = event.ball_a
+        ball_b = event.ball_b
+        paddle = event.paddle
+        if ball_a is not None and ball_b is not None:
+            kind, changed_balls = BALL_BALL, (ball_a, ball_b)
+        elif ball_a is not None and paddle is not None:
+            kind, changed_balls = PADDLE, (ball_a,)
+        elif ball_a is not None:
+            kind, changed_balls = SCORE, (ball_a,)
+        else:
+            kind, changed_balls = WALL, (ball_b,)
+
+        player_1, player_2 = engine.player_list
+        self._file.write(_EVENT.pack(_EVENT_TAG, event.time, kind,
+                                     -1 if ball_a is None else ball_a.index,
+                                     -1 if ball_b is None else ball_b.index,
+                                     0 if paddle is None else paddle.uid,
+                                     player_1.score, player_2.score, len(changed_balls)))
+        for a_ball in changed_balls:
+            x0, y0 = a_ball.pos_at(a_ball.t0)
+            self._file.write(_BALL_STATE.pack(a_ball.index, a_ball.t0, x0, y0,
+                                              a_ball.vx, a_ball.vy, a_ball.size))
+        self._end_time = event.time
+        self._n_events += 1
+
+        self._since_keyframe += 1
+        if self._since_keyframe >= self._keyframe_interval:
+            self.keyframe(engine)
+
+    def record_input(self, engine, a_player: Player):
+        """
+        Write the new easing of a player's paddle after an input, stamped with the
+        engine's time: inputs are made at the time of the last event or frame, and
+        the engine notices them before moving on.
+
+        Args:
+            engine (PongEngine): The match being recorded
+            a_player (Player): The player whose paddle changed course
+        """
+        time = max(engine.t, self._end_time)
+        self._file.write(_INPUT.pack(_INPUT_TAG, time, a_player.uid, *a_player.motion))
+        self._end_time = time
+
+    def close(self):
+        """ Write the keyframe index and the trailer pointing to it, then close the file."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(np.asarray(self._keyframe_times, dtype="<f8").tobytes())
+        self._file.write(np.asarray(self._keyframe_offsets, dtype="<u8").tobytes())
+        self._file.write(_TRAILER.pack(index_offset, len(self._keyframe_times),
+                                       self._end_time, INDEX_MAGIC))
+        self._file.close()
+
+
+class ReplayPlayer:
+    """
+    Plays back a replay file written by ReplayRecorder, jumping to any time.
+
+    The file is memory-mapped, nothing is read until it is needed. Seeking
+    binary-searches the keyframe index for the last keyframe before the time, loads
+    it and applies the records after it up to the time, at most keyframe_interval
+    events. Seeking forward within the same keyframe interval carries on from
+    where the last seek stopped. Nothing is simulated: records hold the state
+    after each event, and positions in between follow from the balls' velocities
+    and the paddles' easings.
+
+    It has the ball_list, player_list and t of a PongEngine, so any Renderer can
+    draw it.
+
+    Attributes:
+        # _file (BufferedReader): The replay file
+        # _mm (mmap): The memory-mapped replay file
+        # _keyframe_interval (int) <<GET>>: Events between two keyframes
+        # _border_width (float) <<GET>>: Half of the width of the border
+        # _border_height (float) <<GET>>: Half of the height of the border
+        # _player_list (list) <<GET>>: Players, as they are at the current time
+        # _players_by_uid (dict): Players by their uid
+        # _ball_system (BallSystem): Arrays holding the state of every ball
+        # _ball_list (list) <<GET>>: Balls, as they are at the current time
+        # _keyframe_times (ndarray): Time of each keyframe, mapped from the index
+        # _keyframe_offsets (ndarray): Offset of each keyframe, mapped from the index
+        # _records_end (int): Offset where the records end and the index starts
+        # _duration (float) <<GET>>: Time of the last record
+        # _t (float) <<GET>>: Current time
+        # _offset (int): Offset of the next record to apply
+        # _keyframe (int): Index of the last keyframe applied
+
+    Methods:
+        + seek(float): Move to a time
+        + events(float, float): Recorded events between two times
+        + close(): Unmap and close the file
+        - __read_players(int): Create the players described by the header
+        - __replay(float): Apply the records up to a time
+        - __apply_event(int): Apply an event record
+        - __apply_input(int): Apply an input record
+        - __load_keyframe(int): Apply a keyframe record
+        - __skip(int): Offset of the record after another
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of the replay file
+
+        Raises:
+            ValueError: If the file isn't a complete replay of this version
+        """
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self._mm
+
+        magic, version, self._keyframe_interval, n_balls, self._border_width, \
+            self._border_height, n_players = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a PongPlus replay")
+        if version != VERSION:
+            raise ValueError(f"{path} is a version {version} replay, expected {VERSION}")
+        if len(mm) < _TRAILER.size or mm[-4:] != INDEX_MAGIC:
+            raise ValueError(f"{path} has no keyframe index, its recorder wasn't closed")
+
+        self._player_list = self.__read_players(n_players)
+        self._players_by_uid = {a_player.uid: a_player for a_player in self._player_list}
+        self._ball_system = BallSystem(n_balls)
+        self._ball_list = [Ball(size_range=[20, 40], uid=i, base_speed=0,
+                                system=self._ball_system)
+                           for i in range(n_balls)]
+
+        index_offset, n_keyframes, self._duration, _ = \
+            _TRAILER.unpack_from(mm, len(mm) - _TRAILER.size)
+        self._keyframe_times = np.frombuffer(mm, dtype="<f8", count=n_keyframes,
+                                             offset=index_offset)
+        self._keyframe_offsets = np.frombuffer(mm, dtype="<u8", count=n_keyframes,
+                                               offset=index_offset + 8*n_keyframes)
+        self._records_end = index_offset
+
+        self._t = -math.inf
+        self._offset = 0
+        self._keyframe = -1
+        self.seek(float(self._keyframe_times[0]))
+
+    @property
+    def keyframe_interval(self):
+        """Getter for the number of events between two keyframes"""
+        return self._keyframe_interval
+
+    @property
+    def border_width(self):
+        """Getter for half of the border width"""
+        return self._border_width
+
+    @property
+    def border_height(self):
+        """Getter for half of the border height"""
+        return self._border_height
+
+    @property
+    def player_list(self):
+        """Getter for the list of players"""
+        return self._player_list
+
+    @property
+    def ball_list(self):
+        """Getter for the list of balls"""
+        return self._ball_list
+
+    @property
+    def duration(self):
+        """Getter for the time of the last record"""
+        return self._duration
+
+    @property
+    def t(self):
+        """Getter for the current time"""
+        return self._t
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __read_players(self, n_players: int):
+        """ Create the players described by the header, right after it."""
+        players = []
+        offset = _HEADER.size
+        for _ in range(n_players):
+            uid, red, green, blue, width, height, x, smoothing_rate, name_length = \
+                _PLAYER_INFO.unpack_from(self._mm, offset)
+            offset += _PLAYER_INFO.size
+            name = self._mm[offset:offset + name_length].decode("utf-8")
+            offset += name_length
+            players.append(Player(name=name,
+                                  uid=uid,
+                                  color=(red, green, blue),
+                                  size=[width, height],
+                                  pos=[x, 0],
+                                  border_height=self._border_height,
+                                  smoothing_rate=smoothing_rate))
+        return players
+
+    def seek(self, t: float):
+        """
+        Move the balls, players and scores to where they are at a given time.
+
+        Args:
+            t (float): Time to move to, from 0 to the duration
+
+        Returns:
+            ReplayPlayer: self, ex. to draw it right away
+        """
+        i = max(int(np.searchsorted(self._keyframe_times, t, side="right")) - 1, 0)
+        if i != self._keyframe or t < self._t:
+            self._offset = self.__load_keyframe(int(self._keyframe_offsets[i]))
+            self._keyframe = i
+        self.__replay(t)
+
+        self._t = t
+        for a_player in self._player_list:
+            a_player.update(t)
+        return self
+
+    def events(self, start: float=0.0, end: float=math.inf):
+        """
+        Iterates over the recorded events between two times, without applying them.
+
+        Args:
+            start (float, optional): Time to start from. Defaults to 0.
+            end (float, optional): Time to stop at, included. Defaults to the end.
+
+        Yields:
+            tuple: (time, kind, ball a index, ball b index, paddle uid) of each event,
+                   -1 and 0 standing for no ball and no paddle
+        """
+        i = max(int(np.searchsorted(self._keyframe_times, start, side="right")) - 1, 0)
+        offset = int(self._keyframe_offsets[i])
+        while offset < self._records_end:
+            tag, time = _RECORD.unpack_from(self._mm, offset)
+            if time > end:
+                return
+            if tag == _EVENT_TAG and time >= start:
+                yield _EVENT.unpack_from(self._mm, offset)[1:6]
+            offset = self.__skip(offset)
+
+    def __replay(self, t: float):
+        """ Apply the records from the current offset up to a time."""
+        offset = self._offset
+        while offset < self._records_end:
+            tag, time = _RECORD.unpack_from(self._mm, offset)
+            if time > t:
+                break
+            if tag == _EVENT_TAG:
+                offset = self.__apply_event(offset)
+            elif tag == _INPUT_TAG:
+                offset = self.__apply_input(offset)
+            else:
+                offset = self.__load_keyframe(offset)
+                self._keyframe += 1
+        self._offset = offset
+
+    def __apply_event(self, offset: int):
+        """ Set the balls and scores of an event record, returns the next offset."""
+        *_, score_1, score_2, n_balls = _EVENT.unpack_from(self._mm, offset)
+        offset += _EVENT.size
+        for _ in range(n_balls):
+            index, *state = _BALL_STATE.unpack_from(self._mm, offset)
+            self._ball_list[index].restore(*state)
+            offset += _BALL_STATE.size
+        self._player_list[0].score = score_1
+        self._player_list[1].score = score_2
+        return offset
+
+    def __apply_input(self, offset: int):
+        """ Set the easing of an input record, returns the next offset."""
+        _, _, uid, *motion = _INPUT.unpack_from(self._mm, offset)
+        self._players_by_uid[uid].restore_motion(*motion)
+        return offset + _INPUT.size
+
+    def __load_keyframe(self, offset: int):
+        """ Set the whole state of a keyframe record, returns the next offset."""
+        _, _, n_balls = _KEYFRAME.unpack_from(self._mm, offset)
+        offset += _KEYFRAME.size
+        state = np.frombuffer(self._mm, dtype="<f8", count=6*n_balls, offset=offset)
+        self._ball_system.load_state(state.reshape(n_balls, 6))
+        del state
+        for a_ball in self._ball_list:
+            a_ball.update_color()
+        offset += 48*n_balls
+
+        for a_player in self._player_list:
+            score, *motion = _PLAYER_STATE.unpack_from(self._mm, offset)
+            a_player.score = score
+            a_player.restore_motion(*motion)
+            offset += _PLAYER_STATE.size
+        return offset
+
+    def __skip(self, offset: int):
+        """ Returns the offset of the record following the one at an offset."""
+        tag, _ = _RECORD.unpack_from(self._mm, offset)
+        if tag == _EVENT_TAG:
+            n_balls = _EVENT.unpack_from(self._mm, offset)[-1]
+            return offset + _EVENT.size + n_balls*_BALL_STATE.size
+        if tag == _INPUT_TAG:
+            return offset + _INPUT.size
+        n_balls = _KEYFRAME.unpack_from(self._mm, offset)[-1]
+        return (offset + _KEYFRAME.size + 48*n_balls
+                + len(self._player_list)*_PLAYER_STATE.size)
+
+    def close(self):
+        """ Unmap and close the replay file."""
+        # the index arrays are views on the map, they must go before it
+        self._keyframe_times = None
+        self._keyframe_offsets = None
+        self._mm.close()
+        self._file.close()
@@ -0,0 +1,68 @@
+""" Module providing ScriptedInput class, a random keyboard stand-in for headless matches"""
+
+import random
+
+from player import Player
+
+class ScriptedInput:
+    """
+    Presses a player's controls at random, at a fixed simulation-time interval,
+    so headless matches have paddles that move and tilt like a human's would.
+
+    Attributes:
+        # _player (Player): The player being controlled
+        # _tilt_activity (float): Probability of tilting at each decision, from 0 to 1
+        # _interval (float): Simulation time between two decisions
+        # _rng (Random): Random generator of the decisions
+        # _next_time (float): Simulation time of the next decision
+
+    Methods:
+        + update(float): Make the decisions that are due at a given time
+        + reset(): Start deciding again from time 0
+    """
+
+    def __init__(self, player: Player,
+                 tilt_activity: float,
+                 seed: int=None,
+                 interval: float=2.0):
+        """
+        Args:
+            player (Player): The player to control
+            tilt_activity (float): Probability of tilting at each decision, from 0 to 1
+            seed (int, optional): Seed of the decisions. Defaults to None.
+            interval (float, optional): Simulation time between two decisions. Defaults to 2.
+        """
+        self._player = player
+        self._tilt_activity = tilt_activity
+        self._interval = interval
+        self._rng = random.Random(seed)
+        self._next_time = 0.0
+
+    def update(self, t: float):
+        """
+        Make every decision that is due at time t.
+
+        Args:
+            t (float): Current simulation time
+        """
+        while self._next_time <= t:
+            self._next_time += self._interval
+
+            # wander up and down, most of the time
+            move = self._rng.random()
+            if move < 0.4:
+                self._player._move_up()
+            elif move < 0.8:
+                self._player._move_down()
+
+            if self._rng.random() < self._tilt_activity:
+                if self._rng.random() < 0.5:
+                    self._player._tilt_cw()
+                else:
+                    self._player._tilt_ccw()
+            else:
+                self._player._tilt_reset()
+
+    def reset(self):
+        """Start deciding again from time 0."""
+        self._next_time = 0.0
@@ -0,0 +1,155 @@
+""" Module providing SpatialGrid class, a uniform grid over the border used as a broad phase"""
+
+import math
+
+class SpatialGrid:
+    """
+    A uniform grid of square cells over the border area, keeping track of
+    which cell every ball is in.
+
+    As long as a cell is at least as big as the largest sum of two radii, two balls
+    can only touch if they are in the same or in neighbouring cells, so ball-ball
+    predictions only have to look at the 3x3 block around a ball. The cells on the
+    edge of the grid extend to infinity so balls leaving the border stay in the grid.
+
+    Attributes:
+        # _x_min (float): X position of the left edge of the grid
+        # _y_min (float): Y position of the bottom edge of the grid
+        # _cell_size (float) <<GET>>: Width and height of a cell
+        # _n_cols (int): Number of columns
+        # _n_rows (int): Number of rows
+        # _cells (list): Balls in each cell, one dict per cell used as an ordered set
+        # _ball_cell (dict): Cell (column, row) of each ball
+
+    Methods:
+        + cell_at(float, float): The cell containing a position
+        + cell_of(Ball): The cell a ball is registered in
+        + place(Ball, float): Register a ball in the cell containing its position
+        + move(Ball, tuple): Move a ball to a given cell
+        + neighbours(Ball): Balls in the 3x3 block of cells around a ball
+        + new_neighbours(tuple, tuple): Balls that became neighbours after a cell change
+        + time_to_cross(Ball, float): Predict when a ball leaves its cell and where it goes
+        + clear(): Remove every ball
+    """
+
+    def __init__(self, border_width: float,
+                 border_height: float,
+                 cell_size: float):
+        """
+        Args:
+            border_width (float): Half of the width of the border
+            border_height (float): Half of the height of the border
+            cell_size (float): Width and height of a cell, at least the largest ball diameter
+        """
+        self._x_min = -border_width
+        self._y_min = -border_height
+        self._cell_size = cell_size
+        self._n_cols = max(1, math.ceil(2*border_width / cell_size))
+        self._n_rows = max(1, math.ceil(2*border_height / cell_size))
+        self._cells = [{} for _ in range(self._n_cols * self._n_rows)]
+        self._ball_cell = {}
+
+    @property
+    def cell_size(self):
+        """Getter for the size of a cell"""
+        return self._cell_size
+
+    def cell_at(self, x: float, y: float):
+        """
+        Returns the (column, row) of the cell containing a position,
+        positions outside the grid belong to the closest edge cell.
+        """
+        col = int((x - self._x_min) // self._cell_size)
+        row = int((y - self._y_min) // self._cell_size)
+        col = min(max(col, 0), self._n_cols - 1)
+        row = min(max(row, 0), self._n_rows - 1)
+        return col, row
+
+    def cell_of(self, ball):
+        """ Returns the (column, row) of the cell a ball is registered in."""
+        return self._ball_cell[ball]
+
+    def place(self, ball, t: float):
+        """ Register a ball in the cell containing its position at time t."""
+        self.move(ball, self.cell_at(*ball.pos_at(t)))
+
+    def move(self, ball, cell: tuple):
+        """
+        Move a ball to a given cell.
+
+        Args:
+            ball (Ball): The ball to move
+            cell (tuple): (column, row) of the new cell
+        """
+        old_cell = self._ball_cell.get(ball)
+        if old_cell is not None:
+            del self._cells[old_cell[0]*self._n_rows + old_cell[1]][ball]
+        self._cells[cell[0]*self._n_rows + cell[1]][ball] = None
+        self._ball_cell[ball] = cell
+
+    def __block(self, cell: tuple):
+        """ Returns the cells in the 3x3 block around a cell."""
+        col, row = cell
+        return [(i, j)
+                for i in range(max(col-1, 0), min(col+2, self._n_cols))
+                for j in range(max(row-1, 0), min(row+2, self._n_rows))]
+
+    def neighbours(self, ball):
+        """ Returns the balls (itself included) in the 3x3 block of cells around a ball."""
+        balls = []
+        for col, row in self.__block(self._ball_cell[ball]):
+            balls.extend(self._cells[col*self._n_rows + row])
+        return balls
+
+    def new_neighbours(self, old_cell: tuple, new_cell: tuple):
+        """
+        Returns the balls in the cells around new_cell that were not around old_cell.
+
+        Args:
+            old_cell (tuple): (column, row) the ball came from
+            new_cell (tuple): (column, row) the ball went into
+        """
+        old_block = self.__block(old_cell)
+        balls = []
+        for col, row in self.__block(new_cell):
+            if (col, row) not in old_block:
+                balls.extend(self._cells[col*self._n_rows + row])
+        return balls
+
+    def time_to_cross(self, ball, t: float):
+        """
+        Predict when a ball leaves its cell.
+
+        Args:
+            ball (Ball): The ball to predict for
+            t (float): Simulation time the prediction is made at
+
+        Returns:
+            tuple: (time, (column, row) of the next cell), time is math.inf if it never does
+        """
+        col, row = self._ball_cell[ball]
+        x, y = ball.pos_at(t)
+
+        dt_x = math.inf
+        if ball.vx > 0 and col < self._n_cols - 1:
+            dt_x = (self._x_min + (col+1)*self._cell_size - x) / ball.vx
+        elif ball.vx < 0 and col > 0:
+            dt_x = (self._x_min + col*self._cell_size - x) / ball.vx
+
+        dt_y = math.inf
+        if ball.vy > 0 and row < self._n_rows - 1:
+            dt_y = (self._y_min + (row+1)*self._cell_size - y) / ball.vy
+        elif ball.vy < 0 and row > 0:
+            dt_y = (self._y_min + row*self._cell_size - y) / ball.vy
+
+        if dt_x == math.inf and dt_y == math.inf:
+            return math.inf, (col, row)
+        if dt_x <= dt_y:
+            return max(dt_x, 0), (col + (1 if ball.vx > 0 else -1), row)
+        return max(dt_y, 0), (col, row + (1 if ball.vy > 0 else -1))
+
+    def clear(self):
+        """Remove every ball from the grid."""
+        for cell in self._cells:
+            cell.clear()
+        self._ball_cell.clear()
@@ -0,0 +1,36 @@
+""" Shared setup of the tests: the modules of the game live at the root of the repository"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ball import Ball
+from pong_engine import PongEngine
+
+
+@pytest.fixture
+def make_engine():
+    """ Makes seeded headless matches, between idle players unless told otherwise."""
+    def make(seed, num_balls=10, winning_score=1000, **options):
+        return PongEngine(num_balls=num_balls,
+                          player_names=["P1", "P2"],
+                          player_colors=[(0, 0, 255), (255, 0, 0)],
+                          winning_score=winning_score,
+                          seed=seed,
+                          **options)
+    return make
+
+
+@pytest.fixture
+def make_ball():
+    """ Makes a ball of a given size at a given position and velocity at time 0."""
+    def make(x, y, vx, vy, size=20, system=None):
+        a_ball = Ball(size_range=[size, size], uid=0, base_speed=8, system=system,
+                      rng=random.Random(0))
+        a_ball.restore(0.0, x, y, vx, vy, size)
+        return a_ball
+    return make
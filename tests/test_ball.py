@@ -0,0 +1,25 @@
+""" Tests of the colors a ball picks from its palette"""
+
+import pytest
+
+from ball import MAX_SPEED_FACTOR
+
+
+@pytest.mark.parametrize("size", [20, 30, 40])
+def test_palette_index_is_clamped(make_ball, size):
+    palette = make_ball(0, 0, 0, 0)._palette
+    max_speed = 8 * MAX_SPEED_FACTOR
+    speeds = [0, 1, 4, 8, 16, max_speed, 2*max_speed]
+    levels = [palette.index(make_ball(0, 0, speed, 0, size).color) for speed in speeds]
+    # still balls get the first color, faster ones never a lower one
+    assert levels[0] == 0
+    assert levels == sorted(levels)
+    # past the speed cap, the index stays on the last color
+    assert levels[-1] == len(palette) - 1
+
+
+def test_biggest_ball_at_the_speed_cap_gets_the_last_color(make_ball):
+    a_ball = make_ball(0, 0, 8 * MAX_SPEED_FACTOR, 0, size=40)
+    assert a_ball.color == a_ball._palette[-1]
+    a_ball.restore(0.0, 0, 0, 8, 0, 40)
+    assert a_ball.color != a_ball._palette[-1]
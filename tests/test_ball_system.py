@@ -0,0 +1,114 @@
+""" Tests of the vectorized predictions of BallSystem against the scalar ones of Ball"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from ball import Ball
+from ball_system import BallSystem
+from player import Player
+
+BORDER_WIDTH = 400
+BORDER_HEIGHT = 300
+
+
+def make_balls(states):
+    """ Balls sharing a system, restored to (t0, x0, y0, vx, vy, size) states."""
+    system = BallSystem(len(states))
+    balls = [Ball(size_range=[20, 20], uid=i, base_speed=8, system=system,
+                  rng=random.Random(i)) for i in range(len(states))]
+    for a_ball, state in zip(balls, states):
+        a_ball.restore(*state)
+    return system, balls
+
+
+def random_states(seed, n, x_range=(-380, 380)):
+    """
+    Random states of n balls, some of them still along an axis, some moving
+    alongside the previous one and some touching it, heading in or out.
+    """
+    rng = random.Random(seed)
+    states = []
+    for _ in range(n):
+        t0 = rng.uniform(0, 5)
+        x, y = rng.uniform(*x_range), rng.uniform(-280, 280)
+        vx, vy = rng.uniform(-20, 20), rng.uniform(-20, 20)
+        size = rng.uniform(10, 30)
+        kind = rng.randrange(6)
+        if kind == 0:
+            vx = 0.0
+        elif kind == 1:
+            vy = 0.0
+        elif kind in (2, 3) and states:
+            p_t0, p_x, p_y, p_vx, p_vy, p_size = states[-1]
+            # at t0, the previous ball is at its own reference position moved on
+            p_x += p_vx*(t0 - p_t0)
+            p_y += p_vy*(t0 - p_t0)
+            angle = rng.uniform(0, 2*math.pi)
+            sigma = p_size + size
+            x, y = p_x + sigma*math.cos(angle), p_y + sigma*math.sin(angle)
+            if kind == 2:
+                # parallel
+                vx, vy = p_vx, p_vy
+            else:
+                # touching, heading in or out along the line between them
+                speed = rng.choice((-5.0, 5.0))
+                vx, vy = p_vx + speed*math.cos(angle), p_vy + speed*math.sin(angle)
+        states.append((t0, x, y, vx, vy, size))
+    return states
+
+
+def assert_same_times(vectorized, scalar):
+    vectorized = np.asarray(vectorized)
+    scalar = np.asarray(scalar)
+    assert np.array_equal(np.isinf(vectorized), np.isinf(scalar))
+    finite = np.isfinite(scalar)
+    assert vectorized[finite] == pytest.approx(scalar[finite], rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_time_to_hit_balls_matches_the_scalar_one(seed):
+    system, balls = make_balls(random_states(seed, 40))
+    for t in (5.0, 7.5):
+        for i, a_ball in enumerate(balls):
+            assert_same_times(system.time_to_hit_balls(i, t),
+                              [a_ball.time_to_hit_ball(that, t) for that in balls])
+            indices = np.arange(i % 3, len(balls), 3)
+            assert_same_times(system.time_to_hit_balls(i, t, indices),
+                              [a_ball.time_to_hit_ball(balls[j], t) for j in indices])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_wall_times_match_the_scalar_ones(seed):
+    system, balls = make_balls(random_states(seed, 40))
+    for t in (5.0, 7.5):
+        assert_same_times(system.time_to_hit_horizontal_wall(BORDER_HEIGHT, t),
+                          [a_ball.time_to_hit_horizontal_wall(BORDER_HEIGHT, t)
+                           for a_ball in balls])
+        assert_same_times(system.time_to_leave_border(BORDER_WIDTH, t),
+                          [a_ball.time_to_leave_border(BORDER_WIDTH, t) for a_ball in balls])
+
+
+@pytest.mark.parametrize("seed, moves", [(0, ()), (1, ("_move_up",)), (2, ("_tilt_cw",)),
+                                         (3, ("_move_down", "_tilt_ccw"))])
+def test_time_to_hit_paddle_matches_the_scalar_one(seed, moves):
+    # enough balls within reach of the paddle for the vectorized search to run
+    system, balls = make_balls(random_states(seed, 40, x_range=(-400, -200)))
+    player = Player(name="P1", uid=1, color=(0, 0, 255), size=[10, 150],
+                    pos=[-420, 0], border_height=BORDER_HEIGHT)
+    player.update(5.0)
+    for move in moves:
+        getattr(player, move)()
+
+    t = 5.0
+    horizon = np.minimum(system.time_to_leave_border(BORDER_WIDTH, t),
+                         system.time_to_hit_horizontal_wall(BORDER_HEIGHT, t))
+    for ball_horizon in (None, horizon):
+        scalar = [a_ball.time_to_hit_paddle(player, t, math.inf if ball_horizon is None
+                                            else ball_horizon[i])
+                  for i, a_ball in enumerate(balls)]
+        vectorized = system.time_to_hit_paddle(player, t, ball_horizon)
+        assert_same_times(vectorized, scalar)
+    assert any(math.isfinite(time) for time in scalar)
@@ -0,0 +1,85 @@
+""" Tests of the bot players and of bot-versus-bot matches"""
+
+import random
+
+import pytest
+
+from bot_player import BotPlayer
+
+
+def make_bot(x=-420):
+    """ A bot's paddle of the default size, upright at the middle, in a 400x300 half border."""
+    return BotPlayer(name="P1", uid=1, color=(0, 0, 255), size=[10, 150], pos=[x, 0],
+                     border_height=300, border_width=400, rng=random.Random(0))
+
+
+def crossing(make_ball, x, y, vx, vy, x_contact, size=20, border_height=300):
+    """ When and where a ball crosses x_contact, bouncing off the walls one at a time."""
+    a_ball = make_ball(x, y, vx, vy, size)
+    t_cross = (x_contact - x) / vx
+    t = 0.0
+    while t + a_ball.time_to_hit_horizontal_wall(border_height, t) < t_cross:
+        t += a_ball.time_to_hit_horizontal_wall(border_height, t)
+        a_ball.bounce_off_horizontal_wall(t)
+    return t_cross, a_ball.pos_at(t_cross)[1]
+
+
+@pytest.mark.parametrize("vx, vy", [(-6, 0), (-6, 1.5), (-6, -4), (-3, 17), (-2, -40)])
+def test_intercept_follows_the_ball_off_the_walls(vx, vy, make_ball):
+    bot = make_bot()
+    # the ball touches the paddle's face, a ball's radius away from it
+    x_contact = -420 + 5 + 20
+    time, y = bot.intercept(make_ball(100, 30, vx, vy), 0.0)
+    expected_time, expected_y = crossing(make_ball, 100, 30, vx, vy, x_contact)
+    assert time == pytest.approx(expected_time)
+    assert y == pytest.approx(expected_y, abs=1e-6)
+    assert abs(y) <= 300 - 20
+
+
+def test_intercept_ignores_balls_heading_away_or_past(make_ball):
+    bot = make_bot()
+    assert bot.intercept(make_ball(0, 0, 6, 2), 0.0)[0] is None
+    assert make_bot().intercept(make_ball(0, 0, 0, 5), 0.0)[0] is None
+    assert make_bot().intercept(make_ball(-440, 0, -6, 0), 0.0)[0] is None
+    # the right paddle sees the ball the left one ignored
+    time, y = make_bot(420).intercept(make_ball(0, 0, 6, 2), 0.0)
+    assert time == pytest.approx((420 - 5 - 20) / 6)
+    assert y == pytest.approx(2*time)
+
+
+def test_intercept_is_made_again_after_an_event(make_ball):
+    bot = make_bot()
+    a_ball = make_ball(0, 0, -6, 0)
+    time, y = bot.intercept(a_ball, 0.0)
+    assert y == 0.0
+    # the cached crossing holds until the ball has an event
+    a_ball.restore(10.0, -60, 0, -6, 3, 20)
+    assert bot.intercept(a_ball, 10.0) == (time, y)
+    a_ball.bounce_off_horizontal_wall(10.0)
+    assert bot.intercept(a_ball, 10.0) == pytest.approx((time, -3*(time - 10)))
+
+
+@pytest.mark.parametrize("seed, spatial_index", [(3, True), (3, False), (1, False)])
+def test_bot_match_ends_with_a_winner(seed, spatial_index, make_engine):
+    engine = make_engine(seed, num_balls=2, winning_score=10, spatial_index=spatial_index,
+                         bots=[True, True])
+    engine.start()
+    assert engine.run(max_time=20000)
+    assert engine.winner is not None
+    assert engine.t < 20000
+
+
+def test_run_stops_at_max_time(make_engine):
+    engine = make_engine(3, num_balls=2, bots=[True, True])
+    engine.start()
+    assert not engine.run(max_time=500)
+    assert engine.winner is None
+    assert 500 <= engine.t < 600
+
+
+def test_run_stops_at_max_time_between_frames(make_engine):
+    engine = make_engine(3, num_balls=2, bots=[True, True])
+    engine.hz = 2
+    engine.start()
+    assert not engine.run(max_time=500)
+    assert engine.t == 500
@@ -0,0 +1,154 @@
+""" Tests of the merging, pooling and stacking order of the display list"""
+
+from display_list import DisplayList
+
+
+class FakeCanvas:
+    """ Stands in for a Tk canvas: records the calls and the stacking order of the items."""
+
+    def __init__(self):
+        self.calls = []
+        self.items = {}
+        self.stack = []
+        self.__next_id = 1
+
+    def __create(self, kind, coords, options):
+        item = self.__next_id
+        self.__next_id += 1
+        self.calls.append(("create", kind))
+        self.items[item] = {"kind": kind, "coords": list(coords), **options}
+        self.stack.append(item)
+        return item
+
+    def create_line(self, *coords, **options):
+        return self.__create("line", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self.__create("polygon", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self.__create("oval", coords, options)
+
+    def coords(self, item, *coords):
+        self.calls.append(("coords", item))
+        self.items[item]["coords"] = list(coords)
+
+    def itemconfigure(self, item, **options):
+        self.calls.append(("itemconfigure", item))
+        self.items[item].update(options)
+
+    def tag_raise(self, item):
+        self.calls.append(("tag_raise", item))
+        self.stack.remove(item)
+        self.stack.append(item)
+
+    def delete(self, tag_or_item):
+        self.calls.append(("delete", tag_or_item))
+        doomed = [item for item, options in self.items.items()
+                  if tag_or_item in (item, options.get("tags"))]
+        for item in doomed:
+            del self.items[item]
+            self.stack.remove(item)
+
+    def visible(self):
+        """ (kind, coords) of the shown items, from the bottom of the stack up."""
+        return [(self.items[item]["kind"], self.items[item]["coords"]) for item in self.stack
+                if self.items[item].get("state") != "hidden"]
+
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def test_connected_lines_of_a_style_are_merged():
+    display_list = DisplayList()
+    display_list.polyline([(0, 0), (1, 1)], RED, 2)
+    display_list.polyline([(1, 1), (2, 0)], RED, 2)
+    # another style, or not starting where the last one ended
+    display_list.polyline([(2, 0), (3, 3)], BLUE, 2)
+    display_list.polyline([(5, 5), (6, 6)], BLUE, 2)
+    assert len(display_list) == 3
+
+    canvas = FakeCanvas()
+    display_list.flush(canvas)
+    assert canvas.visible() == [("line", [0, 0, 1, -1, 2, 0]),
+                                ("line", [2, 0, 3, -3]),
+                                ("line", [5, -5, 6, -6])]
+    assert display_list.n_calls == 3
+
+
+def test_items_are_reused_and_only_restyled_when_needed():
+    display_list = DisplayList()
+    canvas = FakeCanvas()
+    display_list.polygon([(0, 0), (1, 0), (1, 1)], RED)
+    display_list.circle(0, 0, 1, BLUE)
+    display_list.flush(canvas)
+    assert display_list.n_calls == 2
+
+    display_list.clear()
+    display_list.polygon([(0, 0), (2, 0), (2, 2)], RED)
+    display_list.circle(5, 5, 1, RED)
+    canvas.calls.clear()
+    display_list.flush(canvas)
+    # both moved, only the circle restyled, nothing created
+    assert [call for call, _ in canvas.calls] == ["coords", "coords", "itemconfigure"]
+    assert display_list.n_calls == 3
+    assert canvas.visible() == [("polygon", [0, 0, 2, 0, 2, -2]), ("oval", [4, -6, 6, -4])]
+
+
+def test_spare_items_are_hidden_once_and_shown_again():
+    display_list = DisplayList()
+    canvas = FakeCanvas()
+    for x in range(3):
+        display_list.circle(x, 0, 1, RED)
+    display_list.flush(canvas)
+
+    display_list.clear()
+    display_list.circle(0, 0, 1, RED)
+    display_list.flush(canvas)
+    assert len(canvas.visible()) == 1
+    assert len(canvas.items) == 3
+    assert display_list.n_calls == 3
+
+    # already hidden: not hidden again
+    display_list.flush(canvas)
+    assert display_list.n_calls == 1
+
+    display_list.clear()
+    for x in range(3):
+        display_list.circle(x, 0, 1, RED)
+    display_list.flush(canvas)
+    assert len(canvas.visible()) == 3
+    assert len(canvas.items) == 3
+
+
+def test_stacking_follows_the_record_order_across_kinds():
+    display_list = DisplayList()
+    canvas = FakeCanvas()
+    display_list.polygon([(0, 0), (4, 0), (4, 4)], RED)
+    display_list.circle(1, 1, 1, BLUE)
+    display_list.polyline([(0, 0), (4, 4)], BLUE, 1)
+    display_list.flush(canvas)
+
+    # the circle now comes first, under the polygon and the line
+    display_list.clear()
+    display_list.circle(1, 1, 1, BLUE)
+    display_list.polygon([(0, 0), (4, 0), (4, 4)], RED)
+    display_list.polyline([(0, 0), (4, 4)], BLUE, 1)
+    display_list.flush(canvas)
+    assert [kind for kind, _ in canvas.visible()] == ["oval", "polygon", "line"]
+    assert len(canvas.items) == 3
+
+
+def test_delete_removes_every_item():
+    display_list = DisplayList("layer")
+    canvas = FakeCanvas()
+    display_list.circle(0, 0, 1, RED)
+    display_list.polyline([(0, 0), (1, 1)], RED, 1)
+    display_list.flush(canvas)
+    display_list.delete(canvas)
+    assert canvas.items == {}
+
+    display_list.flush(canvas)
+    assert len(canvas.items) == 2
+    assert display_list.n_calls == 2
@@ -0,0 +1,111 @@
+""" Tests of the stale tracking and compaction of the event queue"""
+
+import math
+
+import pytest
+
+from event_queue import EventQueue
+from my_event import Event
+
+
+class Owner:
+    """ Stands in for a ball or a paddle: what events read from them."""
+
+    def __init__(self):
+        self.count = 0
+        self.version = 0
+
+
+def test_refuses_events_that_never_happen():
+    queue = EventQueue()
+    assert not queue.push(Event(math.inf, Owner(), None, None))
+    assert queue.size == 0
+    assert queue.peek() is None
+
+
+def test_pops_in_time_order_and_ties_in_push_order():
+    queue = EventQueue()
+    ball = Owner()
+    events = [Event(time, ball, None, None) for time in (3.0, 1.0, 2.0, 1.0)]
+    for event in events:
+        queue.push(event)
+    assert [queue.pop() for _ in events] == [events[1], events[3], events[2], events[0]]
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_invalidate_marks_every_event_of_an_owner_stale():
+    queue = EventQueue()
+    ball, other, paddle = Owner(), Owner(), Owner()
+    first = Event(1.0, ball, other, None)
+    second = Event(2.0, ball, None, paddle)
+    third = Event(3.0, other, None, paddle)
+    for event in (first, second, third):
+        queue.push(event)
+
+    queue.invalidate(ball)
+    assert first.stale and second.stale and not third.stale
+    assert queue.stale == 2
+    assert queue.live == 1
+    assert queue.peek() is third
+    # the stale entries on top were dropped on the way
+    assert queue.stale == 0
+    assert queue.pop() is third
+
+
+def test_skips_events_whose_owner_changed():
+    queue = EventQueue()
+    ball, paddle = Owner(), Owner()
+    queue.push(Event(1.0, ball, None, None))
+    queue.push(Event(2.0, None, None, paddle))
+    ball.count += 1
+    paddle.version += 1
+    later = Event(3.0, ball, None, paddle)
+    queue.push(later)
+    assert queue.pop() is later
+
+
+def test_compacts_once_stale_entries_pass_the_threshold():
+    queue = EventQueue(stale_threshold=0.5, min_compact_size=8)
+    balls = [Owner() for _ in range(16)]
+    events = [Event(float(i), a_ball, None, None) for i, a_ball in enumerate(balls)]
+    for event in events:
+        queue.push(event)
+
+    for a_ball in balls[:8]:
+        queue.invalidate(a_ball)
+    assert queue.n_compactions == 0
+    assert queue.stale_ratio == 0.5
+
+    queue.invalidate(balls[8])
+    assert queue.n_compactions == 1
+    assert queue.size == 7
+    assert queue.stale == 0
+    assert [queue.pop() for _ in range(7)] == events[9:]
+
+
+def test_small_heaps_are_never_compacted():
+    queue = EventQueue(stale_threshold=0.5, min_compact_size=8)
+    balls = [Owner() for _ in range(4)]
+    for i, a_ball in enumerate(balls):
+        queue.push(Event(float(i), a_ball, None, None))
+    for a_ball in balls[:3]:
+        queue.invalidate(a_ball)
+    assert queue.n_compactions == 0
+    assert queue.stale == 3
+    assert queue.pop().time == 3.0
+
+
+def test_compaction_keeps_the_owner_registry():
+    queue = EventQueue(stale_threshold=0.25, min_compact_size=4)
+    balls = [Owner() for _ in range(4)]
+    paddle = Owner()
+    for i, a_ball in enumerate(balls):
+        queue.push(Event(float(i), a_ball, None, paddle))
+    queue.invalidate(balls[0])
+    queue.invalidate(balls[1])
+    assert queue.n_compactions == 1
+    # the events left after the compaction are still found by their owners
+    queue.invalidate(paddle)
+    assert queue.live == 0
+    assert queue.peek() is None
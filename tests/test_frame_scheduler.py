@@ -0,0 +1,84 @@
+""" Tests of the frame pacing, dropped frames and frame rate adaptation, on a fake clock"""
+
+import pytest
+
+from frame_scheduler import FrameScheduler
+
+
+class FakeClock:
+    """ A wall clock that only moves when slept on or told to."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        assert seconds > 0
+        self.now += seconds
+
+
+def make_scheduler(clock, **options):
+    """ A scheduler reading and sleeping on a fake clock."""
+    return FrameScheduler(clock=clock, sleep=clock.sleep, **options)
+
+
+def run_frames(scheduler, clock, sim_t, n, draw_cost=0.0):
+    """ Draw n frames costing draw_cost seconds each, and return the simulation time."""
+    def draw():
+        clock.now += draw_cost
+    for _ in range(n):
+        sim_t += scheduler.frame(sim_t, draw)
+    return sim_t
+
+
+def test_frames_are_paced_against_the_clock():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, target_frame_time=0.1, time_scale=10)
+    scheduler.start(0.0)
+    sim_t = run_frames(scheduler, clock, 0.0, 20)
+    # 10 frames a second, of one simulation unit each, the last one drawn on time
+    assert scheduler.fps == 10
+    assert sim_t == pytest.approx(20.0)
+    assert clock.now == pytest.approx(100.0 + 1.9)
+    assert scheduler.dropped == 0
+
+
+def test_late_frames_are_dropped_and_the_clock_re_anchored():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, target_frame_time=0.1, time_scale=10, min_fps=1)
+    scheduler.start(0.0)
+    sim_t = run_frames(scheduler, clock, 0.0, 1)
+    # the simulation of the next frame stalls 0.45 s past when it was due
+    clock.now += 0.55
+    sim_t = run_frames(scheduler, clock, sim_t, 1)
+    assert scheduler.dropped == 4
+    stalled_at = clock.now
+
+    # the next frames are paced from the late one, without catching up
+    run_frames(scheduler, clock, sim_t, 3)
+    assert scheduler.dropped == 4
+    assert clock.now == pytest.approx(stalled_at + 0.3)
+    assert scheduler.stats()["dropped"] == 4
+
+
+def test_frame_rate_follows_the_cost_of_the_frames():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.start(0.0)
+    assert scheduler.fps == pytest.approx(60)
+
+    # 50 ms frames, with a quarter of headroom
+    sim_t = run_frames(scheduler, clock, 0.0, 30, draw_cost=0.05)
+    assert scheduler.fps == pytest.approx(16)
+    assert scheduler.dropped == 0
+    assert scheduler.stats()["p50_ms"] == pytest.approx(50)
+
+    # never under min_fps, however slow
+    sim_t = run_frames(scheduler, clock, sim_t, 30, draw_cost=0.5)
+    assert scheduler.fps == pytest.approx(10)
+
+    # back up to the target once the frames are cheap again
+    run_frames(scheduler, clock, sim_t, 200)
+    assert scheduler.fps == pytest.approx(60)
@@ -0,0 +1,61 @@
+""" Tests of the statistics and parameter grid of the Monte Carlo runner"""
+
+import math
+import random
+import statistics
+
+import pytest
+
+from monte_carlo import RunningStats, param_grid
+
+
+def test_running_stats_match_direct_statistics():
+    rng = random.Random(1)
+    values = [rng.gauss(50, 20) for _ in range(500)]
+    stats = RunningStats(values)
+    assert stats.n == 500
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.std == pytest.approx(statistics.stdev(values))
+    assert stats.min == min(values)
+    assert stats.max == max(values)
+
+
+@pytest.mark.parametrize("split", [0, 1, 7, 250, 499, 500])
+def test_merge_matches_adding_one_by_one(split):
+    rng = random.Random(split)
+    values = [rng.expovariate(0.1) for _ in range(500)]
+    merged = RunningStats(values[:split])
+    merged.merge(RunningStats(values[split:]))
+    direct = RunningStats(values)
+    assert merged.n == direct.n
+    assert merged.mean == pytest.approx(direct.mean)
+    assert merged.std == pytest.approx(direct.std)
+    assert (merged.min, merged.max) == (direct.min, direct.max)
+
+
+def test_merge_of_many_summaries():
+    rng = random.Random(2)
+    chunks = [[rng.uniform(0, 10) for _ in range(rng.randrange(0, 20))] for _ in range(50)]
+    merged = RunningStats()
+    for chunk in chunks:
+        merged.merge(RunningStats(chunk))
+    values = [value for chunk in chunks for value in chunk]
+    assert merged.n == len(values)
+    assert merged.mean == pytest.approx(statistics.fmean(values))
+    assert merged.std == pytest.approx(statistics.stdev(values))
+
+
+def test_empty_and_single_value_stats():
+    empty = RunningStats()
+    assert math.isnan(empty.mean) and math.isnan(empty.std)
+    assert empty.to_dict() == {"n": 0}
+    single = RunningStats([3.0])
+    assert single.mean == 3.0
+    assert math.isnan(single.std)
+
+
+def test_param_grid_covers_every_combination():
+    points = param_grid({"ball_speed": [6, 8], "num_balls": [2, 10, 50]})
+    assert len(points) == 6
+    assert {"ball_speed": 8, "num_balls": 10} in points
+    assert points[0] == {"ball_speed": 6, "num_balls": 2}
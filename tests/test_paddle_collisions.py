@@ -0,0 +1,116 @@
+""" Tests of the swept ball-paddle collisions, against moving and tilting paddles"""
+
+import math
+
+import pytest
+
+from ball import MAX_SPEED_FACTOR
+from ball_system import BallSystem, CONTACT_TOLERANCE
+from player import Player
+from scripted_input import ScriptedInput
+
+
+def make_player():
+    """ The left player's paddle, upright at the middle, its clock at 0."""
+    return Player(name="P1", uid=1, color=(0, 0, 255), size=[10, 150],
+                  pos=[-420, 0], border_height=300)
+
+
+def depth_inside(a_ball, a_paddle, t):
+    """ How deep a ball is inside a paddle at its current pose, negative if apart."""
+    x, y = a_ball.pos_at(t)
+    angle = math.radians(a_paddle.angle_deg)
+    dx = x - a_paddle.x
+    dy = y - a_paddle.y
+    qx = abs(math.cos(angle)*dx + math.sin(angle)*dy) - a_paddle.width/2
+    qy = abs(math.cos(angle)*dy - math.sin(angle)*dx) - a_paddle.height/2
+    distance = math.hypot(max(qx, 0.0), max(qy, 0.0)) + min(max(qx, qy), 0.0)
+    return a_ball.size - distance
+
+
+def test_hit_static_paddle(make_ball):
+    player = make_player()
+    a_ball = make_ball(0.0, 10.0, -8.0, 0.0)
+    # the ball's edge reaches the paddle's right side
+    expected = (420 - 5 - 20) / 8
+    assert a_ball.time_to_hit_paddle(player, 0.0) == pytest.approx(expected, abs=1e-3)
+
+
+def test_hit_paddle_moving_into_still_ball(make_ball):
+    player = make_player()
+    # a still ball right above the paddle's top end
+    a_ball = make_ball(-420.0, 150.0, 0.0, 0.0)
+    player._move_up()
+    # the top end, at y + 75, eases towards 120 + 75 and reaches the ball's bottom at 130
+    expected = -math.log(1 - 55/120) / player.smoothing_rate
+    assert a_ball.time_to_hit_paddle(player, 0.0) == pytest.approx(expected, abs=1e-3)
+
+
+def test_tilt_into_resting_ball(make_ball):
+    system = BallSystem(1)
+    player = make_player()
+    # a ball resting against the upper half of the paddle's right side
+    a_ball = make_ball(-420 + 5 + 20, 50.0, 0.0, 0.0, system=system)
+    # tilting clockwise swings the upper half of the paddle into the ball
+    player._tilt_cw()
+
+    dt = a_ball.time_to_hit_paddle(player, 0.0)
+    assert dt < 1.0
+    assert system.time_to_hit_paddle(player, 0.0)[0] == pytest.approx(dt)
+
+    player.update(dt)
+    assert depth_inside(a_ball, player, dt) <= 2*CONTACT_TOLERANCE
+    assert a_ball.bounce_off_paddle(player, dt)
+    # knocked away from the paddle, which doesn't catch up with it
+    assert a_ball.vx > 0
+    for t in [dt + 0.05*i for i in range(1, 40)]:
+        player.update(t)
+        assert depth_inside(a_ball, player, t) <= 2*CONTACT_TOLERANCE
+
+
+def test_overlapping_ball_is_hit_right_away(make_ball):
+    system = BallSystem(1)
+    player = make_player()
+    a_ball = make_ball(-420 + 5 + 10, 0.0, 1.0, 0.0, system=system)
+    assert a_ball.time_to_hit_paddle(player, 0.0) == 0.0
+    assert system.time_to_hit_paddle(player, 0.0)[0] == 0.0
+
+    a_ball.bounce_off_paddle(player, 0.0)
+    assert depth_inside(a_ball, player, 0.0) == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed, bots", [(5, True), (1, False), (2, False)])
+def test_balls_stay_out_of_paddles(seed, bots, make_engine):
+    engine = make_engine(seed, bots=[bots, bots])
+    drivers = [] if bots else [ScriptedInput(a_player, 0.5, seed=seed + a_player.uid)
+                               for a_player in engine.player_list]
+    engine.start()
+    for _ in range(1500):
+        for a_driver in drivers:
+            a_driver.update(engine.t)
+        assert engine.step()
+        for a_ball in engine.ball_list:
+            for a_player in engine.player_list:
+                assert depth_inside(a_ball, a_player, engine.t) < 1.0
+
+
+def test_paddle_leaves_room_for_a_ball_at_the_walls():
+    player = Player(name="P1", uid=1, color=(0, 0, 255), size=[10, 150],
+                    pos=[-420, 0], border_height=300, clearance=80)
+    for t, move in enumerate([player._move_up]*5 + [player._tilt_cw] + [player._move_down]*10):
+        player.update(float(t))
+        move()
+    for t in range(16, 30):
+        player.update(float(t))
+        assert max(abs(y) for _, y in player.corners()) <= 300 - 80
+    # all the way down
+    assert player.y == pytest.approx(-(300 - math.hypot(5, 75) - 80))
+
+
+def test_paddle_hit_speed_is_capped(make_ball):
+    player = make_player()
+    a_ball = make_ball(0.0, 10.0, -100.0, 0.0)
+    dt = a_ball.time_to_hit_paddle(player, 0.0)
+    assert a_ball.bounce_off_paddle(player, dt)
+    assert math.hypot(a_ball.vx, a_ball.vy) == pytest.approx(8 * MAX_SPEED_FACTOR)
+    assert a_ball.vx > 0
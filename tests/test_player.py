@@ -0,0 +1,100 @@
+""" Tests of the closed-form easing of the paddles, and of what changes their version"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from player import Player
+
+
+def make_player():
+    """ The left player's paddle, upright at the middle, its clock at 0."""
+    return Player(name="P1", uid=1, color=(0, 0, 255), size=[10, 150],
+                  pos=[-420, 0], border_height=300)
+
+
+def test_pose_does_not_depend_on_the_updates_in_between():
+    still = make_player()
+    busy = make_player()
+    for a_player in (still, busy):
+        a_player._move_up()
+        a_player._tilt_cw()
+
+    rng = random.Random(0)
+    times = sorted(rng.uniform(0, 6) for _ in range(300))
+    for i, t in enumerate(times):
+        # the busy paddle follows every event, and starts its easing over now and then
+        busy.update(t)
+        if i % 7 == 0:
+            busy.rebase(t)
+        assert busy.y == pytest.approx(still.y_at(t), abs=1e-9)
+        assert busy.angle_deg == pytest.approx(still.angle_at(t), abs=1e-9)
+
+    # both at rest on the target
+    still.update(times[-1])
+    assert (busy.y, busy.angle_deg) == (still.y, still.angle_deg) == (120, -40)
+
+
+def test_snap_agrees_between_pose_and_motion():
+    a_player = make_player()
+    a_player._move_down()
+    a_player._tilt_ccw()
+    # the paddle snaps to its target around t = 3.1 (y) and 2.8 (angle)
+    times = np.linspace(0, 5, 2001)
+    motions = a_player.motion_at(times)
+    for i, t in enumerate(times.tolist()):
+        y, angle, vy, omega = a_player.motion_at(t)
+        assert (y, angle, vy, omega) == pytest.approx([motion[i] for motion in motions])
+        assert y == a_player.y_at(t)
+        assert angle == pytest.approx(math.radians(a_player.angle_at(t)))
+        # at rest exactly when the pose is snapped onto the target
+        assert (vy == 0) == (a_player.y_at(t) == -120)
+        assert (omega == 0) == (a_player.angle_at(t) == 40)
+    _, _, vy, omega = motions
+    assert vy[0] != 0 and vy[-1] == 0
+    assert omega[0] != 0 and omega[-1] == 0
+
+
+def test_only_an_input_changes_the_version(make_engine, monkeypatch):
+    engine = make_engine(2)
+    pushed = []
+    push = engine.queue.push
+
+    def record_push(event):
+        accepted = push(event)
+        if accepted:
+            pushed.append(event)
+        return accepted
+    monkeypatch.setattr(engine.queue, "push", record_push)
+
+    player_1, player_2 = engine.player_list
+    engine.start()
+    player_1._move_up()
+    player_2._tilt_cw()
+    assert engine.advance_to(1.0)
+    versions = (player_1.version, player_2.version)
+    pose = (player_1.y, player_2.angle_deg)
+    # following the easing over many events
+    assert engine.advance_to(30.0)
+    assert (player_1.y, player_2.angle_deg) != pose
+    assert (player_1.version, player_2.version) == versions
+
+    def queued(a_player):
+        return [event for event in pushed if event.paddle is a_player
+                and not event.stale and event.time >= engine.t]
+    # on to a time both paddles have collisions predicted
+    while not (queued(player_1) and queued(player_2)):
+        assert engine.step()
+    assert (player_1.version, player_2.version) == versions
+    before_1, before_2 = queued(player_1), queued(player_2)
+    counts = [a_ball.count for a_ball in engine.ball_list]
+
+    player_1._move_down()
+    assert engine.step()
+    assert (player_1.version, player_2.version) == (versions[0] + 1, versions[1])
+    assert all(event.stale for event in before_1)
+    # the other paddle keeps its predictions, but for the balls of the event
+    assert all(not event.stale for event in before_2
+               if event.ball_a.count == counts[event.ball_a.index])
@@ -0,0 +1,89 @@
+""" Tests of the replay recorder and player: seeking must give back the live match"""
+
+import random
+
+import pytest
+
+from replay import ReplayPlayer, ReplayRecorder
+from scripted_input import ScriptedInput
+
+
+def snapshot(balls, players, t):
+    """ Positions and velocities of the balls, then poses and scores of the players at t."""
+    state = []
+    for a_ball in balls:
+        state.extend((*a_ball.pos_at(t), a_ball.vx, a_ball.vy, a_ball.size))
+    for a_player in players:
+        state.extend((a_player.y, a_player.angle_deg, a_player.score))
+    return state
+
+
+def record_match(make_engine, path, seed, sample_times, num_balls=10):
+    """
+    Play a seeded match with scripted players into a replay file, and return the
+    live state of the match at each of the sample times, in order.
+    """
+    states = []
+    with ReplayRecorder(path, keyframe_interval=16) as recorder:
+        engine = make_engine(seed, num_balls=num_balls, recorder=recorder)
+        drivers = [ScriptedInput(a_player, 0.5, seed=seed + a_player.uid, interval=1.5)
+                   for a_player in engine.player_list]
+        engine.start()
+        for t in sample_times:
+            for a_driver in drivers:
+                a_driver.update(engine.t)
+            assert engine.advance_to(t)
+            states.append(snapshot(engine.ball_list, engine.player_list, t))
+    return states
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_seek_matches_live_match(tmp_path, seed, make_engine):
+    rng = random.Random(seed)
+    sample_times = sorted(rng.uniform(0, 150) for _ in range(100))
+    path = str(tmp_path / "match.pprp")
+    states = record_match(make_engine, path, seed, sample_times)
+
+    order = list(range(len(sample_times)))
+    rng.shuffle(order)
+    with ReplayPlayer(path) as replay:
+        for i in order:
+            replay.seek(sample_times[i])
+            state = snapshot(replay.ball_list, replay.player_list, sample_times[i])
+            assert state == pytest.approx(states[i], abs=1e-6)
+
+
+def test_scrubbing_forward_matches_seeking(tmp_path, make_engine):
+    sample_times = [0.5*i for i in range(1, 200)]
+    path = str(tmp_path / "match.pprp")
+    states = record_match(make_engine, path, 4, sample_times, num_balls=4)
+
+    with ReplayPlayer(path) as replay:
+        assert replay.t == 0.0
+        for t, live_state in zip(sample_times, states):
+            replay.seek(t)
+            state = snapshot(replay.ball_list, replay.player_list, t)
+            assert state == pytest.approx(live_state, abs=1e-6)
+
+
+def test_rematch_is_recorded_with_a_new_recorder(tmp_path, make_engine):
+    with ReplayRecorder(str(tmp_path / "first.pprp")) as recorder:
+        engine = make_engine(5, recorder=recorder)
+        engine.start()
+        assert engine.advance_to(50)
+
+    path = str(tmp_path / "second.pprp")
+    with ReplayRecorder(path) as recorder:
+        engine.reset(seed=6, recorder=recorder)
+        engine.start()
+        assert engine.advance_to(50)
+        live_state = snapshot(engine.ball_list, engine.player_list, 50)
+
+    with ReplayPlayer(path) as replay:
+        replay.seek(50)
+        assert snapshot(replay.ball_list, replay.player_list, 50) == pytest.approx(live_state)
+
+    # the closed recorder was let go, the next match isn't recorded
+    engine.reset()
+    engine.start()
+    assert engine.advance_to(50)
@@ -0,0 +1,54 @@
+""" Tests that a Text is only laid out again after a change"""
+
+import pytest
+
+from char import Char
+from text import Text
+
+
+@pytest.fixture
+def n_layouts(monkeypatch):
+    """ Counts the layouts of texts, by the character lines they compile."""
+    counter = {"chars": 0}
+    polyline = Char.polyline
+
+    def count_polyline(char, letter):
+        counter["chars"] += 1
+        return polyline(char, letter)
+    monkeypatch.setattr(Char, "polyline", count_polyline)
+    return counter
+
+
+def make_text():
+    """ A red two-digit text at the origin."""
+    return Text("12", pos=[0, 0], char_size=[10, 20], color=(255, 0, 0), thickness=2,
+                spacing=5)
+
+
+def test_unchanged_text_is_not_laid_out_again(n_layouts):
+    text = make_text()
+    strokes = text.strokes()
+    assert n_layouts["chars"] == 2
+
+    # setting what it already is changes nothing
+    text.text = "12"
+    text.pos = (0, 0)
+    text.color = (255, 0, 0)
+    assert text.strokes() is strokes
+    assert n_layouts["chars"] == 2
+
+
+@pytest.mark.parametrize("attribute, value", [("text", "123"), ("pos", (0, 50)),
+                                              ("color", (0, 0, 255))])
+def test_changed_text_is_laid_out_once(n_layouts, attribute, value):
+    text = make_text()
+    strokes = text.strokes()
+    setattr(text, attribute, value)
+    assert n_layouts["chars"] == 2
+
+    new_strokes = text.strokes()
+    assert new_strokes is not strokes
+    text.strokes()
+    assert n_layouts["chars"] == 2 + len(text.text)
+    if attribute == "pos":
+        assert new_strokes[0][0][1] == strokes[0][0][1] + 50
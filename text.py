@@ -1,6 +1,6 @@
 """ Module providing Text class for displaying muliple alphanumeric characters"""
 
-import copy
+import turtle
 from char import Char
 
 class Text:
@@ -10,6 +10,10 @@ class Text:
     This class manages multiple Char objects to display text strings, handling
     positioning, spacing, and updates of the characters.
 
+    The layout is only rebuilt when the text, position or style changed since the
+    last one (the text is "dirty"). It then also compiles the lines drawing the whole
+    string, which an unchanged text draws again straight away.
+
     Attributes:
         # _text (str) <<GET, SET>>: The text string to display (converted to uppercase)
         # _spacing (float): Space between characters
@@ -17,16 +21,19 @@ class Text:
         # _y (float): Y position of text center
         # _char_width (float): Width of each character
         # _char_height (float): Height of each character
-        # _thickness (int): Line thickness for drawing
-        # _color (tuple): RGB color of the text
+        # _thickness (int) <<GET>>: Line thickness for drawing
+        # _color (tuple) <<GET, SET>>: RGB color of the text
         # _char_list (list): List of Char objects making up the text
+        # _strokes (list): Compiled lines drawing the text, one per character with a line
+        # _dirty (bool): Whether the layout needs to be rebuilt
 
     Methods:
-        + draw(): Main drawing method that updates and draws the complete text string
-        - __update_char_style(): Initialize or update the character list with base style
+        + pos (list) <<GET, SET>>: [x, y] position of the text center
+        + draw(Turtle): Draw the complete text string
+        + strokes(): Lines (list of points) drawing the complete text string
+        # _update_layout(): Rebuild the characters and lines if the text is dirty
         - __update_number_of_char(): Adjust number of Char objects to match text length
         - __update_char_positions(): Update positions of all characters for proper spacing
-        - __draw_the_text(): Draw each character in the text string
     """
 
     def __init__(self, text: str,
@@ -55,7 +62,9 @@ class Text:
         self._char_height = char_size[1]
         self._thickness = thickness
         self._color = color
-        self.__update_char_style()
+        self._char_list = []
+        self._strokes = []
+        self._dirty = True
 
     @property
     def text(self):
@@ -65,33 +74,54 @@ class Text:
     @text.setter
     def text(self, text):
         """ Setter for text"""
-        self._text = text
+        text = text.upper()
+        if text != self._text:
+            self._text = text
+            self._dirty = True
 
-    def __update_char_style(self):
-        """
-        Initialize or update the character list with base character style.
-        Creates first character with current style settings.
-        """
-        self._char_list = [Char(pos=[self._x, self._y],
-                                size=[self._char_width, self._char_height],
-                                color=self._color,
-                                thickness=self._thickness)]
+    @property
+    def pos(self):
+        """ Getter for the position of the text center"""
+        return self._x, self._y
+
+    @pos.setter
+    def pos(self, pos):
+        """ Setter for the position of the text center"""
+        if (pos[0], pos[1]) != (self._x, self._y):
+            self._x = pos[0]
+            self._y = pos[1]
+            self._dirty = True
+
+    @property
+    def color(self):
+        """ Getter for color"""
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        """ Setter for color"""
+        if color != self._color:
+            self._color = color
+            self._dirty = True
+
+    @property
+    def thickness(self):
+        """ Getter for line thickness"""
+        return self._thickness
 
     def __update_number_of_char(self):
         """
-        Adjust the number of Char objects to match the length of the text.
-        Adds or removes characters as needed by copying the style of the first character.
+        Adjust the number of Char objects to match the length of the text,
+        creating the missing ones and restyling the ones kept.
         """
-        diff = len(self._char_list) - len(self._text)
-        if diff < 0:
-            # Add more characters if needed
-            for _ in range(-diff):
-                more_char = copy.deepcopy(self._char_list[0])
-                self._char_list.append(more_char)
-        elif diff > 0:
-            # Remove excess characters if needed
-            for _ in range(diff):
-                self._char_list.pop()
+        del self._char_list[len(self._text):]
+        for char in self._char_list:
+            char.color = self._color
+        for _ in range(len(self._text) - len(self._char_list)):
+            self._char_list.append(Char(pos=[self._x, self._y],
+                                        size=[self._char_width, self._char_height],
+                                        color=self._color,
+                                        thickness=self._thickness))
 
     def __update_char_positions(self):
         """
@@ -108,19 +138,49 @@ class Text:
         for i, char in enumerate(self._char_list):
             char.pos = [starting_x + (center_diff * i), self._y]
 
-    def __draw_the_text(self):
+    def _update_layout(self):
         """
-        Draw each character in the text string using the corresponding Char object.
+        Rebuild the characters and compile the lines of the text, only if the
+        text, position or style changed since the last time.
         """
+        if not self._dirty:
+            return
+        self.__update_number_of_char()
+        self.__update_char_positions()
+        self._strokes = []
         for i, char in enumerate(self._char_list):
-            char.draw(self._text[i])
+            line = char.polyline(self._text[i])
+            if line:
+                self._strokes.append(line)
+        self._dirty = False
 
-    def draw(self):
+    def draw(self, pen=turtle):
         """
-        Main drawing method that updates and draws the complete text string.
-        Handles character creation, positioning, and drawing in sequence.
+        Draw the complete text string with turtle, one pen-down stroke per character.
+
+        Args:
+            pen (Turtle, optional): Turtle to draw with. Defaults to the default turtle.
         """
-        self.__update_char_style()
-        self.__update_number_of_char()
-        self.__update_char_positions()
-        self.__draw_the_text()
+        self._update_layout()
+        pen.penup()
+        pen.color(self._color)
+        pen.pensize(self._thickness)
+        # turtle has no call drawing a whole line at once, the renderers drawing
+        # on the canvas take strokes() instead, one line item per stroke
+        for line in self._strokes:
+            pen.goto(line[0])
+            pen.pendown()
+            for point in line[1:]:
+                pen.goto(point)
+            pen.penup()
+
+    def strokes(self):
+        """
+        Returns the lines drawing the text, for renderers that draw whole lines at
+        once instead of moving the turtle point by point.
+
+        Returns:
+            list: One list of (x, y) points per character that has a line
+        """
+        self._update_layout()
+        return self._strokes
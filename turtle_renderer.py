@@ -0,0 +1,297 @@
+""" Module providing a turtle based renderer for PongPlus"""
+
+import math
+import turtle
+
+from renderer import Renderer
+from text import Text
+
+
+def setup_screen():
+    """
+    Setup the turtle screen for drawing whole frames at once, shared by the renderers
+    drawing in the turtle window.
+
+    Returns:
+        tuple: (half width, half height) of the border
+    """
+    turtle.colormode(255)
+    turtle.speed(0)
+    turtle.hideturtle()
+    turtle.tracer(0)
+    turtle.delay(0)
+
+    # Setup screen dimensions
+    turtle.setup(width=1920, height=1080, startx=0, starty=0)
+    return turtle.screensize()[0] + 100, turtle.screensize()[1]
+
+
+def player_labels(player_list: list):
+    """
+    Create the score and name labels of both players.
+
+    Args:
+        player_list (list): The two players of the match
+
+    Returns:
+        tuple: (score labels, name labels), the Text objects of each player in order
+    """
+    player1, player2 = player_list
+
+    # initailize player's score ui
+    ui_score1 = Text(
+        text=str(player1.score),
+        pos=[-600, 0],
+        char_size=[30, 70],
+        color=player1.color,
+        thickness=20,
+        spacing=30
+        )
+    ui_score2 = Text(
+        text=str(player2.score),
+        pos=[600, 0],
+        char_size=[30, 70],
+        color=player2.color,
+        thickness=20,
+        spacing=30
+        )
+
+    # initialize player's name ui
+    ui_name1 = Text(
+        text=player1.name,
+        pos=[-600, -65],
+        char_size=[10, 15],
+        color=player1.color,
+        thickness=4,
+        spacing=5
+        )
+    ui_name2 = Text(
+        text=player2.name,
+        pos=[600, -65],
+        char_size=[10, 15],
+        color=player2.color,
+        thickness=4,
+        spacing=5
+        )
+    return [ui_score1, ui_score2], [ui_name1, ui_name2]
+
+
+class TurtleRenderer(Renderer):
+    """
+    Draws a PongPlus match with turtle graphics in two layers.
+
+    The static layer (the border and the player names) is drawn once per match by
+    its own turtle. The dynamic layer (the paddles, balls and scores) is drawn by
+    the default turtle, which is cleared and redrawn on every frame, so the cost of
+    a frame only depends on the objects that move.
+
+    Attributes:
+        # _border_width (float): Half of the width of the border
+        # _border_height (float): Half of the height of the border
+        # _ui_score_list (list): List of Text objects showing the scores
+        # _ui_name_list (list): List of Text objects showing the player names
+        # _static_pen (Turtle): Turtle drawing the static layer
+        # _static_drawn (bool): Whether the static layer of the match is drawn
+        # _ball_shapes (set): Radiuses whose circle shape is registered
+
+    Methods:
+        + border_size (list) <<GET>>: [half width, half height] of the border
+        + screen (Screen) <<GET>>: The turtle screen, used for input bindings
+        + setup(PongEngine): Create the score and name labels
+        + draw(PongEngine): Redraw the dynamic layer, and the static one if needed
+        + clear(): Erase both layers
+        + close(): Close the turtle window
+        - __draw_static(PongEngine): Draw the border and the names
+        - __draw_border(Turtle, float, tuple, tuple, tuple, int): Draw the game border
+        - __draw_paddle(Paddle): Draw a paddle
+        - __ball_shape(float): Circle shape of a ball size
+        - __draw_ball(Ball, float): Draw a ball
+    """
+
+    def __init__(self):
+        """Setup the turtle screen."""
+        self._border_width, self._border_height = setup_screen()
+        self._ui_score_list = []
+        self._ui_name_list = []
+        self._static_pen = turtle.Turtle(visible=False)
+        self._static_pen.speed(0)
+        self._static_drawn = False
+        self._ball_shapes = set()
+
+    @property
+    def border_size(self):
+        """Getter for [half width, half height] of the border"""
+        return [self._border_width, self._border_height]
+
+    @property
+    def screen(self):
+        """Getter for the turtle screen"""
+        return turtle.Screen()
+
+    def setup(self, engine):
+        """
+        Create the score and name labels of both players.
+
+        Args:
+            engine (PongEngine): The simulation that will be drawn
+        """
+        self._ui_score_list, self._ui_name_list = player_labels(engine.player_list)
+
+    def __draw_border(self, pen,
+                      line_thickness: float,
+                      color_normal: tuple,
+                      color_left: tuple,
+                      color_right: tuple,
+                      n_interval: int):
+        """
+        Draw the game border.
+
+        Args:
+            pen (Turtle): Turtle to draw with
+            line_thickness (float): Border line thickness
+            color_normal (tuple): RGB color for horizontal borders
+            color_left (tuple): RGB color for left border
+            color_right (tuple): RGB color for right border
+            n_interval (int): Number of dashed line intervals
+        """
+        pen.penup()
+        pen.goto(-self._border_width, -self._border_height)
+        pen.pensize(line_thickness)
+        pen.setheading(0)
+
+        # write the top/bottom border
+        for color_i in [color_right, color_left]:
+            pen.pendown()
+            pen.color(color_normal)
+            pen.forward(2*self._border_width)
+            pen.left(90)
+            pen.color(color_i)
+
+            # write the left/right border with dashed line
+            for i in range(1, n_interval+1):
+                if i % 2 == 1:
+                    pen.pendown()
+                    pen.forward(2*self._border_height/n_interval)
+                    pen.penup()
+                else:
+                    pen.forward(2*self._border_height/n_interval)
+
+            pen.left(90)
+        pen.penup()
+
+    def __draw_static(self, engine):
+        """
+        Draw the static layer of a match: the border and the player names.
+
+        Args:
+            engine (PongEngine): The simulation to draw
+        """
+        player_list = engine.player_list
+        self.__draw_border(self._static_pen,
+                           line_thickness=10,
+                           color_normal="black",
+                           color_left=player_list[0].color,
+                           color_right=player_list[1].color,
+                           n_interval=15)
+        for ui_name in self._ui_name_list:
+            ui_name.draw(self._static_pen)
+        self._static_drawn = True
+
+    def __draw_paddle(self, paddle):
+        """
+        Draw a paddle as a filled rectangle centered at its position
+        with its current rotation angle.
+
+        Args:
+            paddle (Paddle): The paddle to draw
+        """
+        turtle.color(paddle.color)
+        turtle.pensize(paddle.thickness)
+        turtle.goto(paddle.x, paddle.y)
+        turtle.setheading(paddle.angle_deg)
+
+        # Move to starting position
+        turtle.forward(paddle.width/2)
+        turtle.pendown()
+        turtle.begin_fill()
+
+        # Draw rectangle
+        turtle.left(90)
+        for _ in range(2):
+            turtle.forward(paddle.height/2)
+            turtle.left(90)
+            turtle.forward(paddle.width)
+            turtle.left(90)
+            turtle.forward(paddle.height/2)
+
+        turtle.end_fill()
+        turtle.penup()
+        turtle.goto(paddle.x, paddle.y)
+
+    def __ball_shape(self, size: float):
+        """
+        Returns the name of the circle shape of a ball size, registering it with the
+        screen the first time that size is seen.
+
+        Args:
+            size (float): Radius of the ball
+
+        Returns:
+            str: Name of the shape
+        """
+        radius = round(size)
+        name = f"ball{radius}"
+        if radius not in self._ball_shapes:
+            n_points = 36
+            turtle.register_shape(name, tuple(
+                (radius*math.cos(2*math.pi*i/n_points), radius*math.sin(2*math.pi*i/n_points))
+                for i in range(n_points)))
+            self._ball_shapes.add(radius)
+        return name
+
+    def __draw_ball(self, ball, t: float):
+        """
+        Draw a ball at its position and current color by stamping its circle shape.
+
+        Args:
+            ball (Ball): The ball to draw
+            t (float): Simulation time to draw the ball at
+        """
+        turtle.penup()
+        turtle.shape(self.__ball_shape(ball.size))
+        turtle.color(ball.color)
+        turtle.goto(ball.pos_at(t))
+        turtle.stamp()
+
+    def draw(self, engine):
+        """
+        Redraw everything.
+
+        Args:
+            engine (PongEngine): The simulation to draw
+        """
+        turtle.clear()
+        if not self._static_drawn:
+            self.__draw_static(engine)
+
+        # draw players and their score
+        for i, a_player in enumerate(engine.player_list):
+            self.__draw_paddle(a_player)
+            self._ui_score_list[i].text = str(a_player.score)
+            self._ui_score_list[i].draw()
+
+        # draw the balls
+        for a_ball in engine.ball_list:
+            self.__draw_ball(a_ball, engine.t)
+
+        turtle.update()
+
+    def clear(self):
+        """Erase both layers, the static one is drawn again on the next frame."""
+        turtle.clear()
+        self._static_pen.clear()
+        self._static_drawn = False
+
+    def close(self):
+        """Close the turtle window."""
+        turtle.bye()